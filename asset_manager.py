@@ -0,0 +1,162 @@
+"""
+Gerenciador de assets com carregamento assíncrono
+Lê e decodifica imagens e sons em threads de trabalho; só a conversão que depende da
+tela (convert/convert_alpha) acontece na thread principal, aos poucos, a cada frame
+"""
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+from game_logging import get_logger
+
+logger = get_logger("assets")
+
+
+class AssetManager:
+    """Carrega assets em segundo plano, sem repetir arquivos já pedidos"""
+
+    def __init__(self, max_workers=4):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="assets")
+        self._pending = {}  # chave -> Future com o asset decodificado (ainda não convertido)
+        self._assets = {}  # chave -> asset pronto para uso
+        self._convert = {}  # chave -> função de conversão na thread principal
+
+        # Cada arquivo é decodificado uma única vez, mesmo pedido em vários tamanhos
+        self._decoded = {}
+        self._decode_locks = {}
+        self._decode_lock = threading.Lock()
+
+        self.requested = 0
+        self.loaded = 0
+
+    # ---- Pedidos (thread principal) ----
+
+    def load_image(self, path, size=None, alpha=True):
+        """Pede uma imagem (opcionalmente redimensionada); retorna a chave do asset"""
+        key = ("image", path, tuple(size) if size else None, alpha)
+        if key not in self._pending and key not in self._assets:
+            self._submit(key, self._decode_image, path, key[2])
+            self._convert[key] = self._convert_alpha if alpha else self._convert_opaque
+        return key
+
+    def load_sound(self, path):
+        """Pede um som (o mixer precisa estar inicializado); retorna a chave do asset"""
+        key = ("sound", path)
+        if key not in self._pending and key not in self._assets:
+            self._submit(key, self._decode_sound, path)
+        return key
+
+    def _submit(self, key, function, *args):
+        self._pending[key] = self._executor.submit(function, *args)
+        self.requested += 1
+
+    # ---- Trabalho nas threads ----
+
+    def _read_image(self, path):
+        """Decodifica o arquivo (uma vez por caminho) para uma superfície sem conversão"""
+        with self._decode_lock:
+            lock = self._decode_locks.setdefault(path, threading.Lock())
+        with lock:
+            if path not in self._decoded:
+                self._decoded[path] = pygame.image.load(path) if os.path.exists(path) else None
+            return self._decoded[path]
+
+    def _decode_image(self, path, size):
+        surface = self._read_image(path)
+        if surface is not None and size is not None:
+            surface = pygame.transform.scale(surface, size)
+        return surface
+
+    def _decode_sound(self, path):
+        if not os.path.exists(path):
+            return None
+        return pygame.mixer.Sound(path)
+
+    # ---- Finalização (thread principal) ----
+
+    @staticmethod
+    def _convert_alpha(surface):
+        return surface.convert_alpha()
+
+    @staticmethod
+    def _convert_opaque(surface):
+        return surface.convert()
+
+    def pump(self, budget=0.008):
+        """Converte os assets já decodificados, até gastar 'budget' segundos neste frame"""
+        started = time.perf_counter()
+        for key in [k for k, future in self._pending.items() if future.done()]:
+            future = self._pending.pop(key)
+            try:
+                asset = future.result()
+                convert = self._convert.pop(key, None)
+                if asset is not None and convert is not None:
+                    asset = convert(asset)
+            except Exception as e:
+                logger.error("❌ Erro ao carregar %s: %s", key[1], e)
+                asset = None
+            self._assets[key] = asset
+            self.loaded += 1
+            if budget is not None and time.perf_counter() - started >= budget:
+                break
+        return self.done
+
+    def wait(self):
+        """Bloqueia até todos os assets pedidos estarem prontos"""
+        while not self.pump(budget=None):
+            time.sleep(0.001)
+
+    @property
+    def done(self):
+        return not self._pending
+
+    @property
+    def progress(self):
+        """Fração dos assets pedidos que já estão prontos (0.0 a 1.0)"""
+        return self.loaded / self.requested if self.requested else 1.0
+
+    def get(self, key):
+        """Asset pronto para a chave (None se ainda não carregou ou não existe)"""
+        return self._assets.get(key)
+
+    def get_image(self, path, size=None, alpha=True):
+        return self.get(("image", path, tuple(size) if size else None, alpha))
+
+    def get_sound(self, path):
+        return self.get(("sound", path))
+
+    def release_decoded(self):
+        """Libera as superfícies decodificadas intermediárias (depois do carregamento)"""
+        self._decoded.clear()
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
+
+
+class DerivedImageCache:
+    """Variantes de imagens (redimensionadas, escurecidas...) calculadas uma única vez por chave
+
+    A chave deve incluir tudo de que a variante depende (ex.: resolução da tela);
+    clear() descarta tudo quando as imagens de origem são recarregadas
+    """
+
+    def __init__(self):
+        self._images = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, build):
+        """Retorna a variante da chave, chamando build() só na primeira vez"""
+        if key in self._images:
+            self.hits += 1
+            return self._images[key]
+        self.misses += 1
+        image = self._images[key] = build()
+        return image
+
+    def clear(self):
+        self._images.clear()
+
+    def __len__(self):
+        return len(self._images)
@@ -0,0 +1,104 @@
+"""
+Fundos e texturas pré-calculados
+Gradientes e texturas que produzem sempre os mesmos pixels são gerados uma única vez
+com NumPy (pygame.surfarray) e guardados por tamanho e paleta; desenhar vira um blit
+"""
+import random
+from functools import lru_cache
+import numpy as np
+import pygame
+
+
+def _row_ratios(height, smooth=False):
+    """Proporção de cada linha (0.0 no topo); smoothstep opcional para suavizar"""
+    ratio = np.arange(height, dtype=np.float64) / height
+    if smooth:
+        ratio = ratio * ratio * (3.0 - 2.0 * ratio)
+    return ratio
+
+
+def _finish(surface):
+    """Converte para o formato da tela quando há display (blit mais rápido)"""
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if surface.get_flags() & pygame.SRCALPHA else surface.convert()
+
+
+@lru_cache(maxsize=32)
+def vertical_gradient(size, top, bottom, smooth=False):
+    """Superfície opaca com gradiente vertical de 'top' até 'bottom'"""
+    width, height = size
+    ratio = _row_ratios(height, smooth)[:, None]
+    rows = (np.array(top) * (1 - ratio) + np.array(bottom) * ratio).astype(np.uint8)  # (altura, 3)
+
+    # surfarray usa (x, y, canal)
+    pixels = np.broadcast_to(rows[None, :, :], (width, height, 3))
+    return _finish(pygame.surfarray.make_surface(np.ascontiguousarray(pixels)))
+
+
+@lru_cache(maxsize=32)
+def glass_panel(size, color, alpha=150, border_color=None, border_width=2):
+    """Painel translúcido de 'vidro fosco': alpha cai até 2/3 na base, borda opcional"""
+    width, height = size
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    if width == 0 or height == 0:
+        return surface
+
+    rgb = pygame.surfarray.pixels3d(surface)
+    rgb[:] = color
+    del rgb
+
+    rows = np.arange(height)
+    alphas = (alpha - (rows * alpha // height // 3)).astype(np.uint8)
+    pixels_alpha = pygame.surfarray.pixels_alpha(surface)
+    pixels_alpha[:] = alphas[None, :]
+    del pixels_alpha
+
+    if border_color is not None:
+        pygame.draw.rect(surface, border_color, surface.get_rect(), border_width)
+    return _finish(surface)
+
+
+@lru_cache(maxsize=8)
+def speckle_texture(size, color, seed=42, count=30, alpha_range=(8, 20), radius_range=(1, 2)):
+    """Textura de pontinhos translúcidos em posições fixas (mesma semente = mesmos pixels)"""
+    width, height = size
+    rng = random.Random(seed)  # Gerador próprio: não mexe no random global
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+
+    for _ in range(count):
+        x = rng.randint(0, width)
+        y = rng.randint(0, height)
+        alpha = rng.randint(*alpha_range)
+        radius = rng.randint(*radius_range)
+
+        dot = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(dot, (*color, alpha), (radius, radius), radius)
+        surface.blit(dot, (x - radius, y - radius))
+    return _finish(surface)
+
+
+@lru_cache(maxsize=8)
+def grid_overlay(size, color, spacing=100, line_width=1):
+    """Grade translúcida com linhas a cada 'spacing' pixels"""
+    width, height = size
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    for x in range(0, width, spacing):
+        pygame.draw.line(surface, color, (x, 0), (x, height), line_width)
+    for y in range(0, height, spacing):
+        pygame.draw.line(surface, color, (0, y), (width, y), line_width)
+    return _finish(surface)
+
+
+@lru_cache(maxsize=8)
+def ring_stamp(radius, color, width=2):
+    """Anel opaco; quem desenha define a transparência com set_alpha antes do blit"""
+    surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(surface, (*color, 255), (radius, radius), radius, width)
+    return _finish(surface)
+
+
+def clear_cache():
+    """Descarta as superfícies guardadas (ex.: depois de trocar o modo de vídeo)"""
+    for builder in (vertical_gradient, glass_panel, speckle_texture, grid_overlay, ring_stamp):
+        builder.cache_clear()
@@ -0,0 +1,260 @@
+"""
+Bots para testes de carga e de longa duração (soak)
+Jogadores automáticos controlam o Game headless só pela API pública de movimento
+(handle_node_click e move_player_direction) com estratégias plugáveis. Vários bots
+rodam em processos separados por quanto tempo for pedido; cada um mede sessões por
+segundo, exceções, violações de estado (ex.: combate preso) e o crescimento da memória
+
+    python bots.py --bots 8 --minutes 120 --strategies optimal greedy random avoid keys chaos
+"""
+import os
+import random
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from headless import follow_optimal_path, random_walk
+from pathfinding import dijkstra
+
+GAME_STATES = {"menu", "playing", "level_complete", "game_over", "game_final", "player_dead"}
+DIRECTIONS = ("up", "down", "left", "right")
+
+
+# ---- Estratégias: recebem o jogo e devolvem um nó, uma direção (str) ou None ----
+
+def greedy_by_weight(game):
+    """Vai para o vizinho com a aresta mais leve, preferindo nós ainda não visitados"""
+    world = game.world
+    current = game.player.current_node
+    visited = set(game.player.path_taken)
+    neighbors = sorted(world.graph.neighbors(current),
+                       key=lambda node: (node in visited, world.graph[current][node].get("weight", 1)))
+    if world.end_node in neighbors:
+        return world.end_node
+    return neighbors[0] if neighbors else None
+
+
+def avoid_enemies(game):
+    """Menor caminho até o fim sem passar por inimigos (se não houver, segue o ótimo)"""
+    world = game.world
+    current = game.player.current_node
+    safe = world.graph.subgraph(n for n in world.graph.nodes() if n not in world.enemies or n == current)
+    if world.end_node in safe:
+        path, _ = dijkstra(safe, current, world.end_node)
+        if len(path) > 1:
+            return path[1]
+    return follow_optimal_path(game)
+
+
+def random_keys(rng):
+    """Aperta teclas de direção (WASD) ao acaso"""
+    def choose(game):
+        return rng.choice(DIRECTIONS)
+    return choose
+
+
+def make_strategy(name, rng):
+    """Estratégia pelo nome: optimal, greedy, random, avoid, keys ou chaos"""
+    if name == "optimal":
+        return follow_optimal_path
+    if name == "greedy":
+        return greedy_by_weight
+    if name == "random":
+        return random_walk(rng)
+    if name == "avoid":
+        return avoid_enemies
+    if name == "keys":
+        return random_keys(rng)
+    if name == "chaos":
+        walk, keys = random_walk(rng), random_keys(rng)
+        return lambda game: walk(game) if rng.random() < 0.5 else keys(game)
+    raise ValueError(f"Estratégia desconhecida: {name}")
+
+
+STRATEGIES = ("optimal", "greedy", "random", "avoid", "keys", "chaos")
+
+
+# ---- Bot ----
+
+def check_invariants(game):
+    """Lista de problemas no estado do jogo (vazia se estiver tudo certo)"""
+    problems = []
+    player = game.player
+    if game.game_state not in GAME_STATES:
+        problems.append(f"estado desconhecido: {game.game_state!r}")
+    if not 0 <= player.health <= player.max_health:
+        problems.append(f"vida fora do intervalo: {player.health}/{player.max_health}")
+    if game.world is not None and player.current_node not in game.world.graph:
+        problems.append(f"jogador em nó inexistente: {player.current_node}")
+    if game.is_in_combat():
+        if game.game_state != "playing":
+            problems.append(f"combate ativo fora do jogo (estado {game.game_state})")
+        if game.combat_node is None:
+            problems.append("combate ativo sem nó de combate")
+        if game.is_moving:
+            problems.append("movendo durante combate")
+    return problems
+
+
+def memory_usage_kb():
+    """Memória residente do processo (KB); pico via resource quando não há /proc"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, AttributeError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _play_session(game, level_id, choose, rng, chaos, max_steps, report):
+    """Joga um nível; com 'chaos' também manda entradas durante movimentos e combates"""
+    game.player.update_level_stars(level_id - 1, 3)  # Libera o nível
+    game.player.reset_lives()
+    game.start_level(level_id)
+    steps = 0
+    while game.game_state == "playing" and steps < max_steps:
+        busy = game.is_moving or game.is_in_combat()
+        if not busy or rng.random() < chaos:
+            choice = choose(game)
+            if choice is None:
+                break
+            if isinstance(choice, str):
+                game.move_player_direction(choice)
+            else:
+                game.handle_node_click(choice, bypass_confirmation=True)
+            report["inputs"] += 1
+        game.step()
+        steps += 1
+
+        problems = check_invariants(game)
+        if problems:
+            report["violations"] += 1
+            if len(report["violation_samples"]) < 10:
+                report["violation_samples"].append({"level_id": level_id, "seed": game.level_seed,
+                                                    "tick": game.clock.tick_count, "problems": problems})
+            break
+    report["steps"] += steps
+    report["states"][game.game_state] = report["states"].get(game.game_state, 0) + 1
+
+
+def run_bot(strategy="random", seed=0, duration=60.0, max_sessions=None, chaos=0.0, max_session_seconds=120.0,
+            memory_every=50):
+    """Roda um bot por 'duration' segundos (ou 'max_sessions'); retorna o relatório"""
+    from main import Game
+
+    rng = random.Random(seed)
+    choose = make_strategy(strategy, rng)
+    game = Game(headless=True, seed=seed)
+    max_steps = game.clock.seconds_to_steps(max_session_seconds)
+    report = {
+        "strategy": strategy, "seed": seed, "pid": os.getpid(),
+        "sessions": 0, "steps": 0, "inputs": 0, "crashes": 0, "violations": 0,
+        "states": {}, "crash_samples": [], "violation_samples": [], "memory": [],
+    }
+
+    started = time.perf_counter()
+    while time.perf_counter() - started < duration:
+        if max_sessions is not None and report["sessions"] >= max_sessions:
+            break
+        level_id = report["sessions"] % 20 + 1
+        try:
+            _play_session(game, level_id, choose, rng, chaos, max_steps, report)
+        except Exception as e:
+            report["crashes"] += 1
+            if len(report["crash_samples"]) < 10:
+                frame = traceback.extract_tb(e.__traceback__)[-1]
+                report["crash_samples"].append({
+                    "level_id": level_id, "seed": game.level_seed, "error": f"{type(e).__name__}: {e}",
+                    "where": f"{os.path.basename(frame.filename)}:{frame.lineno} ({frame.name})",
+                })
+            game = Game(headless=True, seed=rng.getrandbits(32))  # Recomeça com um jogo novo
+        report["sessions"] += 1
+        if report["sessions"] % memory_every == 0:
+            report["memory"].append((report["sessions"], memory_usage_kb(), sys.getallocatedblocks()))
+
+    report["elapsed"] = time.perf_counter() - started
+    return report
+
+
+def memory_growth(samples, warmup=0.2):
+    """Crescimento após o aquecimento: (KB por 1000 sessões, blocos por 1000 sessões)"""
+    samples = samples[int(len(samples) * warmup):]
+    if len(samples) < 3:
+        return 0.0, 0.0
+    sessions, rss, blocks = (np.array(column, dtype=float) for column in zip(*samples))
+    rss_slope = np.polyfit(sessions, rss, 1)[0]
+    blocks_slope = np.polyfit(sessions, blocks, 1)[0]
+    return float(rss_slope * 1000), float(blocks_slope * 1000)
+
+
+def summarize(reports):
+    """Junta os relatórios dos bots: vazão, crashes, violações e memória"""
+    sessions = sum(r["sessions"] for r in reports)
+    elapsed = max((r["elapsed"] for r in reports), default=0.0)
+    summary = {
+        "bots": len(reports),
+        "sessions": sessions,
+        "steps": sum(r["steps"] for r in reports),
+        "crashes": sum(r["crashes"] for r in reports),
+        "violations": sum(r["violations"] for r in reports),
+        "sessions_per_second": sessions / elapsed if elapsed > 0 else 0.0,
+        "per_bot": [],
+    }
+    for r in reports:
+        rss_growth, blocks_growth = memory_growth(r["memory"])
+        summary["per_bot"].append({
+            "strategy": r["strategy"], "seed": r["seed"], "sessions": r["sessions"],
+            "sessions_per_second": r["sessions"] / r["elapsed"] if r["elapsed"] > 0 else 0.0,
+            "crashes": r["crashes"], "violations": r["violations"], "states": r["states"],
+            "rss_kb": r["memory"][-1][1] if r["memory"] else None,
+            "rss_growth_kb_per_1000": rss_growth, "blocks_growth_per_1000": blocks_growth,
+            "crash_samples": r["crash_samples"], "violation_samples": r["violation_samples"],
+        })
+    return summary
+
+
+def run_soak(bots=4, duration=60.0, strategies=STRATEGIES, seed=0, chaos=0.1, max_sessions=None, workers=None):
+    """Roda 'bots' bots em processos headless separados e retorna o resumo"""
+    jobs = [(strategies[i % len(strategies)], seed + i) for i in range(bots)]
+    with ProcessPoolExecutor(max_workers=workers or bots) as pool:
+        futures = [pool.submit(run_bot, strategy, bot_seed, duration, max_sessions,
+                               chaos if strategy in ("random", "keys", "chaos") else 0.0)
+                   for strategy, bot_seed in jobs]
+        return summarize([future.result() for future in futures])
+
+
+def print_report(summary):
+    print(f"🤖 {summary['bots']} bots | {summary['sessions']} sessões | "
+          f"{summary['sessions_per_second']:.1f} sessões/s | crashes: {summary['crashes']} | "
+          f"violações: {summary['violations']}")
+    for bot in summary["per_bot"]:
+        print(f"   {bot['strategy']:<8} seed {bot['seed']:<4} {bot['sessions']:>7} sessões "
+              f"{bot['sessions_per_second']:7.1f}/s  RSS {bot['rss_kb'] or 0:>8} KB "
+              f"(+{bot['rss_growth_kb_per_1000']:.1f} KB/1000)  estados: {bot['states']}")
+        for sample in bot["crash_samples"] + bot["violation_samples"]:
+            print(f"      ⚠️ {sample}")
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+    import logging
+    from game_logging import setup_logging
+
+    parser = argparse.ArgumentParser(description="Bots headless para testes de carga e soak")
+    parser.add_argument("--bots", type=int, default=os.cpu_count() or 4)
+    parser.add_argument("--minutes", type=float, default=1.0)
+    parser.add_argument("--strategies", nargs="+", default=list(STRATEGIES), choices=STRATEGIES)
+    parser.add_argument("--chaos", type=float, default=0.1,
+                        help="Chance de mandar entradas durante movimentos/combates (bots aleatórios)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", default=None, metavar="ARQUIVO", help="Grava o relatório completo em JSON")
+    args = parser.parse_args()
+
+    setup_logging(logging.ERROR, console=False)
+    summary = run_soak(args.bots, args.minutes * 60, tuple(args.strategies), args.seed, args.chaos)
+    print_report(summary)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
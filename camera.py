@@ -0,0 +1,108 @@
+"""
+Câmera do mapa do nível
+Converte coordenadas do mundo (posições do GraphLayout) em coordenadas da tela e vice-versa,
+com pan, zoom em torno do cursor e acompanhamento suave do jogador. O centro fica preso
+aos limites do mapa: um nível que cabe inteiro na tela aparece centralizado, como antes;
+nos mapas grandes só o trecho visível (view_rect) é desenhado e testado para cliques
+"""
+from collections.abc import Mapping
+
+
+class Camera:
+    """Transformação mundo → tela: tela = (mundo - centro) * zoom + meio da tela"""
+
+    MAX_ZOOM = 2.5
+    ZOOM_STEP = 1.15  # Fator por clique da roda do mouse
+    FOLLOW_RATE = 6.0  # Fração da distância até o jogador percorrida por segundo (suavização)
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.center = (width / 2, height / 2)
+        self.zoom = 1.0
+        self.min_zoom = 1.0
+        self.bounds = None  # (left, top, right, bottom) do mapa no mundo
+        self.following = True  # Segue o jogador até o usuário arrastar a câmera
+
+    def reset(self, bounds):
+        """Novo mapa: zoom 1, seguindo o jogador e centralizada nos limites"""
+        left, top, right, bottom = bounds
+        self.bounds = bounds
+        fit = min(self.width / max(right - left, 1), self.height / max(bottom - top, 1))
+        self.min_zoom = min(1.0, fit)  # Afastar só até o mapa inteiro caber na tela
+        self.zoom = 1.0
+        self.following = True
+        self.center = ((left + right) / 2, (top + bottom) / 2)
+        self._clamp()
+
+    def _clamp(self):
+        if self.bounds is None:
+            return
+        left, top, right, bottom = self.bounds
+        half_w = self.width / 2 / self.zoom
+        half_h = self.height / 2 / self.zoom
+        x, y = self.center
+        x = (left + right) / 2 if right - left <= 2 * half_w else min(max(x, left + half_w), right - half_w)
+        y = (top + bottom) / 2 if bottom - top <= 2 * half_h else min(max(y, top + half_h), bottom - half_h)
+        self.center = (x, y)
+
+    # ---- Conversões ----
+
+    def to_screen(self, pos):
+        return ((pos[0] - self.center[0]) * self.zoom + self.width / 2,
+                (pos[1] - self.center[1]) * self.zoom + self.height / 2)
+
+    def to_world(self, pos):
+        return ((pos[0] - self.width / 2) / self.zoom + self.center[0],
+                (pos[1] - self.height / 2) / self.zoom + self.center[1])
+
+    def view_rect(self, margin=0):
+        """Retângulo do mundo visível na tela, com 'margin' pixels de folga"""
+        half_w = (self.width / 2 + margin) / self.zoom
+        half_h = (self.height / 2 + margin) / self.zoom
+        x, y = self.center
+        return (x - half_w, y - half_h, x + half_w, y + half_h)
+
+    # ---- Controles ----
+
+    def pan(self, dx, dy):
+        """Arrasta o mapa dx, dy pixels na tela (desliga o acompanhamento)"""
+        self.following = False
+        self.center = (self.center[0] - dx / self.zoom, self.center[1] - dy / self.zoom)
+        self._clamp()
+
+    def zoom_at(self, factor, screen_pos):
+        """Multiplica o zoom mantendo parado o ponto do mundo sob screen_pos"""
+        anchor = self.to_world(screen_pos)
+        self.zoom = min(max(self.zoom * factor, self.min_zoom), self.MAX_ZOOM)
+        self.center = (anchor[0] - (screen_pos[0] - self.width / 2) / self.zoom,
+                       anchor[1] - (screen_pos[1] - self.height / 2) / self.zoom)
+        self._clamp()
+
+    def follow(self, target, dt):
+        """Aproxima o centro de target (posição do jogador no mundo) se estiver seguindo"""
+        if not self.following:
+            return
+        blend = min(1.0, max(0.0, dt) * self.FOLLOW_RATE)
+        self.center = (self.center[0] + (target[0] - self.center[0]) * blend,
+                       self.center[1] + (target[1] - self.center[1]) * blend)
+        self._clamp()
+
+
+class ScreenPositions(Mapping):
+    """{nó: posição na tela} calculada pela câmera a cada consulta (nada a refazer quando ela move)"""
+
+    __slots__ = ("world", "camera")
+
+    def __init__(self, world, camera):
+        self.world = world  # {nó: posição no mundo}
+        self.camera = camera
+
+    def __getitem__(self, node):
+        return self.camera.to_screen(self.world[node])
+
+    def __iter__(self):
+        return iter(self.world)
+
+    def __len__(self):
+        return len(self.world)
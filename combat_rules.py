@@ -0,0 +1,39 @@
+"""
+Regras de combate e de tempo do jogo
+Funções puras usadas tanto pelo Game quanto pelo verificador de partidas, para que o
+jogo e a validação nunca divirjam
+"""
+
+MOVE_DURATION = 0.5  # Duração do movimento entre dois nós (segundos)
+COMBAT_DURATION = 1.0  # Duração do combate simultâneo (segundos)
+ENEMY_HEALTH = 100
+LOW_HEALTH = 50  # Abaixo disso o jogador morre ao encontrar um inimigo
+
+
+def is_instant_death(enemies_fought, health):
+    """Segundo inimigo do nível ou vida baixa: morte instantânea, sem combate"""
+    return enemies_fought >= 1 or health < LOW_HEALTH
+
+
+def combat_damage(initial_health, max_health):
+    """Danos do combate simultâneo: (dano no jogador, dano no inimigo)
+
+    O jogador sempre perde metade da vida; com mais da metade da vida máxima ele mata
+    o inimigo, senão morre
+    """
+    if initial_health > max_health // 2:
+        return initial_health // 2, ENEMY_HEALTH
+    return initial_health, ENEMY_HEALTH // 2
+
+
+def fight(health, max_health, enemies_fought):
+    """Resolve um encontro com inimigo: (vida depois, inimigo morreu?)
+
+    Vida 0 significa que o jogador morreu (instantaneamente ou no combate)
+    """
+    if is_instant_death(enemies_fought, health):
+        return 0, False
+    player_damage, enemy_damage = combat_damage(health, max_health)
+    health = max(0, health - player_damage)
+    enemy_killed = ENEMY_HEALTH - enemy_damage <= 0
+    return health, enemy_killed and health > 0
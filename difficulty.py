@@ -0,0 +1,265 @@
+"""
+Estimador de dificuldade dos níveis (Monte Carlo)
+Simula milhares de jogadores aleatórios por nível, todos de uma vez com vetores NumPy,
+usando as mesmas regras de combate, tempo e pontuação do jogo. O resultado é a
+distribuição de eficiência, estrelas, mortes e tempo de cada nível e semente, para
+calibrar os limites de Player.calculate_stars e a quantidade de inimigos do World
+
+    python difficulty.py --walkers 5000 --seeds 1 2 3
+"""
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from combat_rules import MOVE_DURATION, COMBAT_DURATION, fight
+from graph_generator import get_level_config
+from level_data import level_data
+from pathfinding import distances_to
+from player import STAR_THRESHOLDS
+
+PLAYING, COMPLETED, DEAD = 0, 1, 2
+
+# skill: chance de escolher um vizinho mais perto da saída; caution: chance de desviar de
+# um inimigo visível; think: tempo médio (s) para decidir cada movimento
+PlayerModel = namedtuple("PlayerModel", "skill caution think")
+
+MODELS = {
+    "novato": PlayerModel(skill=0.35, caution=0.2, think=2.0),
+    "casual": PlayerModel(skill=0.6, caution=0.5, think=1.2),
+    "experiente": PlayerModel(skill=0.85, caution=0.8, think=0.6),
+    "mestre": PlayerModel(skill=0.97, caution=0.95, think=0.3),
+}
+
+
+class LevelArrays:
+    """Nível em forma de tabelas NumPy (nós numerados de 0 a n-1)"""
+
+    def __init__(self, level):
+        nodes = list(level.neighbors)
+        index = {node: i for i, node in enumerate(nodes)}
+        count = len(nodes)
+        max_degree = max(len(neighbors) for neighbors in level.neighbors.values())
+
+        self.nodes = nodes
+        self.start = index[level.start_node]
+        self.end = index[level.end_node]
+        self.degree = np.array([len(level.neighbors[node]) for node in nodes], dtype=np.int64)
+        self.neighbors = np.zeros((count, max_degree), dtype=np.int64)
+        for i, node in enumerate(nodes):
+            row = sorted(index[neighbor] for neighbor in level.neighbors[node])  # Ordem estável
+            self.neighbors[i, :len(row)] = row
+
+        # Peso de cada aresta (matriz densa: os níveis têm no máximo algumas dezenas de nós)
+        self.weight = np.zeros((count, count), dtype=np.int64)
+        for i, node in enumerate(nodes):
+            for neighbor, weight in level.neighbors[node].items():
+                self.weight[i, index[neighbor]] = weight
+
+        # Custo mínimo até a saída: a eficiência compara custos
+        to_exit = distances_to(level.neighbors, level.end_node)
+        unreachable = int(self.weight.sum()) + 1
+        self.distance = np.array([to_exit.get(node, unreachable) for node in nodes], dtype=np.int64)
+
+        # Vizinhos em algum caminho mais barato até a saída, agrupados no começo de cada linha
+        self.closer = np.zeros_like(self.neighbors)
+        self.closer_count = np.zeros(count, dtype=np.int64)
+        for i in range(count):
+            row = [j for j in self.neighbors[i, :self.degree[i]]
+                   if self.weight[i, j] + self.distance[j] == self.distance[i]]
+            self.closer[i, :len(row)] = row
+            self.closer_count[i] = len(row)
+
+        enemies = sorted(level.enemies, key=repr)
+        self.enemy_count = len(enemies)
+        self.enemy_of = np.full(count, -1, dtype=np.int64)  # Índice do inimigo em cada nó (-1: nenhum)
+        for k, enemy in enumerate(enemies):
+            self.enemy_of[index[enemy]] = k
+        self.optimal_length = level.optimal_length
+        self.optimal_after_kill = np.array([level.optimal_after_kill[enemy] for enemy in enemies] or [0],
+                                           dtype=np.int64)
+        self.optimal_cost = level.optimal_cost
+        self.optimal_cost_after_kill = np.array([level.optimal_cost_after_kill[enemy] for enemy in enemies] or [0],
+                                                dtype=np.int64)
+        self.time_limit = level.time_limit
+
+
+def _choose(arrays, positions, rng):
+    """Vizinho aleatório (uniforme) de cada posição"""
+    picks = (rng.random(positions.size) * arrays.degree[positions]).astype(np.int64)
+    return arrays.neighbors[positions, picks]
+
+
+def simulate(arrays, model, walkers, rng, max_health=100, max_steps=None):
+    """Simula 'walkers' jogadores do modelo; retorna arrays por jogador"""
+    if max_steps is None:
+        max_steps = max(50, 10 * len(arrays.degree))
+    position = np.full(walkers, arrays.start, dtype=np.int64)
+    steps = np.zeros(walkers, dtype=np.int64)
+    cost = np.zeros(walkers, dtype=np.int64)
+    elapsed = np.zeros(walkers)
+    health = np.full(walkers, max_health, dtype=np.int64)
+    fought = np.zeros(walkers, dtype=np.int64)
+    killed = np.full(walkers, -1, dtype=np.int64)  # Inimigo derrotado (só o primeiro pode morrer)
+    alive = np.ones((walkers, max(arrays.enemy_count, 1)), dtype=bool)
+    status = np.full(walkers, PLAYING, dtype=np.int8)
+
+    for _ in range(max_steps):
+        active = np.flatnonzero(status == PLAYING)
+        if active.size == 0:
+            break
+        here = position[active]
+
+        # Passo em direção à saída com chance 'skill', senão um vizinho qualquer
+        closer_count = arrays.closer_count[here]
+        closer = arrays.closer[here, (rng.random(active.size) * np.maximum(closer_count, 1)).astype(np.int64)]
+        greedy = (rng.random(active.size) < model.skill) & (closer_count > 0)
+        following = np.where(greedy, closer, _choose(arrays, here, rng))
+
+        # Inimigo vivo no destino: com chance 'caution' o jogador sorteia outro vizinho
+        enemy = arrays.enemy_of[following]
+        threatened = (enemy >= 0) & alive[active, np.maximum(enemy, 0)]
+        retry = threatened & (rng.random(active.size) < model.caution)
+        if retry.any():
+            following[retry] = _choose(arrays, here[retry], rng)
+            enemy = arrays.enemy_of[following]
+            threatened = (enemy >= 0) & alive[active, np.maximum(enemy, 0)]
+
+        position[active] = following
+        steps[active] += 1
+        cost[active] += arrays.weight[here, following]
+        elapsed[active] += MOVE_DURATION + rng.exponential(model.think, active.size)
+
+        # Combates são raros (no máximo dois por jogador): regras escalares de combat_rules
+        for i in np.flatnonzero(threatened):
+            walker = active[i]
+            health[walker], enemy_killed = fight(int(health[walker]), max_health, int(fought[walker]))
+            fought[walker] += 1
+            if health[walker] <= 0:
+                status[walker] = DEAD
+                continue
+            if enemy_killed:
+                alive[walker, enemy[i]] = False
+                killed[walker] = enemy[i]
+            elapsed[walker] += COMBAT_DURATION
+
+        arrived = active[(following == arrays.end) & (status[active] == PLAYING)]
+        status[arrived] = COMPLETED
+
+    optimal = np.where(killed >= 0, arrays.optimal_cost_after_kill[np.maximum(killed, 0)], arrays.optimal_cost)
+    return {"status": status, "steps": steps, "cost": cost, "elapsed": elapsed, "optimal": optimal}
+
+
+def score(arrays, run):
+    """Eficiência, estrelas e pontuação (mesmas contas de score_level e calculate_stars)"""
+    optimal = run["optimal"]
+    safe_optimal = np.maximum(optimal, 1)
+    efficiency = np.where(optimal == 0, 1.0,
+                          np.maximum(0.0, 1 - (run["cost"] - optimal) / safe_optimal))
+    stars = sum((efficiency * 100 >= threshold).astype(np.int64) for threshold in STAR_THRESHOLDS)
+    time_limit = arrays.time_limit
+    time_bonus = np.maximum(0, ((time_limit - run["elapsed"]) / time_limit * 50).astype(np.int64))
+    return efficiency, stars, (efficiency * 100).astype(np.int64) + time_bonus
+
+
+def _quantiles(values):
+    if values.size == 0:
+        return {"mean": None, "p10": None, "p50": None, "p90": None}
+    p10, p50, p90 = np.percentile(values, (10, 50, 90))
+    return {"mean": float(values.mean()), "p10": float(p10), "p50": float(p50), "p90": float(p90)}
+
+
+def summarize(arrays, run):
+    """Distribuições de um modelo em um nível"""
+    status = run["status"]
+    walkers = status.size
+    completed = status == COMPLETED
+    efficiency, stars, total_score = score(arrays, run)
+    stars_done = stars[completed]
+    return {
+        "walkers": int(walkers),
+        "completion_rate": float(completed.mean()),
+        "death_rate": float((status == DEAD).mean()),
+        "timeout_rate": float((status == PLAYING).mean()),
+        "advance_rate": float((completed & (stars >= 2)).mean()),  # Libera o próximo nível
+        "expected_stars": float(np.where(completed, stars, 0).mean()),
+        "stars": [float((stars_done == s).mean()) if stars_done.size else 0.0 for s in range(4)],
+        "efficiency": _quantiles(efficiency[completed]),
+        "time": _quantiles(run["elapsed"][completed]),
+        "score": _quantiles(total_score[completed]),
+    }
+
+
+def estimate_level(level_id, seed=0, models=tuple(MODELS), walkers=2000, rng_seed=0):
+    """Estimativa de um nível (uma semente) para cada modelo de jogador"""
+    level = level_data(level_id, seed)
+    arrays = LevelArrays(level)
+    entropy = [rng_seed, level_id, seed + 1]
+    config = get_level_config(level_id)
+    row = {
+        "level_id": level_id, "seed": seed, "name": config["name"], "difficulty": config["difficulty"],
+        "time_limit": config["time_limit"], "nodes": len(arrays.degree), "enemies": arrays.enemy_count,
+        "optimal_length": level.optimal_length, "optimal_cost": level.optimal_cost, "models": {},
+    }
+    for k, name in enumerate(models):
+        rng = np.random.default_rng(entropy + [k])
+        row["models"][name] = summarize(arrays, simulate(arrays, MODELS[name], walkers, rng))
+    return row
+
+
+def estimate(levels=range(1, 21), seeds=(0,), models=tuple(MODELS), walkers=2000, max_workers=None,
+             rng_seed=0):
+    """Estimativas de todos os níveis e sementes, em paralelo; linhas na ordem pedida"""
+    jobs = [(level_id, seed) for level_id in levels for seed in seeds]
+    if max_workers == 1:
+        return [estimate_level(level_id, seed, models, walkers, rng_seed) for level_id, seed in jobs]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(estimate_level, level_id, seed, models, walkers, rng_seed) for level_id, seed in jobs]
+        return [future.result() for future in futures]
+
+
+def print_report(rows):
+    print(f"{'nível':<30} {'modelo':<11} {'conclui':>7} {'morre':>6} {'efic. p10/50/90':>17} "
+          f"{'estrelas 0/1/2/3':>19} {'tempo p50':>9}")
+    for row in rows:
+        seed = f" s{row['seed']}"
+        title = f"{row['level_id']:>2}{seed} {row['name']} ({row['enemies']}👹)"
+        for name, stats in row["models"].items():
+            efficiency = stats["efficiency"]
+            if efficiency["p50"] is None:
+                quantiles = "-"
+            else:
+                quantiles = f"{efficiency['p10']:.2f}/{efficiency['p50']:.2f}/{efficiency['p90']:.2f}"
+            stars = "/".join(f"{share * 100:.0f}" for share in stats["stars"])
+            median_time = f"{stats['time']['p50']:.1f}s" if stats["time"]["p50"] is not None else "-"
+            print(f"{title:<30} {name:<11} {stats['completion_rate'] * 100:>6.1f}% {stats['death_rate'] * 100:>5.1f}% "
+                  f"{quantiles:>17} {stars:>19} {median_time:>9}")
+            title = ""
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+    import logging
+    import time
+    from game_logging import setup_logging
+
+    parser = argparse.ArgumentParser(description="Estimativa Monte Carlo da dificuldade dos níveis")
+    parser.add_argument("--levels", type=int, nargs="+", default=list(range(1, 21)))
+    parser.add_argument("--seeds", type=int, nargs="+", default=None,
+                        help="Sementes dos inimigos (padrão: 0)")
+    parser.add_argument("--models", nargs="+", default=list(MODELS), choices=list(MODELS))
+    parser.add_argument("--walkers", type=int, default=2000, help="Jogadores simulados por modelo e nível")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--json", default=None, metavar="ARQUIVO", help="Grava as distribuições em JSON")
+    args = parser.parse_args()
+
+    setup_logging(logging.ERROR, console=False)
+    started = time.perf_counter()
+    rows = estimate(args.levels, tuple(args.seeds) if args.seeds else (0,), tuple(args.models),
+                    args.walkers, args.workers)
+    elapsed = time.perf_counter() - started
+    print_report(rows)
+    simulated = sum(stats["walkers"] for row in rows for stats in row["models"].values())
+    print(f"\n🎲 {simulated} partidas simuladas em {elapsed:.2f}s")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2, ensure_ascii=False)
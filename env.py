@@ -0,0 +1,283 @@
+"""
+Ambiente de aprendizado por reforço (estilo Gym) para os níveis em grafo
+PathfinderEnv envolve World, Player e as regras de combate do jogo, um nível por vez.
+VectorPathfinderEnv simula muitos níveis independentes em arrays NumPy, sem pygame nem
+networkx no passo, para treinar agentes com centenas de milhares de passos por segundo
+
+Ação: índice do vizinho na lista ordenada do nó atual (action_mask diz quais valem).
+Recompensa: -peso da aresta/custo ótimo a cada passo (ação inválida conta peso 1), +2 ao chegar na saída e -1 ao
+morrer; sem inimigos derrotados, o retorno de uma partida concluída é a própria eficiência
+"""
+import numpy as np
+from combat_rules import MOVE_DURATION, COMBAT_DURATION, fight
+from difficulty import LevelArrays
+from level_data import LevelData, level_data
+from player import Player
+from scoring import LiveScore
+from world import World, score_level
+
+COMPLETION_REWARD = 2.0
+DEATH_REWARD = -1.0
+
+
+class PathfinderEnv:
+    """Um nível do jogo com reset()/step() no formato do Gymnasium"""
+
+    def __init__(self, level_id=1, seed=None, max_steps=None):
+        self.level_id = level_id
+        self.seed = seed
+        self.world = World(level_id, seed=seed)
+        self.arrays = LevelArrays(LevelData.from_world(self.world))  # Numeração dos nós e vizinhos
+        self.index = {node: i for i, node in enumerate(self.arrays.nodes)}
+        self.max_actions = self.arrays.neighbors.shape[1]
+        self.max_steps = max_steps or 10 * len(self.arrays.nodes)
+        self.player = Player()
+
+    def reset(self, seed=None):
+        """Começa o nível de novo (seed troca a semente dos inimigos); retorna (obs, info)"""
+        if seed is not None:
+            self.seed = seed
+        self.world = World(self.level_id, seed=self.seed)
+        self.player.reset_level(self.world.start_node, LiveScore(self.world))
+        self.initial_optimal = self.world.optimal_distance
+        self.enemies_fought = 0
+        self.steps = 0
+        self.elapsed = 0.0
+        return self._observation(), self._info()
+
+    def action_mask(self):
+        current = self.index[self.player.current_node]
+        return np.arange(self.max_actions) < self.arrays.degree[current]
+
+    def _observation(self):
+        enemies = np.zeros(len(self.arrays.nodes), dtype=bool)
+        for node in self.world.enemies:
+            enemies[self.index[node]] = True
+        return {
+            "node": self.index[self.player.current_node],
+            "health": self.player.health,
+            "enemies_fought": self.enemies_fought,
+            "enemies": enemies,
+            "steps": self.steps,
+        }
+
+    def _info(self, **extra):
+        return dict(extra, action_mask=self.action_mask())
+
+    def step(self, action):
+        """Move para o vizinho 'action'; retorna (obs, recompensa, terminou, truncou, info)"""
+        current = self.index[self.player.current_node]
+        self.steps += 1
+        if not 0 <= action < self.arrays.degree[current]:
+            truncated = self.steps >= self.max_steps
+            reward = -1.0 / max(self.initial_optimal, 1)  # Ação inválida custa como uma aresta de peso 1
+            return self._observation(), reward, False, truncated, self._info(invalid_action=True)
+
+        target = self.arrays.neighbors[current, action]
+        reward = -float(self.arrays.weight[current, target]) / max(self.initial_optimal, 1)
+        node = self.arrays.nodes[target]
+        self.player.move_to_node(node)
+        self.elapsed += MOVE_DURATION
+
+        # Mesmas regras do Game (_apply_combat_damage e _resolve_combat)
+        if node in self.world.enemies:
+            self.player.health, enemy_killed = fight(self.player.health, self.player.max_health,
+                                                     self.enemies_fought)
+            self.enemies_fought += 1
+            if self.player.health <= 0:
+                return self._observation(), reward + DEATH_REWARD, True, False, self._info(died=True)
+            if enemy_killed:
+                self.world.remove_enemy(node)
+            self.elapsed += COMBAT_DURATION
+
+        if node == self.world.end_node:
+            results = score_level(len(self.player.path_taken) - 1, len(self.world.optimal_path) - 1,
+                                  self.elapsed, self.world.config["time_limit"], self.player.score.cost,
+                                  self.world.optimal_distance)
+            results["stars"] = self.player.calculate_stars(results["efficiency"])
+            return self._observation(), reward + COMPLETION_REWARD, True, False, self._info(results=results)
+
+        return self._observation(), reward, False, self.steps >= self.max_steps, self._info()
+
+
+class VectorPathfinderEnv:
+    """'num_envs' partidas independentes em arrays NumPy, com reset automático
+
+    levels: lista de level_id ou (level_id, semente); o ambiente i joga levels[i % len(levels)].
+    Observações, recompensas e máscaras são arrays com uma linha por ambiente
+    """
+
+    def __init__(self, levels=(1,), num_envs=1024, max_steps=None, max_health=100):
+        keys = [level if isinstance(level, tuple) else (level, 0) for level in levels]
+        tables = [LevelArrays(level_data(*key)) for key in keys]
+        count = len(tables)
+        max_nodes = max(len(t.nodes) for t in tables)
+        self.max_actions = max(t.neighbors.shape[1] for t in tables)
+        self.num_envs = num_envs
+        self.max_health = max_health
+        self.levels = keys
+
+        # Tabelas dos níveis, preenchidas até o maior nível/grau
+        self.neighbors = np.zeros((count, max_nodes, self.max_actions), dtype=np.int64)
+        self.edge_weight = np.zeros((count, max_nodes, self.max_actions), dtype=np.int64)  # Peso de cada ação
+        self.degree = np.zeros((count, max_nodes), dtype=np.int64)
+        self.initial_enemies = np.zeros((count, max_nodes), dtype=bool)
+        self.optimal_after_kill = np.zeros((count, max_nodes), dtype=np.int64)  # Custo ótimo, por nó do inimigo
+        self.start = np.array([t.start for t in tables], dtype=np.int64)
+        self.end = np.array([t.end for t in tables], dtype=np.int64)
+        self.optimal_cost = np.array([t.optimal_cost for t in tables], dtype=np.int64)
+        self.level_max_steps = np.array([max_steps or 10 * len(t.nodes) for t in tables], dtype=np.int64)
+        for k, t in enumerate(tables):
+            nodes, degree = t.neighbors.shape
+            self.neighbors[k, :nodes, :degree] = t.neighbors
+            self.edge_weight[k, :nodes, :degree] = np.take_along_axis(t.weight, t.neighbors, axis=1)
+            self.degree[k, :nodes] = t.degree
+            enemy_nodes = np.flatnonzero(t.enemy_of >= 0)
+            self.initial_enemies[k, enemy_nodes] = True
+            self.optimal_after_kill[k, enemy_nodes] = t.optimal_cost_after_kill[t.enemy_of[enemy_nodes]]
+
+        # Resultado de combat_rules.fight para cada (já lutou?, vida): o combate vira consulta
+        self.fight_health = np.zeros((2, max_health + 1), dtype=np.int64)
+        self.fight_killed = np.zeros((2, max_health + 1), dtype=bool)
+        for fought in range(2):
+            for health in range(max_health + 1):
+                self.fight_health[fought, health], self.fight_killed[fought, health] = fight(
+                    health, max_health, fought)
+
+        self.level = np.arange(num_envs, dtype=np.int64) % count
+        self.rows = np.arange(num_envs)
+        self.node = np.zeros(num_envs, dtype=np.int64)
+        self.health = np.zeros(num_envs, dtype=np.int64)
+        self.enemies_fought = np.zeros(num_envs, dtype=np.int64)
+        self.enemies = np.zeros((num_envs, max_nodes), dtype=bool)
+        self.optimal = np.zeros(num_envs, dtype=np.int64)  # Ótimo atual (muda quando um inimigo morre)
+        self.steps = np.zeros(num_envs, dtype=np.int64)
+        self.cost = np.zeros(num_envs, dtype=np.int64)  # Soma dos pesos das arestas percorridas
+        self.elapsed = np.zeros(num_envs)
+        self.episode_return = np.zeros(num_envs)
+
+    def _reset_envs(self, envs):
+        level = self.level[envs]
+        self.node[envs] = self.start[level]
+        self.health[envs] = self.max_health
+        self.enemies_fought[envs] = 0
+        self.enemies[envs] = self.initial_enemies[level]
+        self.optimal[envs] = self.optimal_cost[level]
+        self.steps[envs] = 0
+        self.cost[envs] = 0
+        self.elapsed[envs] = 0.0
+        self.episode_return[envs] = 0.0
+
+    def reset(self, seed=None):
+        """Reinicia todos os ambientes; retorna (obs, info)"""
+        self._reset_envs(self.rows)
+        return self._observation(), {"action_mask": self.action_mask()}
+
+    def action_mask(self):
+        return np.arange(self.max_actions) < self.degree[self.level, self.node][:, None]
+
+    def sample_actions(self, rng):
+        """Ações válidas aleatórias (uma por ambiente)"""
+        return (rng.random(self.num_envs) * self.degree[self.level, self.node]).astype(np.int64)
+
+    def _observation(self):
+        return {
+            "level": self.level.copy(),
+            "node": self.node.copy(),
+            "health": self.health.copy(),
+            "enemies_fought": self.enemies_fought.copy(),
+            "enemies": self.enemies.copy(),
+            "steps": self.steps.copy(),
+        }
+
+    def step(self, actions):
+        """Um passo em todos os ambientes; os que terminam recomeçam sozinhos
+
+        info traz, para os ambientes que terminaram neste passo: done, completed, died,
+        episode_return, episode_length, efficiency e time
+        """
+        actions = np.asarray(actions, dtype=np.int64)
+        level = self.level
+        rows = self.rows
+        valid = (actions >= 0) & (actions < self.degree[level, self.node])
+        safe_actions = np.where(valid, actions, 0)
+        target = self.neighbors[level, self.node, safe_actions]
+        weight = np.where(valid, self.edge_weight[level, self.node, safe_actions], 0)
+        node = np.where(valid, target, self.node)
+        self.node = node
+        self.steps += 1
+        self.cost += weight
+        self.elapsed += np.where(valid, MOVE_DURATION, 0.0)
+        reward = -np.where(valid, weight, 1) / np.maximum(self.optimal_cost[level], 1)
+
+        # Combates: só as linhas que entraram em um nó com inimigo vivo
+        died = np.zeros(self.num_envs, dtype=bool)
+        fighting = np.flatnonzero(valid & self.enemies[rows, node])
+        if fighting.size:
+            fought = np.minimum(self.enemies_fought[fighting], 1)
+            health = self.health[fighting]
+            killed = self.fight_killed[fought, health]
+            self.health[fighting] = self.fight_health[fought, health]
+            self.enemies_fought[fighting] += 1
+            died[fighting] = self.health[fighting] <= 0
+            winners = fighting[killed]
+            self.enemies[winners, node[winners]] = False
+            self.optimal[winners] = self.optimal_after_kill[level[winners], node[winners]]
+            self.elapsed[fighting[~died[fighting]]] += COMBAT_DURATION
+
+        completed = (node == self.end[level]) & ~died
+        reward = reward + COMPLETION_REWARD * completed + DEATH_REWARD * died
+        self.episode_return += reward
+        terminated = completed | died
+        truncated = ~terminated & (self.steps >= self.level_max_steps[level])
+        done = terminated | truncated
+
+        optimal = np.maximum(self.optimal, 1)
+        efficiency = np.where(self.optimal == 0, 1.0, np.maximum(0.0, 1 - (self.cost - self.optimal) / optimal))
+        info = {
+            "done": done,
+            "completed": completed,
+            "died": died,
+            "episode_return": np.where(done, self.episode_return, 0.0),
+            "episode_length": np.where(done, self.steps, 0),
+            "efficiency": np.where(completed, efficiency, 0.0),
+            "time": np.where(completed, self.elapsed, 0.0),
+        }
+        finished = np.flatnonzero(done)
+        if finished.size:
+            self._reset_envs(finished)
+        info["action_mask"] = self.action_mask()
+        return self._observation(), reward, terminated, truncated, info
+
+
+def benchmark(levels=tuple(range(1, 21)), num_envs=4096, steps=500, seed=0):
+    """Passos por segundo do ambiente vetorizado com ações aleatórias válidas"""
+    import time
+    env = VectorPathfinderEnv(levels, num_envs)
+    rng = np.random.default_rng(seed)
+    env.reset()
+    episodes = 0
+    started = time.perf_counter()
+    for _ in range(steps):
+        _, _, _, _, info = env.step(env.sample_actions(rng))
+        episodes += int(info["done"].sum())
+    elapsed = time.perf_counter() - started
+    return {"steps": num_envs * steps, "episodes": episodes, "elapsed": elapsed,
+            "steps_per_second": num_envs * steps / elapsed}
+
+
+if __name__ == "__main__":
+    import argparse
+    import logging
+    from game_logging import setup_logging
+
+    parser = argparse.ArgumentParser(description="Benchmark do ambiente vetorizado")
+    parser.add_argument("--envs", type=int, default=4096)
+    parser.add_argument("--steps", type=int, default=500)
+    parser.add_argument("--levels", type=int, nargs="+", default=list(range(1, 21)))
+    args = parser.parse_args()
+
+    setup_logging(logging.ERROR, console=False)
+    stats = benchmark(tuple(args.levels), args.envs, args.steps)
+    print(f"🧠 {stats['steps']} passos em {stats['elapsed']:.2f}s → {stats['steps_per_second']:,.0f} passos/s "
+          f"({stats['episodes']} partidas)")
@@ -0,0 +1,78 @@
+"""
+Módulo do relógio de simulação com passo fixo
+Separa a simulação do jogo (determinística) da renderização (livre ou com vsync)
+"""
+import time
+
+
+class VirtualTimeSource:
+    """Fonte de tempo manual - só avança quando o código manda (testes e modo headless)"""
+
+    def __init__(self, start=0.0):
+        self.current = start
+
+    def advance(self, seconds):
+        """Avança o tempo virtual"""
+        self.current += seconds
+
+    def __call__(self):
+        return self.current
+
+
+class GameClock:
+    """Relógio monotônico de passo fixo com interpolação para a renderização"""
+
+    def __init__(self, step_dt=1.0 / 60.0, max_frame_time=0.25, time_source=None):
+        self.step_dt = step_dt  # Duração de cada passo da simulação (segundos)
+        self.max_frame_time = max_frame_time  # Evita a "espiral da morte" após travamentos
+        self.time_source = time_source or time.perf_counter  # Fonte injetável (monotônica)
+
+        self.tick_count = 0  # Passos de simulação executados
+        self.accumulator = 0.0  # Tempo real ainda não simulado
+        self.alpha = 0.0  # Fração do próximo passo (interpolação)
+        self.frame_time = 0.0  # Duração real do último frame
+        self.last_real_time = None
+
+    def now(self):
+        """Tempo atual da simulação em segundos (sempre múltiplo de step_dt)"""
+        return self.tick_count * self.step_dt
+
+    def render_time(self):
+        """Tempo interpolado entre o último passo e o próximo, usado só para desenhar"""
+        return (self.tick_count + self.alpha) * self.step_dt
+
+    def begin_frame(self):
+        """Mede o tempo real decorrido desde o último frame e acumula para a simulação"""
+        real_time = self.time_source()
+        if self.last_real_time is None:
+            self.last_real_time = real_time
+
+        frame_time = real_time - self.last_real_time
+        self.last_real_time = real_time
+
+        # Limita o frame para não simular segundos de uma vez após uma travada
+        frame_time = min(max(frame_time, 0.0), self.max_frame_time)
+        self.frame_time = frame_time
+        self.accumulator += frame_time
+        return frame_time
+
+    def consume_step(self):
+        """Consome um passo fixo do acumulador; retorna False quando não há mais passos"""
+        if self.accumulator >= self.step_dt:
+            self.accumulator -= self.step_dt
+            self.tick_count += 1
+            return True
+
+        self.alpha = self.accumulator / self.step_dt
+        return False
+
+    def step(self):
+        """Avança exatamente um passo, sem olhar o tempo real (simulação virtual)"""
+        self.tick_count += 1
+        self.alpha = 0.0
+        if isinstance(self.time_source, VirtualTimeSource):
+            self.time_source.advance(self.step_dt)
+
+    def seconds_to_steps(self, seconds):
+        """Converte uma duração em número de passos de simulação"""
+        return int(round(seconds / self.step_dt))
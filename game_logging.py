@@ -0,0 +1,76 @@
+"""
+Sistema de logging do jogo
+Mensagens com nível (DEBUG/INFO/WARNING/ERROR) em vez de print: o loop do jogo só
+coloca o registro em uma fila e uma thread separada (QueueListener) escreve no console
+ou em arquivo. Mensagens abaixo do nível configurado custam só uma comparação, sem
+formatar texto (use sempre o estilo logger.debug("... %s", valor)). Sem setup_logging
+(módulos usados como biblioteca: level_data, verifier, servidor de placar) nada é escrito
+"""
+import atexit
+import logging
+import logging.handlers
+import queue
+
+ROOT_LOGGER = "pathfinder"
+DEFAULT_FORMAT = "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+
+_listener = None
+
+
+def _quiet_root():
+    """NullHandler no logger raiz do jogo: sem setup_logging o Python não usa o stderr de reserva"""
+    logging.getLogger(ROOT_LOGGER).addHandler(logging.NullHandler())
+
+
+_quiet_root()
+
+
+def get_logger(name=None):
+    """Logger do jogo (filho de 'pathfinder'), ex.: get_logger(__name__)"""
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}" if name else ROOT_LOGGER)
+
+
+def setup_logging(level="WARNING", log_file=None, console=True, fmt=DEFAULT_FORMAT):
+    """Configura o nível e a escrita em segundo plano; pode ser chamado de novo para trocar"""
+    global _listener
+    shutdown_logging()
+
+    handlers = []
+    if console:
+        handlers.append(logging.StreamHandler())
+    if log_file:
+        handlers.append(logging.FileHandler(log_file, encoding="utf-8"))
+    formatter = logging.Formatter(fmt)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    root = logging.getLogger(ROOT_LOGGER)
+    root.setLevel(level.upper() if isinstance(level, str) else level)
+    root.propagate = False
+
+    if handlers:
+        records = queue.SimpleQueue()
+        root.addHandler(logging.handlers.QueueHandler(records))
+        _listener = logging.handlers.QueueListener(records, *handlers, respect_handler_level=True)
+        _listener.start()
+    else:
+        root.addHandler(logging.NullHandler())
+    return root
+
+
+@atexit.register
+def shutdown_logging():
+    """Esvazia a fila, para a thread de escrita e volta à configuração padrão (chamado ao sair)"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+    root = logging.getLogger(ROOT_LOGGER)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.setLevel(logging.NOTSET)
+    root.propagate = True
+    _quiet_root()
@@ -0,0 +1,139 @@
+"""
+Layout do grafo com índice espacial
+Posições dos nós calculadas uma vez por grafo, uma grade uniforme (SpatialGrid) para
+achar nós, arestas e trilhas dentro de um retângulo ou perto de um ponto sem percorrer
+o grafo inteiro, e as arestas decompostas em trilhas (sequências de nós em que cada
+aresta aparece uma vez) para desenhar muitas arestas com uma só chamada de
+pygame.draw.lines. Usado pelo Visualizer para recortar o que está fora da tela e pelo
+Game para saber qual nó está sob o mouse
+"""
+import math
+from collections import defaultdict
+
+MAX_TRAIL_EDGES = 32  # Trilhas longas são cortadas para o recorte continuar descartando trechos fora da tela
+
+
+def decompose_trails(graph, max_edges=MAX_TRAIL_EDGES):
+    """Divide as arestas em trilhas de até max_edges arestas; cada aresta aparece em uma só"""
+    remaining = {node: set(graph.neighbors(node)) - {node} for node in graph.nodes()}
+    # Trilhas começam nos nós de grau ímpar: uma decomposição mínima termina neles
+    order = sorted(graph.nodes(), key=lambda node: len(remaining[node]) % 2 == 0)
+    trails = []
+    for start in order:
+        while remaining[start]:
+            trail = [start]
+            node = start
+            while remaining[node] and len(trail) <= max_edges:
+                following = min(remaining[node])  # Ordem estável entre execuções
+                remaining[node].discard(following)
+                remaining[following].discard(node)
+                trail.append(following)
+                node = following
+            trails.append(trail)
+    return trails
+
+
+class SpatialGrid:
+    """Grade uniforme: cada célula guarda os itens cuja caixa envolvente a toca"""
+
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = defaultdict(list)
+        self.bounds = None  # (x0, y0, x1, y1) em células ocupadas
+        self._order = {}  # item -> ordem de inserção (resultados estáveis nas consultas)
+
+    def _cell(self, x, y):
+        return int(math.floor(x / self.cell_size)), int(math.floor(y / self.cell_size))
+
+    def insert(self, item, left, top, right, bottom):
+        self._order.setdefault(item, len(self._order))
+        x0, y0 = self._cell(left, top)
+        x1, y1 = self._cell(right, bottom)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                self.cells[(cx, cy)].append(item)
+        if self.bounds is None:
+            self.bounds = (x0, y0, x1, y1)
+        else:
+            bx0, by0, bx1, by1 = self.bounds
+            self.bounds = (min(bx0, x0), min(by0, y0), max(bx1, x1), max(by1, y1))
+
+    def query(self, left, top, right, bottom):
+        """Itens das células que tocam o retângulo, sem repetição e na ordem de inserção"""
+        if self.bounds is None:
+            return []
+        x0, y0 = self._cell(left, top)
+        x1, y1 = self._cell(right, bottom)
+        bx0, by0, bx1, by1 = self.bounds
+        found = {}
+        for cx in range(max(x0, bx0), min(x1, bx1) + 1):
+            for cy in range(max(y0, by0), min(y1, by1) + 1):
+                for item in self.cells.get((cx, cy), ()):
+                    found[item] = None
+        return sorted(found, key=self._order.get) if len(found) > 1 else list(found)
+
+
+class GraphLayout:
+    """Posições de um grafo com grades de nós, arestas (ponto médio) e trilhas"""
+
+    def __init__(self, graph, positions):
+        self.graph = graph
+        self.positions = positions  # {nó: (x, y)}
+        count = len(positions)
+        xs = [x for x, _ in positions.values()]
+        ys = [y for _, y in positions.values()]
+        self.bounds = (min(xs), min(ys), max(xs), max(ys)) if xs else (0, 0, 0, 0)  # No mundo
+        width = self.bounds[2] - self.bounds[0]
+        height = self.bounds[3] - self.bounds[1]
+        # Espaçamento típico entre nós: lado do quadrado que cabe a cada nó na caixa envolvente
+        self.spacing = math.sqrt(width * height / count) if count and width and height else 100.0
+        cell_size = max(32.0, 2 * self.spacing)
+
+        self.node_grid = SpatialGrid(cell_size)
+        for node, (x, y) in positions.items():
+            self.node_grid.insert(node, x, y, x, y)
+
+        self.edges = [(a, b, weight) for a, b, weight in graph.edges(data='weight', default=1)]
+        self.edge_grid = SpatialGrid(cell_size)  # Pelo ponto médio (onde fica o rótulo do peso)
+        for i, (a, b, _) in enumerate(self.edges):
+            mid_x, mid_y = self.midpoint(i)
+            self.edge_grid.insert(i, mid_x, mid_y, mid_x, mid_y)
+
+        self.trails = decompose_trails(graph)
+        self.trail_points = [[positions[node] for node in trail] for trail in self.trails]
+        self.trail_grid = SpatialGrid(cell_size)
+        for i, points in enumerate(self.trail_points):
+            self.trail_grid.insert(i, min(x for x, _ in points), min(y for _, y in points),
+                                   max(x for x, _ in points), max(y for _, y in points))
+
+    def midpoint(self, edge_index):
+        a, b, _ = self.edges[edge_index]
+        (ax, ay), (bx, by) = self.positions[a], self.positions[b]
+        return (ax + bx) / 2, (ay + by) / 2
+
+    def nodes_in(self, rect):
+        """Nós dentro do retângulo (left, top, right, bottom)"""
+        left, top, right, bottom = rect
+        return [node for node in self.node_grid.query(*rect)
+                if left <= self.positions[node][0] <= right and top <= self.positions[node][1] <= bottom]
+
+    def edges_in(self, rect):
+        """Índices das arestas cujo ponto médio está no retângulo"""
+        left, top, right, bottom = rect
+        return [i for i in self.edge_grid.query(*rect)
+                if left <= self.midpoint(i)[0] <= right and top <= self.midpoint(i)[1] <= bottom]
+
+    def trails_in(self, rect):
+        """Índices das trilhas cuja caixa envolvente toca o retângulo"""
+        return self.trail_grid.query(*rect)
+
+    def nodes_near(self, pos, radius):
+        """[(distância, nó)] dos nós a até 'radius' de pos, do mais próximo ao mais distante"""
+        x, y = pos
+        found = []
+        for node in self.node_grid.query(x - radius, y - radius, x + radius, y + radius):
+            distance = math.dist(pos, self.positions[node])
+            if distance <= radius:
+                found.append((distance, node))
+        found.sort(key=lambda item: item[0])
+        return found
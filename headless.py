@@ -0,0 +1,107 @@
+"""
+Modo headless: roda o ciclo completo de movimento, combate e pontuação sem tela,
+áudio ou vídeo, em tempo virtual (para CI e experimentos de balanceamento)
+"""
+import random
+import time
+from main import Game
+from pathfinding import dijkstra
+
+
+def follow_optimal_path(game):
+    """Estratégia padrão: segue o caminho ótimo do nível a partir do nó atual"""
+    world = game.world
+    current = game.player.current_node
+    path = world.optimal_path
+
+    if current in path:
+        index = path.index(current)
+        if index + 1 < len(path):
+            return path[index + 1]
+
+    # Fora do caminho ótimo (ex.: voltou ao início após combate): recalcula
+    path, _ = dijkstra(world.graph, current, world.end_node)
+    return path[1] if len(path) > 1 else None
+
+
+def random_walk(rng=None):
+    """Cria uma estratégia que escolhe um vizinho aleatório a cada passo"""
+    rng = rng or random.Random()
+
+    def choose(game):
+        neighbors = list(game.world.graph.neighbors(game.player.current_node))
+        return rng.choice(neighbors) if neighbors else None
+
+    return choose
+
+
+def run_session(level_id=1, choose_move=follow_optimal_path, max_seconds=300.0, game=None, unlock=True):
+    """Joga um nível inteiro sem tela e retorna o resultado da sessão"""
+    if game is None:
+        game = Game(headless=True)
+
+    # Libera o nível direto, sem exigir as estrelas do nível anterior
+    if unlock and level_id > 1:
+        game.player.update_level_stars(level_id - 1, 3)
+
+    game.start_level(level_id)
+    if game.game_state != "playing":
+        return {"level_id": level_id, "state": game.game_state, "results": None,
+                "path": [], "moves": 0, "sim_time": 0.0}
+
+    start_tick = game.clock.tick_count
+    max_steps = game.clock.seconds_to_steps(max_seconds)
+    moves = 0
+
+    while game.game_state == "playing" and game.clock.tick_count - start_tick < max_steps:
+        if not game.is_moving and not game.is_in_combat():
+            node = choose_move(game)
+            if node is None:
+                break
+            game.handle_node_click(node, bypass_confirmation=True)
+            moves += 1
+
+        # Avança direto até o fim da animação/combate em andamento
+        game.step()
+
+    return {
+        "level_id": level_id,
+        "state": game.game_state,
+        "results": getattr(game, "level_results", None) if game.game_state == "level_complete" else None,
+        "path": game.player.path_taken,  # reset_level cria outro; este não muda mais
+        "moves": moves,
+        "sim_time": (game.clock.tick_count - start_tick) * game.clock.step_dt,
+    }
+
+
+def benchmark(level_id=1, sessions=1000):
+    """Mede quantas sessões headless por segundo são simuladas"""
+    game = Game(headless=True)
+    started = time.perf_counter()
+    completed = 0
+
+    for _ in range(sessions):
+        result = run_session(level_id, game=game)
+        if result["state"] == "level_complete":
+            completed += 1
+
+    elapsed = time.perf_counter() - started
+    return {
+        "sessions": sessions,
+        "completed": completed,
+        "elapsed": elapsed,
+        "sessions_per_second": sessions / elapsed if elapsed > 0 else float("inf"),
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Simulação headless do PathFinder Adventure")
+    parser.add_argument("--level", type=int, default=1)
+    parser.add_argument("--sessions", type=int, default=1000)
+    args = parser.parse_args()
+
+    stats = benchmark(args.level, args.sessions)
+    print(f"🤖 {stats['sessions']} sessões ({stats['completed']} completas) em "
+          f"{stats['elapsed']:.2f}s → {stats['sessions_per_second']:.0f} sessões/s")
@@ -0,0 +1,290 @@
+"""
+Servidor local de placar (asyncio, HTTP/JSON)
+Recebe os resultados de World.complete_level e responde posição, top N e vizinhos de
+um jogador em O(log n) usando o ranking em skip list. O placar é gravado em disco de
+tempos em tempos (escrita atômica em outro thread) e ao fechar
+
+    POST /submit                         {"player", "level_id", "seed", "path", "times"}: partida verificada
+                                         ({"player", "level_id", "total_score", "time_taken"} com verify=False)
+    GET  /levels/<id>/top?n=10
+    GET  /levels/<id>/rank?player=nome
+    GET  /levels/<id>/around?player=nome&radius=5
+
+Teste de carga: python leaderboard_server.py --bench 20000 (sem verificação: mede o placar)
+"""
+import asyncio
+import json
+import os
+import time
+from urllib.parse import urlsplit, parse_qs
+from game_logging import get_logger
+from persistence import atomic_write
+from ranking import Leaderboard
+
+logger = get_logger("leaderboard")
+
+STATUS_TEXT = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+               422: "Unprocessable Entity"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _verify(submission):
+    """Valida a partida (gera o nível se não estiver no cache); roda fora do loop do asyncio"""
+    from level_data import level_data
+    from verifier import verify_submission
+    seed = submission.get("seed")
+    level = level_data(int(submission["level_id"]), seed) if seed is not None else None
+    return verify_submission(submission, level)
+
+
+class LeaderboardServer:
+    """Servidor HTTP/1.1 mínimo (keep-alive) sobre asyncio.start_server"""
+
+    def __init__(self, leaderboard=None, host="127.0.0.1", port=8765, snapshot_path=None,
+                 snapshot_interval=5.0, verify=True):
+        if leaderboard is None:
+            if snapshot_path and os.path.exists(snapshot_path):
+                leaderboard = Leaderboard.load(snapshot_path)
+            else:
+                leaderboard = Leaderboard()
+        self.leaderboard = leaderboard
+        self.host = host
+        self.port = port
+        self.snapshot_path = snapshot_path
+        self.snapshot_interval = snapshot_interval
+        self.verify = verify  # Exige caminho e tempos e valida a partida (verifier.py); False aceita a pontuação informada
+        self.requests = 0
+        self._server = None
+        self._snapshot_task = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]  # Porta real quando port=0
+        if self.snapshot_path:
+            self._snapshot_task = asyncio.create_task(self._snapshot_loop())
+        logger.info("🏆 Placar em http://%s:%s", self.host, self.port)
+        return self
+
+    async def close(self):
+        if self._snapshot_task:
+            self._snapshot_task.cancel()
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+        await self.snapshot()
+
+    async def snapshot(self):
+        """Grava o placar se mudou; o JSON é montado aqui e a escrita vai para outro thread"""
+        if not self.snapshot_path or not self.leaderboard.dirty:
+            return
+        data = self.leaderboard.to_json()
+        self.leaderboard.dirty = False
+        await asyncio.to_thread(atomic_write, self.snapshot_path, data)
+        logger.debug("💾 Placar gravado em %s", self.snapshot_path)
+
+    async def _snapshot_loop(self):
+        while True:
+            await asyncio.sleep(self.snapshot_interval)
+            await self.snapshot()
+
+    # ---- HTTP ----
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                    headers = {}
+                    while True:
+                        line = await reader.readline()  # ValueError se passar do limite do StreamReader
+                        if line in (b"\r\n", b"\n", b""):
+                            break
+                        name, _, value = line.decode("latin-1").partition(":")
+                        headers[name.strip().lower()] = value.strip()
+                    length = int(headers.get("content-length", 0))
+                    if length < 0:
+                        raise ValueError(f"Content-Length negativo: {length}")
+                except ValueError as e:
+                    # Sem saber onde a requisição termina não dá para continuar na mesma conexão
+                    self.requests += 1
+                    await self._respond(writer, 400, {"error": f"requisição malformada: {e}"}, keep_alive=False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                try:
+                    status, payload = 200, await self.route(method, target, body)
+                except HTTPError as e:
+                    status, payload = e.status, {"error": str(e)}
+                except (ValueError, KeyError, TypeError) as e:
+                    status, payload = 400, {"error": f"requisição inválida: {e}"}
+                self.requests += 1
+
+                keep_alive = headers.get("connection", "").lower() != "close"
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, writer, status, payload, keep_alive=True):
+        data = json.dumps(payload).encode("utf-8")
+        writer.write(
+            f"HTTP/1.1 {status} {STATUS_TEXT[status]}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + data
+        )
+        await writer.drain()
+
+    async def route(self, method, target, body):
+        url = urlsplit(target)
+        parts = [part for part in url.path.split("/") if part]
+        query = {name: values[0] for name, values in parse_qs(url.query).items()}
+
+        if parts == ["submit"]:
+            if method != "POST":
+                raise HTTPError(405, "use POST")
+            return await self.submit(json.loads(body))
+
+        if len(parts) == 3 and parts[0] == "levels":
+            if method != "GET":
+                raise HTTPError(405, "use GET")
+            ranking = self.leaderboard.levels.get(int(parts[1]))
+            action = parts[2]
+            if action == "top":
+                rows = ranking.top(min(int(query.get("n", 10)), 1000)) if ranking else []
+                return {"level_id": int(parts[1]), "top": rows}
+            if action == "rank":
+                rank = ranking.rank(query["player"]) if ranking else None
+                if rank is None:
+                    raise HTTPError(404, "jogador sem partidas neste nível")
+                return {"level_id": int(parts[1]), "player": query["player"], "rank": rank, "total": len(ranking)}
+            if action == "around":
+                rows = ranking.around(query["player"], min(int(query.get("radius", 5)), 100)) if ranking else []
+                if not rows:
+                    raise HTTPError(404, "jogador sem partidas neste nível")
+                return {"level_id": int(parts[1]), "around": rows}
+
+        raise HTTPError(404, f"rota desconhecida: {url.path}")
+
+    async def submit(self, submission):
+        if self.verify:
+            if "path" not in submission:
+                raise HTTPError(422, "partida rejeitada: sem caminho para verificar")
+            # Gerar o nível e refazer a partida é trabalho de CPU: em outro thread as outras conexões seguem
+            verdict = await asyncio.to_thread(_verify, submission)
+            if not verdict["valid"]:
+                raise HTTPError(422, f"partida rejeitada: {verdict['reason']}")
+            score, time_taken = verdict["results"]["total_score"], verdict["results"]["time_taken"]
+        else:
+            score, time_taken = submission["total_score"], submission["time_taken"]
+        return self.leaderboard.submit(str(submission["player"]), int(submission["level_id"]),
+                                       int(score), float(time_taken))
+
+
+# ---- Teste de carga ----
+
+async def _request(reader, writer, method, path, payload=None):
+    body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n\r\n"
+                 .encode("latin-1") + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        if line.lower().startswith(b"content-length:"):
+            length = int(line.split(b":")[1])
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def load_test(host, port, total=10000, concurrency=32, players=2000, levels=20, seed=0):
+    """Dispara 'total' requisições (80% envios, 20% consultas) por conexões keep-alive"""
+    import random
+    rng = random.Random(seed)
+    latencies = []
+    errors = 0
+    per_client = total // concurrency
+
+    async def client():
+        nonlocal errors
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            for _ in range(per_client):
+                level_id = rng.randint(1, levels)
+                player = f"ninja{rng.randrange(players)}"
+                roll = rng.random()
+                started = time.perf_counter()
+                if roll < 0.8:
+                    status, _ = await _request(reader, writer, "POST", "/submit", {
+                        "player": player, "level_id": level_id,
+                        "total_score": rng.randint(0, 150), "time_taken": round(rng.uniform(5, 120), 2),
+                    })
+                elif roll < 0.9:
+                    status, _ = await _request(reader, writer, "GET", f"/levels/{level_id}/top?n=10")
+                else:
+                    status, _ = await _request(reader, writer, "GET",
+                                               f"/levels/{level_id}/around?player={player}&radius=3")
+                latencies.append(time.perf_counter() - started)
+                if status not in (200, 404):
+                    errors += 1
+        finally:
+            writer.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "elapsed": elapsed,
+        "requests_per_second": len(latencies) / elapsed if elapsed > 0 else float("inf"),
+        "p50_ms": latencies[len(latencies) // 2] * 1000 if latencies else 0.0,
+        "p99_ms": latencies[int(len(latencies) * 0.99)] * 1000 if latencies else 0.0,
+    }
+
+
+async def _main(args):
+    server = await LeaderboardServer(host=args.host, port=args.port, snapshot_path=args.snapshot,
+                                     verify=not args.bench).start()
+    try:
+        if args.bench:
+            stats = await load_test(server.host, server.port, total=args.bench, concurrency=args.concurrency)
+            print(f"📈 {stats['requests']} requisições em {stats['elapsed']:.2f}s → "
+                  f"{stats['requests_per_second']:.0f} req/s | p50 {stats['p50_ms']:.2f} ms | "
+                  f"p99 {stats['p99_ms']:.2f} ms | erros: {stats['errors']}")
+        else:
+            print(f"🏆 Placar em http://{server.host}:{server.port} (Ctrl+C para sair)")
+            await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Servidor local de placar do PathFinder Adventure")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--snapshot", default="leaderboard.json", help="Arquivo do snapshot do placar")
+    parser.add_argument("--bench", type=int, default=0, metavar="N",
+                        help="Sobe o servidor, dispara N requisições de teste e mostra req/s")
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+    try:
+        asyncio.run(_main(args))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,87 @@
+"""
+Dados pré-calculados dos níveis
+Versão compacta e serializável de um World (vizinhança com pesos, início, fim, inimigos
+e caminho ótimo em arestas e em custo, inclusive o recalculado depois de cada inimigo
+derrotado) para validar
+milhares de partidas sem gerar o grafo de novo a cada uma; é enviada uma única vez para
+cada processo do verificador
+"""
+import copy
+from functools import lru_cache
+from world import World
+
+
+class LevelData:
+    """O que o verificador precisa saber de um nível gerado com uma semente"""
+
+    __slots__ = ("level_id", "seed", "start_node", "end_node", "neighbors", "enemies",
+                 "optimal_length", "optimal_after_kill", "optimal_cost", "optimal_cost_after_kill", "time_limit")
+
+    def __init__(self, level_id, seed, start_node, end_node, neighbors, enemies, optimal_length,
+                 optimal_after_kill, optimal_cost, optimal_cost_after_kill, time_limit):
+        self.level_id = level_id
+        self.seed = seed
+        self.start_node = start_node
+        self.end_node = end_node
+        self.neighbors = neighbors  # {nó: {vizinho: peso da aresta}}
+        self.enemies = enemies  # frozenset dos nós com inimigo no início do nível
+        self.optimal_length = optimal_length  # Arestas do caminho ótimo
+        # O World recalcula o caminho ótimo quando um inimigo morre; como o segundo inimigo
+        # é morte certa, basta guardar o resultado para cada inimigo derrotado
+        self.optimal_after_kill = optimal_after_kill  # {nó do inimigo: arestas do novo ótimo}
+        self.optimal_cost = optimal_cost  # Custo do caminho ótimo (base da eficiência)
+        self.optimal_cost_after_kill = optimal_cost_after_kill  # {nó do inimigo: custo do novo ótimo}
+        self.time_limit = time_limit
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+    def is_edge(self, a, b):
+        return b in self.neighbors.get(a, ())
+
+    def weight(self, a, b):
+        return self.neighbors[a][b]
+
+    @classmethod
+    def from_world(cls, world):
+        optimal_after_kill = {}
+        optimal_cost_after_kill = {}
+        for enemy in world.enemies:
+            after = copy.deepcopy(world)
+            after.remove_enemy(enemy)
+            optimal_after_kill[enemy] = len(after.optimal_path) - 1
+            optimal_cost_after_kill[enemy] = after.optimal_distance
+        return cls(
+            level_id=world.level_id,
+            seed=world.seed,
+            start_node=world.start_node,
+            end_node=world.end_node,
+            neighbors=world.edge_weights,
+            enemies=frozenset(world.enemies),
+            optimal_length=len(world.optimal_path) - 1,
+            optimal_after_kill=optimal_after_kill,
+            optimal_cost=world.optimal_distance,
+            optimal_cost_after_kill=optimal_cost_after_kill,
+            time_limit=world.config["time_limit"],
+        )
+
+
+@lru_cache(maxsize=256)
+def level_data(level_id, seed):
+    """LevelData do nível gerado com a semente (memorizado por processo)
+
+    A semente é obrigatória: sem ela o World sorteia os inimigos e o cache guardaria
+    um sorteio diferente em cada processo
+    """
+    if seed is None:
+        raise ValueError(f"nível {level_id} sem semente")
+    return LevelData.from_world(World(level_id, seed=seed))
+
+
+def precompute(keys):
+    """{(nível, semente): LevelData} para todos os pares pedidos (os sem semente ficam de fora)"""
+    return {key: level_data(*key) for key in set(keys) if key[1] is not None}
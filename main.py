@@ -2,22 +2,75 @@
 PathFinder Adventure - Jogo de Grafos e Matemática Discreta
 Um jogo educativo que ensina conceitos de teoria dos grafos de forma divertida!
 """
+import time
+STARTUP_BEGAN = time.perf_counter()  # Origem do perfil de inicialização (antes dos imports)
+import contextlib
 import pygame
 import sys
 import math
+import random
 from player import Player
-from world import World
-from visualizer import Visualizer
+from visualizer import Visualizer, HeadlessVisualizer
 from pathfinding import dijkstra, calculate_path_efficiency
-import time
+from scoring import LiveScore
 from modern_ui import ModernNinjaUI, NinjaMenuSystem
-import cv2
-import numpy as np
+from game_clock import GameClock, VirtualTimeSource
+from video_player import open_video
+from game_logging import get_logger, setup_logging
+from persistence import ProgressStore
+from preload import ModulePreloader
+from combat_rules import MOVE_DURATION, COMBAT_DURATION, ENEMY_HEALTH, is_instant_death, combat_damage
+IMPORTS_DONE = time.perf_counter()
+
+logger = get_logger("game")
 
 class Game:
-    def __init__(self):
-        pygame.init()
-        self.visualizer = Visualizer()
+    PROGRESS_FILE = "star_progress.json"
+    RUN_HISTORY_FILE = "run_history.db"
+    # Módulos pesados fora do caminho até o primeiro quadro: importados depois dele, durante o menu
+    PRELOAD_MODULES = ("world", "cv2")
+    # Etapas cronometradas pelo perfil de inicialização (--startup-profile)
+    STARTUP_VISUALIZER_METHODS = (
+        "__init__", "init_ninja_audio", "request_assets", "finish_loading",
+        "load_background", "load_level_complete_background", "load_death_background", "load_star_images",
+        "load_enemy_images", "load_ninja_sounds", "load_button_images",
+        "load_idle_sprites", "load_run_sprites", "load_run_left_sprites",
+    )
+    STARTUP_GAME_METHODS = ("load_video_background", "load_star_progress", "run_loading_screen")
+
+    def __init__(self, clock=None, frame_limit=60, vsync=False, headless=False, video_cache=False, profile_csv=None,
+                 seed=None, startup_profile=None):
+        # Modo headless: sem janela, áudio, vídeo ou arquivo de progresso, em tempo virtual
+        self.headless = headless
+        self.persist_progress = not headless
+        
+        # Perfil da inicialização: cascata das fases até o menu, gravada em JSON
+        self.startup_profile = startup_profile
+        self.startup_profiler = None
+        if startup_profile:
+            self.enable_startup_profiler()
+        
+        # Sementes dos níveis derivadas da semente da sessão (replays determinísticos)
+        self.seed = seed if seed is not None else random.getrandbits(32)
+        self.level_rng = random.Random(self.seed)
+        self.level_seed = None
+        self.input_recorder = None  # InputRecorder ativo (--record)
+        self.record_path = None
+        self.replaying = False  # Durante um replay o teclado e o mouse são ignorados
+        
+        # Relógio de simulação com passo fixo (injetável para testes)
+        if clock is None:
+            clock = GameClock(time_source=VirtualTimeSource()) if headless else GameClock()
+        self.clock = clock
+        self.frame_limit = frame_limit  # 0 = renderização sem limite
+        self.video_cache = video_cache  # Usa vídeos pré-transcodificados em disco (mmap)
+        
+        if headless:
+            self.visualizer = HeadlessVisualizer(clock=self.clock)
+        else:
+            with self.startup_phase("pygame.init"):
+                pygame.init()
+            self.visualizer = Visualizer(clock=self.clock, vsync=vsync, video_cache=video_cache)
         
         # Sistema de UI moderna ninja
         self.modern_ui = ModernNinjaUI(1200, 800)
@@ -27,25 +80,18 @@ class Game:
         self.pending_state_change = None
         self.pending_level = None
         
-        # Sistema de vídeo background
-        self.video_cap = None
-        self.video_surface = None
+        # Sistema de vídeo background (decodificado em thread separada)
+        self.video_player = None
         self.video_frame = None
-        self.load_video_background()
-        
-        # Debug: força uso de sprites se disponíveis e recarrega com tamanho atual
-        if hasattr(self.visualizer, 'idle_sprites') and self.visualizer.idle_sprites:
-            # Limpa sprites antigos e recarrega
-            self.visualizer.idle_sprites.clear()
-            self.visualizer.run_sprites.clear()
-            self.visualizer.load_idle_sprites()
-            self.visualizer.load_run_sprites()
-            self.visualizer.use_sprites = True
-            print(f"🎮 Debug: Sprites recarregados - {len(self.visualizer.idle_sprites)} idle + {len(self.visualizer.run_sprites)} run")
+        if not headless:
+            self.load_video_background()
+        
         self.player = Player("Explorador")
         self.current_level = 1
         self.world = None
+        self.arrival_times = []
         self.game_state = "menu"  # menu, playing, level_complete, game_over, game_final
+        self.final_stats = None  # Estatísticas da tela final, calculadas ao entrar nela
         self.show_optimal_path = False
         self.clicked_nodes = set()
         
@@ -56,8 +102,19 @@ class Game:
         
         # Sistema de combate
         self.enemies_fought = 0  # Contador de inimigos enfrentados no nível atual
-        self.load_star_progress()
+        # Gravação do progresso em segundo plano (agrupada e atômica)
+        self.progress_store = ProgressStore(self.PROGRESS_FILE) if self.persist_progress else None
+        # Histórico de partidas e mortes por perfil (SQLite, importado só quando há persistência)
+        self.run_history = None
+        if self.persist_progress:
+            with self.startup_phase("RunHistory"):
+                from run_history import RunHistory
+                self.run_history = RunHistory(self.RUN_HISTORY_FILE)
+            self.load_star_progress()
+            with self.startup_phase("RunHistory.best_times"):
+                self.player.best_times = self.run_history.best_times(self.player.name)
         self.hovered_node = None  # Nó sobre o qual o mouse está
+        self.camera_drag = False  # Botão direito/do meio arrastando a câmera
         self.mouse_pos = (0, 0)  # Posição atual do mouse
         self.last_move_time = 0  # Para controlar o debounce de movimento
         self.move_cooldown = 0.3  # Cooldown entre movimentos (em segundos)
@@ -65,7 +122,7 @@ class Game:
         # Sistema de animação de movimento
         self.is_moving = False
         self.move_start_time = 0
-        self.move_duration = 0.5  # Duração da animação em segundos
+        self.move_duration = MOVE_DURATION  # Duração da animação em segundos
         self.move_from_node = None
         self.move_to_node = None
         
@@ -77,13 +134,71 @@ class Game:
         # Sistema de combate
         self.combat_state = None  # None, "player_attack", "enemy_attack", "enemy_dead"
         self.combat_start_time = 0
-        self.combat_duration = 1.0  # Duração do combate simultâneo em segundos
+        self.combat_duration = COMBAT_DURATION  # Duração do combate simultâneo em segundos
         self.combat_node = None
         self.combat_enemy_health = 100  # Vida do inimigo
         self.combat_turn = 0  # Turno atual do combate
         self.combat_max_turns = 4  # Máximo de turnos (2 do jogador + 2 do inimigo)
         self.dead_enemies = set()  # Inimigos mortos (para não redesenhar)
         
+        # Profiler de frame (F3 mostra o overlay); desativado não instrumenta nada
+        self.profiler = None
+        self.profile_csv = profile_csv
+        if profile_csv:
+            self.enable_profiler()
+        
+        # Primeiro quadro na tela: dispara o pré-carregamento (e encerra no benchmark de inicialização)
+        self.first_frame_presented = False
+        self.exit_after_first_frame = False
+        self.exit_after_startup = False
+        self.preloader = None
+    
+    def enable_startup_profiler(self):
+        """Cronometra as fases da abertura (inclusive as de dentro dos construtores)"""
+        from startup_profiler import StartupProfiler
+        profiler = StartupProfiler(origin=STARTUP_BEGAN)
+        profiler.add_phase("imports", STARTUP_BEGAN, IMPORTS_DONE)
+        profiler.instrument(Visualizer, self.STARTUP_VISUALIZER_METHODS)
+        profiler.instrument(ModernNinjaUI, ["__init__"])
+        profiler.instrument(NinjaMenuSystem, ["__init__"])
+        profiler.instrument(type(self), self.STARTUP_GAME_METHODS)
+        self.startup_profiler = profiler
+        return profiler
+    
+    def startup_phase(self, name):
+        """Fase do perfil de inicialização; sem perfil não mede nada"""
+        if self.startup_profiler is None:
+            return contextlib.nullcontext()
+        return self.startup_profiler.phase(name)
+    
+    def finish_startup_profile(self):
+        """Encerra o perfil de inicialização: cascata no console e JSON em disco"""
+        profiler = self.startup_profiler
+        if profiler is None:
+            return
+        self.startup_profiler = None
+        profiler.finish()
+        print(profiler.waterfall())
+        profiler.write_json(self.startup_profile)
+        logger.info("⏱️ Perfil de inicialização salvo em %s", self.startup_profile)
+    
+    def enable_profiler(self):
+        """Cronometra eventos, simulação, desenho e as etapas do draw_graph"""
+        from profiler import FrameProfiler
+        self.profiler = FrameProfiler()
+        self.profiler.instrument(self, ["handle_events", "update", "draw"])
+        self.profiler.instrument(self.visualizer, [
+            "draw_graph", "_draw_edges", "_draw_nodes", "_draw_enemies",
+            "_draw_professional_hud", "_draw_particle_effects",
+        ])
+        return self.profiler
+        
+    def enable_recording(self, path=None):
+        """Grava as entradas da sessão para replay (salvas em 'path' ao sair)"""
+        from replay import InputRecorder
+        self.record_path = path
+        return InputRecorder(self)
+    
     def handle_events(self):
         """Gerencia os eventos do jogo"""
         # Atualizar posição do mouse constantemente
@@ -92,16 +207,6 @@ class Game:
         # Gerenciar cursor do mouse baseado no hover
         self.update_cursor()
         
-        # Atualizar animação de movimento
-        if self.game_state == "playing":
-            self.update_movement_animation()
-            self.update_combat_animation()
-        
-        # Detectar combinações de teclas para movimento diagonal (apenas se não está em combate)
-        if self.game_state == "playing" and not self.is_in_combat():
-            keys = pygame.key.get_pressed()
-            self.handle_diagonal_movement(keys)
-        
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return False
@@ -109,6 +214,10 @@ class Game:
             # Processar eventos da UI moderna
             self.modern_ui.handle_event(event)
             
+            # Zoom (roda), pan (arrastar com botão direito ou do meio) e C para recentralizar
+            if self.game_state == "playing" and self.handle_camera_event(event):
+                continue
+            
             # Cliques do mouse no menu
             if event.type == pygame.MOUSEBUTTONDOWN and self.game_state == "menu":
                 action = self.menu_system.handle_click(event.pos)
@@ -118,6 +227,9 @@ class Game:
                     return False
                 
             if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_F3 and self.profiler:
+                    self.profiler.toggle_overlay()
+                
                 if event.key == pygame.K_ESCAPE:
                     if self.game_state == "playing":
                         self.goto_menu_with_transition()
@@ -141,7 +253,7 @@ class Game:
                         self.restart_level()
                     # Bloquear outros comandos durante combate
                     elif self.is_in_combat():
-                        print("⚔️ Comando bloqueado durante combate!")
+                        logger.debug("⚔️ Comando bloqueado durante combate!")
                         pass  # Simplesmente ignora o comando sem processar
                     elif event.key == pygame.K_SPACE:
                         self.show_optimal_path = not self.show_optimal_path
@@ -150,9 +262,9 @@ class Game:
                         if hasattr(self.visualizer, 'idle_sprites') and self.visualizer.idle_sprites:
                             self.visualizer.use_sprites = not self.visualizer.use_sprites
                             mode = "Sprites" if self.visualizer.use_sprites else "Desenho Vetorial"
-                            print(f"🎨 Modo alterado para: {mode}")
+                            logger.debug("🎨 Modo alterado para: %s", mode)
                         else:
-                            print("⚠️ Nenhum sprite encontrado para alternar")
+                            logger.warning("⚠️ Nenhum sprite encontrado para alternar")
                     
                     # Controles WASD para movimentação individual (apenas se não há diagonal)
                     elif event.key == pygame.K_w or event.key == pygame.K_UP:
@@ -178,7 +290,7 @@ class Game:
                             else:
                                 self.game_state = "menu"
                         else:
-                            print("Voce precisa de pelo menos 2 estrelas para avancar!")
+                            logger.warning("Voce precisa de pelo menos 2 estrelas para avancar!")
                     elif event.key == pygame.K_2 or event.key == pygame.K_r:
                         # Repetir nível para melhor pontuação
                         self.start_level(self.current_level)
@@ -190,11 +302,11 @@ class Game:
                 if self.game_state == "game_over":
                     if event.key == pygame.K_1 or event.key == pygame.K_SPACE:
                         # Recomeçar do nível 1
-                        self.player.reset_lives()
+                        self.reset_player_lives()
                         self.start_level(1)
                     elif event.key == pygame.K_2 or event.key == pygame.K_ESCAPE:
                         # Voltar ao menu
-                        self.player.reset_lives()
+                        self.reset_player_lives()
                         self.game_state = "menu"
                 
                 # Tela Final (jogo completo)
@@ -210,23 +322,24 @@ class Game:
                 if self.game_state == "playing":
                     # Bloquear movimento durante combate
                     if self.is_in_combat():
-                        print("⚔️ Clique bloqueado durante combate!")
+                        logger.debug("⚔️ Clique bloqueado durante combate!")
                         continue  # Usar continue para pular para o próximo evento
                         
                     clicked_node = self.get_clicked_node(pos)
                     if clicked_node is not None:
                         # Verifica se é um movimento válido antes de tentar
                         current = self.player.current_node
-                        print(f"🖱️ Clique detectado no nó {clicked_node} na posição {pos}")
+                        logger.debug("🖱️ Clique detectado no nó %s na posição %s", clicked_node, pos)
                         if clicked_node in self.world.graph.neighbors(current):
-                            print(f"✅ Movendo para no {clicked_node} via clique")
+                            logger.debug("✅ Movendo para no %s via clique", clicked_node)
                         else:
-                            print(f"❌ No {clicked_node} nao e vizinho de {current}! Vizinhos: {list(self.world.graph.neighbors(current))}")
+                            logger.debug("❌ No %s nao e vizinho de %s! Vizinhos: %s",
+                                         clicked_node, current, list(self.world.graph.neighbors(current)))
                         # Cliques diretos sempre bypassam confirmação (usuário foi explícito)
                         self.handle_node_click(clicked_node, bypass_confirmation=True)
                     else:
                         # Clique não atingiu nenhum nó
-                        print(f"❌ Clique na posição {pos} não atingiu nenhum nó válido")
+                        logger.debug("❌ Clique na posição %s não atingiu nenhum nó válido", pos)
                 
                 elif self.game_state == "menu":
                     if not self.handle_menu_click(pos):
@@ -246,36 +359,49 @@ class Game:
         
         return True
     
+    def handle_camera_event(self, event):
+        """Controles da câmera no nível; retorna True se o evento foi consumido"""
+        camera = self.visualizer.camera
+        if event.type == pygame.MOUSEWHEEL:
+            camera.zoom_at(camera.ZOOM_STEP ** event.y, self.mouse_pos)
+            return True
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button in (2, 3):
+            self.camera_drag = True
+            return True
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button in (4, 5):
+            return True  # Roda do mouse no formato antigo (já tratada pelo MOUSEWHEEL)
+        if event.type == pygame.MOUSEBUTTONUP and event.button in (2, 3):
+            self.camera_drag = False
+            return True
+        if event.type == pygame.MOUSEMOTION and self.camera_drag:
+            camera.pan(*event.rel)
+            return True
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_c:
+            camera.following = True
+            return True
+        return False
+    
     def get_clicked_node(self, pos):
         """Verifica qual nó foi clicado com detecção aprimorada"""
-        # Recalcula posições (mesmo código do visualizer)
-        node_positions = self.visualizer._calculate_node_positions(self.world.graph)
-        
-        closest_node = None
-        closest_distance = float('inf')
-        
-        # Encontra o nó mais próximo dentro do raio de clique
-        for node, node_pos in node_positions.items():
-            distance = math.sqrt((pos[0] - node_pos[0])**2 + (pos[1] - node_pos[1])**2)
-            
-            # Raio de detecção adaptativo baseado no tipo de nó
-            detection_radius = 35  # Raio base aumentado
-            if node == self.world.end_node:
-                detection_radius = 40  # Nó de saída maior
-            elif node in self.clicked_nodes:
-                detection_radius = 30  # Nós visitados
-            
-            if distance < detection_radius and distance < closest_distance:
-                closest_distance = distance
-                closest_node = node
-        
-        return closest_node
+        # Só os nós perto do clique (índice espacial do layout, pela câmera), do mais próximo ao mais distante
+        for distance, node in self.visualizer.nodes_at(self.world.graph, pos, 40):
+            if distance < self._detection_radius(node):
+                return node
+        return None
+    
+    def _detection_radius(self, node):
+        """Raio de detecção adaptativo baseado no tipo de nó"""
+        if node == self.world.end_node:
+            return 40  # Nó de saída maior
+        if node in self.clicked_nodes:
+            return 30  # Nós visitados
+        return 35  # Raio base aumentado
     
     def handle_node_click(self, node, bypass_confirmation=False):
         """Gerencia o clique em um nó"""
         # Bloquear cliques durante combate
         if self.is_in_combat():
-            print("⚔️ Clique bloqueado durante combate!")
+            logger.debug("⚔️ Clique bloqueado durante combate!")
             return
             
         current = self.player.current_node
@@ -286,32 +412,30 @@ class Game:
         
         # Verifica se o nó é vizinho
         if node in self.world.graph.neighbors(current):
-            print(f"✅ Movendo de {current} → {node}")
+            logger.debug("✅ Movendo de %s → %s", current, node)
             
             # Verifica se precisa de confirmação para movimento ambíguo (apenas para cliques, não teclas)
             if not bypass_confirmation and self.needs_movement_confirmation(current, node):
-                print(f"⚠️ Movimento ambíguo detectado, aguardando confirmação...")
+                logger.warning("⚠️ Movimento ambíguo detectado, aguardando confirmação...")
                 self.pending_move = (current, node)
-                self.move_confirmation_time = time.time()
+                self.move_confirmation_time = self.clock.now()
                 return
             
             # Executa movimento com animação
             self.execute_movement(current, node)
             self.clicked_nodes.add(node)
-            print(f"🚶 Iniciando movimento para nó {node}, meta é {self.world.end_node}")
+            logger.debug("🚶 Iniciando movimento para nó %s, meta é %s", node, self.world.end_node)
         else:
-            print(f"O no {node} nao e vizinho de {current}!")
+            logger.debug("O no %s nao e vizinho de %s!", node, current)
     
     def handle_diagonal_movement(self, keys):
         """Detecta e processa movimento diagonal usando combinações de teclas"""
-        import time
-        
         # Bloquear movimento durante combate
         if self.is_in_combat():
             return
         
         # Verifica cooldown para evitar movimentos repetidos
-        current_time = time.time()
+        current_time = self.clock.now()
         if current_time - self.last_move_time < self.move_cooldown:
             return
         
@@ -343,14 +467,12 @@ class Game:
     
     def move_player_diagonal_direction(self, direction):
         """Move o jogador na direção diagonal especificada"""
-        import time
-        
         # Bloquear movimento durante combate
         if self.is_in_combat():
-            print("⚔️ Movimento bloqueado durante combate!")
+            logger.debug("⚔️ Movimento bloqueado durante combate!")
             return
         
-        current_time = time.time()
+        current_time = self.clock.now()
         
         current = self.player.current_node
         neighbors = list(self.world.graph.neighbors(current))
@@ -413,8 +535,8 @@ class Game:
                 'southwest': 'Sudoeste ↙️ (S + A)',
                 'southeast': 'Sudeste ↘️ (S + D)'
             }
-            print(f"🎮 Movimento diagonal: {direction_names.get(direction, direction)} → Nó {best_node}")
-            print(f"📍 Nó atual: {self.player.current_node}, Destino: {best_node}, Meta: {self.world.end_node}")
+            logger.debug("🎮 Movimento diagonal: %s → Nó %s", direction_names.get(direction, direction), best_node)
+            logger.debug("📍 Nó atual: %s, Destino: %s, Meta: %s", self.player.current_node, best_node, self.world.end_node)
             
             self.handle_node_click(best_node, bypass_confirmation=True)
             self.last_move_time = current_time  # Atualiza o tempo do último movimento
@@ -425,7 +547,7 @@ class Game:
                 'southwest': 'Sudoeste ↙️ (S + A)', 
                 'southeast': 'Sudeste ↘️ (S + D)'
             }
-            print(f"❌ Nenhum nó disponível na direção {direction_names.get(direction, direction)}")
+            logger.debug("❌ Nenhum nó disponível na direção %s", direction_names.get(direction, direction))
     
     def is_diagonal_pressed(self):
         """Verifica se alguma combinação diagonal está sendo pressionada"""
@@ -446,15 +568,13 @@ class Game:
     
     def move_player_direction(self, direction):
         """Move o jogador na direção especificada (WASD) com lógica aprimorada"""
-        import time
-        
         # Bloquear movimento durante combate
         if self.is_in_combat():
-            print("⚔️ Movimento bloqueado durante combate!")
+            logger.debug("⚔️ Movimento bloqueado durante combate!")
             return
         
         # Verifica cooldown para evitar movimentos repetidos
-        current_time = time.time()
+        current_time = self.clock.now()
         if current_time - self.last_move_time < self.move_cooldown:
             return
         
@@ -517,11 +637,11 @@ class Game:
         
         # Move para o nó encontrado
         if best_node is not None:
-            print(f"⌨️ Movendo para nó {best_node} via tecla {direction.upper()}")
+            logger.debug("⌨️ Movendo para nó %s via tecla %s", best_node, direction.upper())
             self.handle_node_click(best_node, bypass_confirmation=True)
             self.last_move_time = current_time  # Atualiza o tempo do último movimento
         else:
-            print(f"Nenhum no encontrado na direcao {direction.upper()}!")
+            logger.debug("Nenhum no encontrado na direcao %s!", direction.upper())
     
     def start_level(self, level_id):
         """Inicia um novo nível"""
@@ -529,15 +649,20 @@ class Game:
         if level_id > 1:
             previous_level = level_id - 1
             if not self.player.can_advance_level(previous_level):
-                print(f"⚠️  Você precisa de pelo menos 2 estrelas no nível {previous_level} para acessar o nível {level_id}!")
+                logger.warning("⚠️  Você precisa de pelo menos 2 estrelas no nível %s para acessar o nível %s!",
+                               previous_level, level_id)
                 return
         
+        from world import World  # networkx só é necessário a partir do primeiro nível
+        
         self.current_level = level_id
-        self.world = World(level_id)
-        self.player.reset_level(self.world.start_node)
+        self.level_seed = self.level_rng.getrandbits(32)
+        self.world = World(level_id, clock=self.clock, seed=self.level_seed)
+        self.player.reset_level(self.world.start_node, LiveScore(self.world))
         # Garantir que o jogador sempre inicia com vida cheia
         self.player.health = self.player.max_health
         self.world.start_level()
+        self.arrival_times = [0.0]  # Instante de chegada em cada nó do caminho (para o verificador)
         self.game_state = "playing"
         
         # Resetar contador de inimigos enfrentados
@@ -571,17 +696,17 @@ class Game:
         
         if self.player.has_lives():
             self.player.lose_life()
-            print(f"🔄 Reiniciando fase... Vidas restantes: {self.player.lives}")
+            logger.info("🔄 Reiniciando fase... Vidas restantes: %s", self.player.lives)
             
             if self.player.has_lives():
                 # Reinicia o nível atual
                 self.start_level(self.current_level)
             else:
                 # Game Over
-                print("💀 GAME OVER - Sem vidas!")
+                logger.info("💀 GAME OVER - Sem vidas!")
                 self.game_state = "game_over"
         else:
-            print("Sem vidas para reiniciar!")
+            logger.debug("Sem vidas para reiniciar!")
     
     def handle_level_complete_click(self, pos):
         """Gerencia cliques na tela de level complete com botões de imagem"""
@@ -614,14 +739,14 @@ class Game:
     def start_combat(self, enemy_node):
         """Inicia o sistema de combate - verifica vida do jogador"""
         self.combat_node = enemy_node
-        self.combat_start_time = time.time()
+        self.combat_start_time = self.clock.now()
         
-        print(f"⚔️ Encontrou inimigo! Vida do jogador: {self.player.health}")
-        print(f"🔢 Inimigos enfrentados anteriormente: {self.enemies_fought}")
+        logger.debug("⚔️ Encontrou inimigo! Vida do jogador: %s", self.player.health)
+        logger.debug("🔢 Inimigos enfrentados anteriormente: %s", self.enemies_fought)
         
         # Se já enfrentou um inimigo ou tem pouca vida, morre instantaneamente
-        if self.enemies_fought >= 1 or self.player.health < 50:
-            print("💀 Segundo inimigo ou vida baixa! Morte instantânea!")
+        if is_instant_death(self.enemies_fought, self.player.health):
+            logger.debug("💀 Segundo inimigo ou vida baixa! Morte instantânea!")
             self.player.health = 0
             self.handle_player_death()
             return
@@ -630,21 +755,22 @@ class Game:
         self.enemies_fought += 1
         
         # Iniciar combate simultâneo se jogador tem vida suficiente
-        self.combat_enemy_health = 100
+        self.combat_enemy_health = ENEMY_HEALTH
         self.combat_player_initial_health = self.player.health
         
-        print(f"⚔️ COMBATE SIMULTÂNEO INICIADO!")
-        print(f"🧙 Vida do jogador: {self.player.health}")
-        print(f"👹 Vida do inimigo: {self.combat_enemy_health}")
+        logger.debug("⚔️ COMBATE SIMULTÂNEO INICIADO!")
+        logger.debug("🧙 Vida do jogador: %s", self.player.health)
+        logger.debug("👹 Vida do inimigo: %s", self.combat_enemy_health)
         
         # Combate simultâneo - ambos atacam ao mesmo tempo
         self.combat_state = "simultaneous_attack"
     
     def handle_player_death(self):
         """Lida com a morte do jogador"""
-        print("☠️ JOGADOR MORREU!")
+        logger.debug("☠️ JOGADOR MORREU!")
+        self.record_death("instant")
         self.game_state = "player_dead"
-        self.death_time = time.time()  # Para cronometrar a tela de morte
+        self.death_time = self.clock.now()  # Para cronometrar a tela de morte
     
     def update_combat_animation(self):
         """Atualiza a animação de combate simultâneo"""
@@ -653,11 +779,11 @@ class Game:
             
         # Proteção contra combate mal inicializado
         if not hasattr(self, 'combat_start_time'):
-            print("⚠️ Combate sem tempo de início - cancelando...")
+            logger.warning("⚠️ Combate sem tempo de início - cancelando...")
             self.combat_state = None
             return
             
-        elapsed = time.time() - self.combat_start_time
+        elapsed = self.clock.now() - self.combat_start_time
         
         if elapsed >= self.combat_duration:
             if self.combat_state == "simultaneous_attack":
@@ -671,72 +797,69 @@ class Game:
         """Aplica danos durante o combate simultâneo"""
         # Proteção contra combate mal inicializado
         if not hasattr(self, 'combat_player_initial_health'):
-            print("⚠️ Combate mal inicializado - cancelando...")
+            logger.warning("⚠️ Combate mal inicializado - cancelando...")
             self.combat_state = None
             return
             
-        # Jogador sempre perde METADE da vida ao passar por vértice com inimigo
-        player_damage = self.combat_player_initial_health // 2  # Metade da vida
-        
-        # Se jogador tem mais da metade da vida máxima, mata o inimigo
-        if self.combat_player_initial_health > (self.player.max_health // 2):
-            enemy_damage = 100  # Inimigo morre
-            print(f"⚔️ Jogador tem {self.combat_player_initial_health} vida! Perde metade ({player_damage}) mas mata o inimigo!")
+        # Jogador sempre perde METADE da vida; com mais da metade da vida máxima mata o inimigo
+        player_damage, enemy_damage = combat_damage(self.combat_player_initial_health, self.player.max_health)
+        if enemy_damage >= ENEMY_HEALTH:
+            logger.debug("⚔️ Jogador tem %s vida! Perde metade (%s) mas mata o inimigo!",
+                         self.combat_player_initial_health, player_damage)
         else:
             # Jogador tem metade ou menos da vida máxima - morre
-            player_damage = self.combat_player_initial_health  # Jogador morre
-            enemy_damage = 50
-            print(f"💀 Jogador tem apenas {self.combat_player_initial_health} vida! Não consegue derrotar o inimigo!")
+            logger.debug("💀 Jogador tem apenas %s vida! Não consegue derrotar o inimigo!",
+                         self.combat_player_initial_health)
         
         # Aplicar danos
         self.player.health = max(0, self.player.health - player_damage)
         self.combat_enemy_health = max(0, self.combat_enemy_health - enemy_damage)
         
-        print(f"💥 Danos aplicados:")
-        print(f"🧙 Jogador: {self.combat_player_initial_health} → {self.player.health} (-{player_damage})")
-        print(f"👹 Inimigo: 100 → {self.combat_enemy_health} (-{enemy_damage})")
+        logger.debug("💥 Danos aplicados:")
+        logger.debug("🧙 Jogador: %s → %s (-%s)", self.combat_player_initial_health, self.player.health, player_damage)
+        logger.debug("👹 Inimigo: 100 → %s (-%s)", self.combat_enemy_health, enemy_damage)
                 
     def _resolve_combat(self):
         """Resolve o resultado final do combate"""
-        print(f"🎯 Resolvendo combate - Vida restante: {self.player.health}")
+        logger.debug("🎯 Resolvendo combate - Vida restante: %s", self.player.health)
         
         # Determinar vencedor baseado em quem sobreviveu
         if self.combat_enemy_health <= 0 and self.player.health > 0:
             # Jogador venceu - inimigo desaparece imediatamente
-            print("🏆 VITÓRIA! Jogador derrotou o inimigo!")
+            logger.debug("🏆 VITÓRIA! Jogador derrotou o inimigo!")
             self.dead_enemies.add(self.combat_node)
-            print(f"🗡️ Removendo inimigo do nó {self.combat_node}...")
+            logger.debug("🗡️ Removendo inimigo do nó %s...", self.combat_node)
             self.world.remove_enemy(self.combat_node)
-            print(f"📋 Inimigos restantes: {list(self.world.enemies)}")
+            logger.debug("📋 Inimigos restantes: %s", list(self.world.enemies))
             # Finalizar combate imediatamente - sem animação de morte
             self.combat_state = None
             self.combat_node = None
-            print("✅ Combate finalizado - inimigo removido!")
+            logger.debug("✅ Combate finalizado - inimigo removido!")
             
         elif self.player.health <= 0:
             # Jogador morreu
-            print("💀 DERROTA! Jogador foi derrotado!")
+            logger.debug("💀 DERROTA! Jogador foi derrotado!")
+            self.record_death("combat")
             self.player.lives -= 1
             
             if self.player.lives <= 0:
-                print("☠️ Game Over - Todas as vidas perdidas!")
+                logger.debug("☠️ Game Over - Todas as vidas perdidas!")
                 self.combat_state = None
                 self.handle_game_over()
             else:
-                print(f"💔 Vida perdida! Vidas restantes: {self.player.lives}")
-                # Resetar jogador para posição inicial do nível
-                self.player.current_node = self.world.start_node
-                self.player.health = self.player.max_health  # Restaurar vida
+                logger.debug("💔 Vida perdida! Vidas restantes: %s", self.player.lives)
+                # Resetar jogador para posição inicial do nível (vida, caminho e custo)
+                self.respawn_player()
                 self.combat_state = None
                 self.combat_node = None
         
         elif self.combat_enemy_health <= 0:
             # Ambos morreram, mas inimigo morreu primeiro
-            print("🏆 Vitória por pouco! Ambos feridos, mas inimigo caiu primeiro!")
+            logger.debug("🏆 Vitória por pouco! Ambos feridos, mas inimigo caiu primeiro!")
             self.dead_enemies.add(self.combat_node)
-            print(f"🗡️ Removendo inimigo do nó {self.combat_node}...")
+            logger.debug("🗡️ Removendo inimigo do nó %s...", self.combat_node)
             self.world.remove_enemy(self.combat_node)
-            print(f"📋 Inimigos restantes: {list(self.world.enemies)}")
+            logger.debug("📋 Inimigos restantes: %s", list(self.world.enemies))
             # Finalizar combate imediatamente
             self.combat_state = None
             self.combat_node = None
@@ -744,32 +867,48 @@ class Game:
         else:
             # Ambos sobreviveram ou inimigo venceu - jogador deve morrer ou fugir
             if self.combat_enemy_health > 0:
-                print("💀 Inimigo ainda vivo! Jogador foi derrotado!")
+                logger.debug("💀 Inimigo ainda vivo! Jogador foi derrotado!")
                 self.player.health = 0  # Forçar morte do jogador
+                self.record_death("combat")
                 self.player.lives -= 1
                 
                 if self.player.lives <= 0:
-                    print("☠️ Game Over - Todas as vidas perdidas!")
+                    logger.debug("☠️ Game Over - Todas as vidas perdidas!")
                     self.combat_state = None
                     self.handle_game_over()
                 else:
-                    print(f"💔 Vida perdida! Vidas restantes: {self.player.lives}")
-                    # Resetar jogador para posição inicial do nível
-                    self.player.current_node = self.world.start_node
-                    self.player.health = self.player.max_health
+                    logger.debug("💔 Vida perdida! Vidas restantes: %s", self.player.lives)
+                    # Resetar jogador para posição inicial do nível (vida, caminho e custo)
+                    self.respawn_player()
                     self.combat_state = None
                     self.combat_node = None
             else:
                 # Caso impossível, mas tratando como empate
-                print("🤝 Situação inesperada resolvida.")
+                logger.debug("🤝 Situação inesperada resolvida.")
                 self.combat_state = None
                 self.combat_node = None
     
+    def respawn_player(self):
+        """Volta o jogador ao início do nível depois de perder uma vida"""
+        # LiveScore e caminho recomeçam no início; sem isso o próximo passo somaria uma aresta
+        # a partir do nó do combate
+        self.player.reset_level(self.world.start_node, self.player.score)
+        self.arrival_times = [0.0]  # Os tempos continuam contados do início do nível
+    
+    def record_death(self, cause):
+        """Registra a morte no histórico de partidas"""
+        if self.run_history:
+            self.run_history.record_death(self.player.name, self.current_level, self.player.current_node, cause)
+    
     def handle_game_over(self):
         """Gerencia quando o jogador morre"""
-        print("💀 Game Over - Transicionando para tela de fim de jogo...")
+        logger.info("💀 Game Over - Transicionando para tela de fim de jogo...")
         self.goto_game_over_with_transition()
     
+    def reset_player_lives(self):
+        """Restaura as vidas do jogador (entrada gravada pelo replay.InputRecorder)"""
+        self.player.reset_lives()
+    
     def handle_game_over_click(self, pos):
         """Gerencia cliques na tela de game over"""
         # Coordenadas dos botões
@@ -779,12 +918,12 @@ class Game:
         
         # Botão 1: Recomeçar (y = 420)
         if button_x <= pos[0] <= button_x + button_width and 420 <= pos[1] <= 420 + button_height:
-            self.player.reset_lives()
+            self.reset_player_lives()
             self.start_level_with_transition(1)
         
         # Botão 2: Menu (y = 490)
         elif button_x <= pos[0] <= button_x + button_width and 490 <= pos[1] <= 490 + button_height:
-            self.player.reset_lives()
+            self.reset_player_lives()
             self.goto_menu_with_transition()
     
     def handle_game_final_click(self, pos):
@@ -876,11 +1015,11 @@ class Game:
         """Executa o movimento com animação"""
         # Bloquear movimento durante combate
         if self.is_in_combat():
-            print("⚔️ Movimento bloqueado durante combate!")
+            logger.debug("⚔️ Movimento bloqueado durante combate!")
             return
             
         self.is_moving = True
-        self.move_start_time = time.time()
+        self.move_start_time = self.clock.now()
         self.move_from_node = from_node
         self.move_to_node = to_node
     
@@ -888,28 +1027,28 @@ class Game:
         """Atualiza a animação de movimento"""
         if not self.is_moving:
             # Verifica timeout de confirmação
-            if self.pending_move and time.time() - self.move_confirmation_time > self.confirmation_timeout:
+            if self.pending_move and self.clock.now() - self.move_confirmation_time > self.confirmation_timeout:
                 self.pending_move = None
             return
             
-        current_time = time.time()
-        elapsed = current_time - self.move_start_time
+        elapsed = self.clock.now() - self.move_start_time
         
         if elapsed >= self.move_duration:
             # Animação completa
             self.player.move_to_node(self.move_to_node)
+            self.arrival_times.append(self.clock.now() - self.world.start_time)
             self.is_moving = False
             
             # Verifica se há inimigo no nó de destino
             if self.world.has_enemy(self.move_to_node):
-                print(f"⚔️ Encontrou um inimigo no nó {self.move_to_node}!")
+                logger.debug("⚔️ Encontrou um inimigo no nó %s!", self.move_to_node)
                 self.start_combat(self.move_to_node)
                 return
             
             # Verifica se chegou ao destino
             if self.move_to_node == self.world.end_node:
-                print(f"🎉 VITÓRIA! Chegou ao nó final {self.move_to_node}! Estado atual: {self.game_state}")
-                print(f"🛤️ Caminho percorrido: {self.player.path_taken}")
+                logger.info("🎉 VITÓRIA! Chegou ao nó final %s! Estado atual: %s", self.move_to_node, self.game_state)
+                logger.debug("🛤️ Caminho percorrido: %s", self.player.path_taken)
                 
                 # Tocar som de vitória
                 self.visualizer.play_victory_sound()
@@ -917,15 +1056,16 @@ class Game:
                 if self.game_state == "playing":  # Só completa se ainda estiver jogando
                     self.complete_level()
                 else:
-                    print(f"⚠️ Tentativa de completar nível mas jogo não está no estado 'playing': {self.game_state}")
+                    logger.warning("⚠️ Tentativa de completar nível mas jogo não está no estado 'playing': %s",
+                                   self.game_state)
     
     def get_animated_player_position(self):
         """Retorna a posição animada do jogador durante o movimento"""
         if not self.is_moving:
             return None
             
-        # Calcula interpolação
-        elapsed = time.time() - self.move_start_time
+        # Calcula interpolação (tempo de renderização, entre dois passos da simulação)
+        elapsed = self.clock.render_time() - self.move_start_time
         progress = min(1.0, elapsed / self.move_duration)
         
         # Easing function (suaviza a animação)
@@ -980,24 +1120,26 @@ class Game:
     def update_cursor(self):
         """Atualiza o cursor do mouse baseado no hover dos botões"""
         if hasattr(self.visualizer, 'hovered_button') and self.visualizer.hovered_button:
-            pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
+            cursor = pygame.SYSTEM_CURSOR_HAND
         else:
-            pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+            cursor = pygame.SYSTEM_CURSOR_ARROW
+        self.visualizer.set_cursor(cursor)
     
     def complete_level(self):
         """Completa o nível atual"""
-        print(f"COMPLETE_LEVEL chamado! Estado: {self.game_state}")
-        print(f"Posicao atual do jogador: {self.player.current_node}")
-        print(f"No final: {self.world.end_node}")
+        logger.debug("COMPLETE_LEVEL chamado! Estado: %s | Posicao atual do jogador: %s | No final: %s",
+                     self.game_state, self.player.current_node, self.world.end_node)
         
-        results = self.world.complete_level(self.player.path_taken)
+        # Sem LiveScore (jogador montado fora de start_level) o World soma o custo pelo caminho
+        score = self.player.score
+        results = self.world.complete_level(self.player.path_taken, score.cost if score is not None else None)
         
         # Calcula estrelas baseado na eficiência
         efficiency = results.get("efficiency", 0)
         stars = self.player.calculate_stars(efficiency)
         
         # Debug: mostra os valores calculados
-        print(f"Debug - Eficiencia: {efficiency:.3f} ({efficiency*100:.1f}%) | Estrelas: {stars}")
+        logger.debug("Debug - Eficiencia: %.3f (%.1f%%) | Estrelas: %s", efficiency, efficiency * 100, stars)
         
         # Atualiza as estrelas do jogador para este nível
         self.player.update_level_stars(self.current_level, stars)
@@ -1007,7 +1149,14 @@ class Game:
         if stars > current_stars:
             self.stars_earned[self.current_level] = stars
             self.save_star_progress()
-            print(f"⭐ Novo recorde de estrelas no nível {self.current_level}: {stars} estrelas!")
+            logger.info("⭐ Novo recorde de estrelas no nível %s: %s estrelas!", self.current_level, stars)
+        
+        # Registra a partida no histórico e atualiza o melhor tempo do nível
+        if self.run_history:
+            self.run_history.record_run(self.player.name, results, self.player.path_taken, stars)
+        best_time = self.player.best_times.get(self.current_level)
+        if best_time is None or results["time_taken"] < best_time:
+            self.player.best_times[self.current_level] = results["time_taken"]
         
         # Adiciona informações de estrelas aos resultados
         results["stars_earned"] = stars
@@ -1034,43 +1183,46 @@ class Game:
         input("Pressione ENTER para voltar ao menu...")
     
     def update(self):
-        """Atualiza o estado do jogo"""
+        """Avança a simulação em exatamente um passo fixo (clock.step_dt)"""
         # Atualizar UI moderna
-        dt = pygame.time.get_ticks() * 0.001  # Converter para segundos
-        self.modern_ui.update(dt)
-        
-        # Atualizar vídeo de fundo se estivermos no menu
-        if self.game_state == "menu":
-            self.update_video_background()
+        self.modern_ui.update(self.clock.step_dt)
         
         # Atualizar transições
         self.visualizer.update_transition()
         
-        # Atualiza animação de movimento se estiver ativa
-        if self.is_moving:
+        # Atualizar animações de movimento e combate (uma vez por passo)
+        if self.game_state == "playing":
             self.update_movement_animation()
+            self.update_combat_animation()
+        
+        # Sem teclado nem mouse no modo headless ou em replay: entradas chegam pela API de movimento
+        if self.headless or self.replaying:
+            return
+        
+        # Detectar combinações de teclas para movimento diagonal (apenas se não está em combate)
+        if self.game_state == "playing" and not self.is_in_combat():
+            keys = pygame.key.get_pressed()
+            self.handle_diagonal_movement(keys)
         
         # Detectar hover apenas durante o jogo
         if self.game_state == "playing" and self.world:
             self.detect_hovered_node()
     
+    def step(self, steps=1):
+        """Avança a simulação N passos fixos sem depender do tempo real (headless e testes)"""
+        for _ in range(steps):
+            self.clock.step()
+            self.update()
+    
+    def advance(self, seconds):
+        """Avança a simulação pelo tempo virtual indicado"""
+        self.step(self.clock.seconds_to_steps(seconds))
+    
     def detect_hovered_node(self):
         """Detecta qual nó está sendo 'hovered' pelo mouse"""
         self.hovered_node = None
-        # Usa o método do visualizer para calcular posições
-        node_positions = self.visualizer._calculate_node_positions(self.world.graph)
-        
-        for node_id, pos in node_positions.items():
-            distance = math.sqrt((self.mouse_pos[0] - pos[0])**2 + (self.mouse_pos[1] - pos[1])**2)
-            
-            # Raio de detecção adaptativo (mesmo que clique)
-            detection_radius = 35
-            if node_id == self.world.end_node:
-                detection_radius = 40
-            elif node_id in self.clicked_nodes:
-                detection_radius = 30
-            
-            if distance <= detection_radius:
+        for distance, node_id in self.visualizer.nodes_at(self.world.graph, self.mouse_pos, 40):
+            if distance <= self._detection_radius(node_id):  # Mesmo raio do clique
                 self.hovered_node = node_id
                 break
     
@@ -1104,7 +1256,9 @@ class Game:
             self.visualizer.draw_game_over(self.player)
         
         elif self.game_state == "game_final":
-            self.visualizer.draw_game_final(self.get_final_stats())
+            if self.final_stats is None:
+                self.final_stats = self.get_final_stats()
+            self.visualizer.draw_game_final(self.final_stats)
         
         # Desenhar UI moderna por cima (temporariamente desabilitado)
         # self.modern_ui.draw(self.visualizer.screen)
@@ -1112,12 +1266,15 @@ class Game:
         # Aplicar efeito de transição se ativo
         self.visualizer.apply_transition_effect()
         
+        if self.profiler:
+            self.profiler.draw_overlay(self.visualizer.screen)
+        
         # Atualizar display apenas uma vez por frame
-        pygame.display.flip()
+        self.present_frame()
     
     def run(self):
-        """Loop principal do jogo"""
-        clock = pygame.time.Clock()
+        """Loop principal do jogo (simulação em passo fixo, renderização independente)"""
+        frame_clock = pygame.time.Clock()
         running = True
         
         print("""
@@ -1127,22 +1284,54 @@ class Game:
         ╚════════════════════════════════════════╝
         """)
         
+        # Tela de carregamento enquanto os assets são lidos em segundo plano
+        running = self.run_loading_screen(frame_clock)
+        
         while running:
+            if self.profiler:
+                self.profiler.begin_frame()
+            self.clock.begin_frame()
             running = self.handle_events()
-            self.update()
+            
+            # Executa quantos passos fixos couberem no tempo real decorrido
+            while self.clock.consume_step():
+                self.update()
+            
+            # Renderiza com interpolação (clock.alpha) - sem limite, com vsync ou limitado
             self.draw()
-            clock.tick(60)
+            if self.startup_profiler:
+                # Primeiro quadro do menu depois do carregamento: fim da inicialização
+                self.startup_profiler.mark("menu_ready")
+                self.finish_startup_profile()
+                running = running and not self.exit_after_startup
+            if self.frame_limit:
+                frame_clock.tick(self.frame_limit)
+            if self.profiler:
+                self.profiler.end_frame()
         
         # Parar música de fundo antes de sair
         self.visualizer.stop_background_music()
         
-        # Limpar recursos de vídeo
-        if self.video_cap:
-            self.video_cap.release()
+        # Parar as threads de vídeo
+        if self.video_player:
+            self.video_player.stop()
         
         # Limpar vídeo final
-        if hasattr(self.visualizer, 'final_video_cap') and self.visualizer.final_video_cap:
-            self.visualizer.final_video_cap.release()
+        if hasattr(self.visualizer, 'final_video_player') and self.visualizer.final_video_player:
+            self.visualizer.final_video_player.stop()
+        self.visualizer.assets.shutdown()
+        
+        # Garante que o último progresso chegou ao disco
+        if self.progress_store:
+            self.progress_store.close()
+        if self.run_history:
+            self.run_history.close()
+        
+        if self.profiler:
+            self.profiler.dump_csv(self.profile_csv)
+        if self.input_recorder and self.record_path:
+            self.input_recorder.save(self.record_path)
+            logger.info("🎬 Sessão gravada em %s", self.record_path)
         
         pygame.quit()
         print("\n👋 Obrigado por jogar PathFinder Adventure!\n")
@@ -1193,7 +1382,7 @@ class Game:
         """Executa avanço de nível após transição"""
         self.current_level += 1
         if self.current_level > 20:
-            print("🎉 PARABÉNS! Você completou todos os níveis!")
+            logger.info("🎉 PARABÉNS! Você completou todos os níveis!")
             self.game_state = "menu"
         else:
             self.start_level(self.current_level)
@@ -1209,73 +1398,92 @@ class Game:
         """Executa ida para tela final após transição"""
         self.game_state = "game_final"
         self.clicked_nodes = set()
-        print("🎉 PARABÉNS! Você completou todos os 20 níveis!")
+        # Uma consulta ao histórico na entrada, não a cada quadro desenhado
+        self.final_stats = self.get_final_stats()
+        logger.info("🎉 PARABÉNS! Você completou todos os 20 níveis!")
+    
+    def present_frame(self):
+        """Mostra o quadro desenhado; no primeiro começa a importar os módulos pesados"""
+        pygame.display.flip()
+        if self.first_frame_presented:
+            return
+        self.first_frame_presented = True
+        if self.startup_profiler:
+            self.startup_profiler.mark("first_frame")
+        if self.exit_after_first_frame:
+            self.finish_startup_profile()
+            # Marcador lido pelo startup_benchmark.py, que mede o tempo até aqui
+            print("FIRST_FRAME", flush=True)
+            pygame.quit()
+            sys.exit()
+        self.preloader = ModulePreloader(self.PRELOAD_MODULES).start()
+    
+    def run_loading_screen(self, frame_clock):
+        """Mostra o progresso do carregamento de assets; retorna False se o jogador fechou a janela"""
+        assets = self.visualizer.assets
+        while not assets.pump():
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    return False
+            self.visualizer.draw_loading_screen(assets.progress)
+            self.present_frame()
+            frame_clock.tick(60)
+        
+        self.visualizer.finish_loading()
+        return True
     
     def load_video_background(self):
         """Carrega o vídeo de fundo para o menu"""
         try:
-            import os
             video_path = "videos/Math.mp4"
-            if os.path.exists(video_path):
-                self.video_cap = cv2.VideoCapture(video_path)
-                print(f"🎥 Vídeo background carregado: {video_path}")
-                
-                # Configurar loop do vídeo
-                self.video_frame_count = int(self.video_cap.get(cv2.CAP_PROP_FRAME_COUNT))
-                self.video_fps = self.video_cap.get(cv2.CAP_PROP_FPS)
-                self.video_current_frame = 0
-                
-                print(f"🎬 Vídeo: {self.video_frame_count} frames, {self.video_fps} FPS")
+            size = (self.visualizer.width, self.visualizer.height)
+            self.video_player = open_video(video_path, size, use_cache=self.video_cache)
+            if self.video_player:
+                logger.info("🎥 Vídeo background carregado: %s", video_path)
             else:
-                print(f"⚠️ Vídeo não encontrado: {video_path}")
-                self.video_cap = None
+                logger.warning("⚠️ Vídeo não encontrado: %s", video_path)
         except Exception as e:
-            print(f"❌ Erro ao carregar vídeo: {e}")
-            self.video_cap = None
+            logger.error("❌ Erro ao carregar vídeo: %s", e)
+            self.video_player = None
     
     def load_star_progress(self):
         """Carrega o progresso de estrelas do arquivo"""
         try:
-            import json
-            import os
-            
-            save_file = "star_progress.json"
-            if os.path.exists(save_file):
-                with open(save_file, 'r') as f:
-                    data = json.load(f)
-                    self.stars_earned = {int(k): v for k, v in data.get('stars_earned', {}).items()}
-                    saved_level = data.get('current_level', 1)
-                    
-                    # Calcular o maior nível acessível baseado nas estrelas
-                    highest_accessible = self.get_highest_accessible_level()
-                    
-                    # Usar o menor entre: nível salvo ou maior acessível
-                    # Isso garante que não tente acessar nível sem estrelas suficientes
-                    self.current_level = min(saved_level, highest_accessible)
-                        
-                print(f"⭐ Progresso carregado: {self.get_total_stars_earned()}/{self.total_possible_stars} estrelas")
-                print(f"📍 Checkpoint: Nível {self.current_level}")
+            data = self.progress_store.load()
+            if data is not None:
+                self.stars_earned = {int(k): v for k, v in data.get('stars_earned', {}).items()}
+                saved_level = data.get('current_level', 1)
+                
+                # Calcular o maior nível acessível baseado nas estrelas
+                highest_accessible = self.get_highest_accessible_level()
+                
+                # Usar o menor entre: nível salvo ou maior acessível
+                # Isso garante que não tente acessar nível sem estrelas suficientes
+                self.current_level = min(saved_level, highest_accessible)
+                
+                logger.info("⭐ Progresso carregado: %s/%s estrelas", self.get_total_stars_earned(), self.total_possible_stars)
+                logger.info("📍 Checkpoint: Nível %s", self.current_level)
             else:
-                print("🎮 Novo jogo - progresso zerado")
+                logger.info("🎮 Novo jogo - progresso zerado")
         except Exception as e:
-            print(f"⚠️ Erro ao carregar progresso: {e}")
+            logger.error("⚠️ Erro ao carregar progresso: %s", e)
             self.stars_earned = {}
     
     def save_star_progress(self):
-        """Salva o progresso de estrelas no arquivo"""
+        """Agenda a gravação do progresso de estrelas (feita em segundo plano pelo ProgressStore)"""
+        if not self.persist_progress:
+            return
+        
         try:
-            import json
-            
             data = {
                 'stars_earned': self.stars_earned,
                 'current_level': self.current_level
             }
             
-            with open("star_progress.json", 'w') as f:
-                json.dump(data, f)
-            print(f"💾 Progresso salvo: {self.get_total_stars_earned()}/{self.total_possible_stars} estrelas")
+            self.progress_store.save(data)
+            logger.info("💾 Progresso salvo (em segundo plano): %s/%s estrelas", self.get_total_stars_earned(), self.total_possible_stars)
         except Exception as e:
-            print(f"⚠️ Erro ao salvar progresso: {e}")
+            logger.error("⚠️ Erro ao salvar progresso: %s", e)
     
     def get_total_stars_earned(self):
         """Retorna o total de estrelas conquistadas"""
@@ -1291,7 +1499,10 @@ class Game:
         efficiency_sum = 0
         efficiency_count = 0
         
-        # Calcular eficiência média (aproximada baseada nas estrelas)
+        # Eficiência média real (melhor partida de cada nível) quando há histórico
+        recorded_efficiency = self.run_history.average_efficiency(self.player.name) if self.run_history else None
+        
+        # Sem histórico: eficiência média aproximada baseada nas estrelas
         for level_id, stars in self.stars_earned.items():
             if stars == 3:
                 efficiency_sum += 95  # Aproximadamente 95% para 3 estrelas
@@ -1302,6 +1513,8 @@ class Game:
             efficiency_count += 1
         
         avg_efficiency = efficiency_sum / max(efficiency_count, 1)
+        if recorded_efficiency is not None:
+            avg_efficiency = recorded_efficiency * 100
         
         return {
             "total_stars": total_stars,
@@ -1332,27 +1545,16 @@ class Game:
         return highest_level
 
     def update_video_background(self):
-        """Atualiza o frame do vídeo de fundo"""
-        if self.video_cap is None:
+        """Pega o frame do vídeo de fundo correspondente ao tempo atual (nunca bloqueia)"""
+        if self.video_player is None:
             return
             
         try:
-            ret, frame = self.video_cap.read()
-            if not ret:
-                # Reiniciar vídeo quando chegar ao final
-                self.video_cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-                ret, frame = self.video_cap.read()
-            
-            if ret:
-                # Converter BGR (OpenCV) para RGB (Pygame)
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                # Redimensionar para o tamanho da tela
-                frame = cv2.resize(frame, (self.visualizer.width, self.visualizer.height))
-                # Converter para superficie pygame
-                self.video_frame = pygame.surfarray.make_surface(frame.swapaxes(0, 1))
-                
+            frame = self.video_player.get_frame(self.clock.render_time())
+            if frame is not None:
+                self.video_frame = frame
         except Exception as e:
-            print(f"❌ Erro ao atualizar vídeo: {e}")
+            logger.error("❌ Erro ao atualizar vídeo: %s", e)
     
     def draw_star_counter(self):
         """Desenha o contador de estrelas no menu principal"""
@@ -1405,12 +1607,50 @@ class Game:
 
     def draw_video_background(self):
         """Desenha o vídeo de fundo sem overlay"""
+        self.update_video_background()
         if self.video_frame:
             self.visualizer.screen.blit(self.video_frame, (0, 0))
         else:
             # Fallback: usar fundo ninja quando vídeo não está disponível
             self.visualizer.draw_ninja_background()
 
+def parse_args(argv=None):
+    """Lê as opções de linha de comando do jogo"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="PathFinder Adventure")
+    parser.add_argument("--fps", type=int, default=60,
+                        help="Limite de FPS da renderização (0 = sem limite)")
+    parser.add_argument("--vsync", action="store_true",
+                        help="Sincroniza a renderização com o monitor (desativa o limite de FPS)")
+    parser.add_argument("--video-cache", action="store_true",
+                        help="Usa vídeos de fundo pré-transcodificados em cache/ (gera na primeira execução)")
+    parser.add_argument("--log-level", default="WARNING", type=str.upper,
+                        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+                        help="Nível mínimo das mensagens de log (DEBUG mostra cada movimento e combate)")
+    parser.add_argument("--log-file", default=None, metavar="ARQUIVO",
+                        help="Grava o log também neste arquivo")
+    parser.add_argument("--record", default=None, metavar="ARQUIVO",
+                        help="Grava as entradas da sessão para replay (python replay.py ARQUIVO)")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Semente da sessão (posição dos inimigos sorteados)")
+    parser.add_argument("--profile", nargs="?", const="profile_frames.csv", default=None, metavar="CSV",
+                        help="Mede o tempo de cada etapa do frame (F3 mostra o overlay) e grava um CSV ao sair")
+    parser.add_argument("--first-frame-exit", action="store_true",
+                        help="Sai logo após mostrar o primeiro quadro (usado pelo startup_benchmark.py)")
+    parser.add_argument("--startup-profile", nargs="?", const="startup_profile.json", default=None, metavar="JSON",
+                        help="Mostra a cascata das fases da inicialização e grava os tempos em JSON")
+    parser.add_argument("--exit-after-startup", action="store_true",
+                        help="Sai quando o menu fica pronto (para medir a inicialização completa)")
+    return parser.parse_args(argv)
+
 if __name__ == "__main__":
-    game = Game()
+    args = parse_args()
+    setup_logging(args.log_level, args.log_file)
+    game = Game(frame_limit=0 if args.vsync else args.fps, vsync=args.vsync, video_cache=args.video_cache,
+                profile_csv=args.profile, seed=args.seed, startup_profile=args.startup_profile)
+    if args.record:
+        game.enable_recording(args.record)
+    game.exit_after_first_frame = args.first_frame_exit
+    game.exit_after_startup = args.exit_after_startup
     game.run()
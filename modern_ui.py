@@ -5,6 +5,9 @@ Implementa interfaces elegantes e responsivas para o jogo ninja
 
 import pygame
 import math
+import numpy as np
+import backgrounds
+from particles import ParticleSystem, StampSet
 
 class ModernNinjaUI:
     def __init__(self, width, height):
@@ -26,77 +29,56 @@ class ModernNinjaUI:
         
         # Elementos da UI
         self.elements = {}
-        self.particles = []
+        self.particles = None  # ParticleSystem criado no primeiro uso
+        self._rng = np.random.default_rng()
         self.animations = {}
         
 
     
     def create_glass_effect(self, surface, rect, alpha=150):
         """Cria efeito de vidro fosco ninja"""
-        glass_surface = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-        
-        # Gradiente de vidro
-        for y in range(rect.height):
-            alpha_val = alpha - (y * alpha // rect.height // 3)
-            color = (*self.colors['bg_secondary'], alpha_val)
-            pygame.draw.line(glass_surface, color, (0, y), (rect.width, y))
-        
-        # Borda brilhante
-        pygame.draw.rect(glass_surface, (*self.colors['accent_gold'], 100), 
-                        glass_surface.get_rect(), 2)
-        
+        # Gradiente de vidro e borda brilhante pré-calculados por tamanho e paleta
+        glass_surface = backgrounds.glass_panel(
+            (rect.width, rect.height), self.colors['bg_secondary'], alpha,
+            border_color=(*self.colors['accent_gold'], 100)
+        )
         surface.blit(glass_surface, rect)
         
+    def _create_particle_system(self):
+        """Partículas ninja vetorizadas: tipo 0 = estrela ninja, tipo 1 = fumaça"""
+        gold = self.colors['accent_gold']
+        steel = self.colors['ninja_steel']
+        
+        # Estrela de 8 pontas centrada em (10, 10), calculada uma única vez
+        star_points = [
+            (10 + math.cos(i * math.pi / 4) * (3 if i % 2 == 0 else 1.5),
+             10 + math.sin(i * math.pi / 4) * (3 if i % 2 == 0 else 1.5))
+            for i in range(8)
+        ]
+        star = StampSet((20, 20), lambda stamp, alpha: pygame.draw.polygon(stamp, (*gold, alpha), star_points))
+        smoke = StampSet((10, 10), lambda stamp, alpha: pygame.draw.circle(stamp, (*steel, alpha // 2), (5, 5), 5))
+        return ParticleSystem([star, smoke])
+    
     def create_ninja_particle_system(self, surface, center, count=20):
         """Sistema de partículas ninja (estrelas ninja, fumaça)"""
+        if self.particles is None:
+            self.particles = self._create_particle_system()
         current_time = pygame.time.get_ticks()
         
         # Adicionar novas partículas
         if len(self.particles) < count:
-            for _ in range(3):
-                import random
-                particle = {
-                    'x': center[0] + (math.cos(current_time * 0.001) * 50),
-                    'y': center[1] + (math.sin(current_time * 0.001) * 50),
-                    'vx': (random.random() - 0.5) * 2,
-                    'vy': (random.random() - 0.5) * 2,
-                    'life': 255,
-                    'type': 'ninja_star' if random.random() > 0.7 else 'smoke'
-                }
-                self.particles.append(particle)
+            spawn = 3
+            self.particles.emit(
+                center[0] + math.cos(current_time * 0.001) * 50,
+                center[1] + math.sin(current_time * 0.001) * 50,
+                (self._rng.random(spawn) - 0.5) * 2,
+                (self._rng.random(spawn) - 0.5) * 2,
+                kind=np.where(self._rng.random(spawn) > 0.7, 0, 1),  # 30% estrelas ninja
+            )
         
         # Atualizar e desenhar partículas
-        for particle in self.particles[:]:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['life'] -= 3
-            
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
-                continue
-                
-            alpha = max(0, particle['life'])
-            
-            if particle['type'] == 'ninja_star':
-                # Desenhar estrela ninja
-                points = []
-                for i in range(8):
-                    angle = i * math.pi / 4
-                    radius = 3 if i % 2 == 0 else 1.5
-                    px = particle['x'] + math.cos(angle) * radius
-                    py = particle['y'] + math.sin(angle) * radius
-                    points.append((px, py))
-                
-                star_surface = pygame.Surface((20, 20), pygame.SRCALPHA)
-                pygame.draw.polygon(star_surface, (*self.colors['accent_gold'], alpha), 
-                                  [(p[0]-particle['x']+10, p[1]-particle['y']+10) for p in points])
-                surface.blit(star_surface, (particle['x']-10, particle['y']-10))
-            else:
-                # Desenhar fumaça
-                smoke_surface = pygame.Surface((10, 10), pygame.SRCALPHA)
-                pygame.draw.circle(smoke_surface, (*self.colors['ninja_steel'], alpha//2), 
-                                 (5, 5), 5)
-                surface.blit(smoke_surface, (particle['x']-5, particle['y']-5))
+        self.particles.update(decay=3)
+        self.particles.draw(surface)
     
     def draw_ninja_border(self, surface, rect, thickness=3):
         """Desenha borda ninja com efeitos especiais"""
@@ -300,27 +282,21 @@ class NinjaMenuSystem:
         
     def _draw_ninja_background(self, surface):
         """Desenha fundo ninja com efeitos"""
-        # Gradiente de fundo
-        for y in range(self.height):
-            ratio = y / self.height
-            color = self.ui._blend_colors(
-                self.ui.colors['bg_primary'],
-                (self.ui.colors['bg_primary'][0] + 15, 
-                 self.ui.colors['bg_primary'][1] + 15, 
-                 self.ui.colors['bg_primary'][2] + 20),
-                ratio
-            )
-            pygame.draw.line(surface, color, (0, y), (self.width, y))
+        # Gradiente de fundo (pré-calculado)
+        primary = self.ui.colors['bg_primary']
+        gradient = backgrounds.vertical_gradient(
+            (self.width, self.height), primary, (primary[0] + 15, primary[1] + 15, primary[2] + 20)
+        )
+        surface.blit(gradient, (0, 0))
         
-        # Padrão ninja sutil
+        # Padrão ninja sutil (mesmo anel, só a transparência pulsa)
         current_time = pygame.time.get_ticks()
+        ring = backgrounds.ring_stamp(25, self.ui.colors['accent_gold'], 2)
         for i in range(0, self.width, 100):
             for j in range(0, self.height, 100):
-                import random
                 alpha = int(30 + 20 * math.sin(current_time * 0.001 + i * 0.01 + j * 0.01))
-                ninja_surface = pygame.Surface((50, 50), pygame.SRCALPHA)
-                pygame.draw.circle(ninja_surface, (*self.ui.colors['accent_gold'], alpha), (25, 25), 25, 2)
-                surface.blit(ninja_surface, (i, j))
+                ring.set_alpha(alpha)
+                surface.blit(ring, (i, j))
     
     def handle_click(self, pos):
         """Processa cliques nos botões"""
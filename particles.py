@@ -0,0 +1,121 @@
+"""
+Sistema de partículas vetorizado
+Posição, velocidade, vida e tipo ficam em arrays NumPy (estrutura de arrays); a
+atualização é feita de uma vez para todas as partículas, as mortas são removidas por
+troca com as últimas vivas e o desenho usa imagens pré-renderizadas com Surface.blits
+"""
+import numpy as np
+import pygame
+
+
+class StampSet:
+    """Uma imagem pré-renderizada da partícula para cada nível de transparência"""
+
+    def __init__(self, size, draw, levels=32):
+        self.size = size
+        self.offset = np.array([size[0] // 2, size[1] // 2])
+        self.levels = levels
+        self.surfaces = []
+        for level in range(levels):
+            alpha = round(level * 255 / (levels - 1))
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            draw(surface, alpha)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha()
+            self.surfaces.append(surface)
+
+    def level_for(self, alphas):
+        """Nível de transparência (índice em surfaces) para cada alpha 0-255"""
+        alphas = np.clip(np.asarray(alphas, dtype=np.float32), 0, 255)
+        return np.rint(alphas * (self.levels - 1) / 255).astype(np.int32)
+
+
+def blit_stamps(surface, stamps, xs, ys, alphas):
+    """Desenha uma imagem da StampSet centrada em cada (x, y), com uma chamada a blits"""
+    levels = stamps.level_for(alphas)
+    visible = levels > 0
+    if not visible.any():
+        return
+    xs = (np.asarray(xs)[visible] - stamps.offset[0]).astype(np.int32).tolist()
+    ys = (np.asarray(ys)[visible] - stamps.offset[1]).astype(np.int32).tolist()
+    images = stamps.surfaces
+    surface.blits([(images[level], (x, y)) for level, x, y in zip(levels[visible].tolist(), xs, ys)],
+                  doreturn=False)
+
+
+class ParticleSystem:
+    """Partículas em arrays NumPy; cada tipo é desenhado com a sua StampSet"""
+
+    def __init__(self, stamps, capacity=1024):
+        self.stamps = list(stamps)  # Índice do tipo -> StampSet
+        self.count = 0
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        """(Re)aloca os arrays mantendo as partículas vivas"""
+        for name, dtype in (("x", np.float32), ("y", np.float32), ("vx", np.float32),
+                            ("vy", np.float32), ("life", np.float32), ("kind", np.uint8)):
+            array = np.zeros(capacity, dtype=dtype)
+            if self.count:
+                array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.count
+
+    def emit(self, x, y, vx, vy, kind=0, life=255.0):
+        """Adiciona partículas (escalares ou arrays do mesmo tamanho)"""
+        x, y, vx, vy, kind, life = np.broadcast_arrays(x, y, vx, vy, kind, life)
+        amount = x.size
+        if amount == 0:
+            return
+        if self.count + amount > self.capacity:
+            self._allocate(max(self.capacity * 2, self.count + amount))
+
+        start, end = self.count, self.count + amount
+        self.x[start:end] = x.ravel()
+        self.y[start:end] = y.ravel()
+        self.vx[start:end] = vx.ravel()
+        self.vy[start:end] = vy.ravel()
+        self.kind[start:end] = kind.ravel()
+        self.life[start:end] = life.ravel()
+        self.count = end
+
+    def update(self, decay=3.0, steps=1):
+        """Move todas as partículas, diminui a vida e remove as que morreram"""
+        n = self.count
+        if n == 0:
+            return
+        self.x[:n] += self.vx[:n] * steps
+        self.y[:n] += self.vy[:n] * steps
+        self.life[:n] -= decay * steps
+        self._remove_dead()
+
+    def _remove_dead(self):
+        """Remoção por troca: as vivas do fim ocupam os buracos das mortas do começo"""
+        n = self.count
+        alive = self.life[:n] > 0
+        survivors = int(alive.sum())
+        if survivors == n:
+            return
+
+        holes = np.flatnonzero(~alive[:survivors])
+        movers = np.flatnonzero(alive[survivors:n]) + survivors
+        for array in (self.x, self.y, self.vx, self.vy, self.life, self.kind):
+            array[holes] = array[movers]
+        self.count = survivors
+
+    def clear(self):
+        self.count = 0
+
+    def draw(self, surface):
+        """Desenha as partículas vivas; alpha = vida (0-255)"""
+        n = self.count
+        if n == 0:
+            return
+        kinds = self.kind[:n]
+        for kind, stamps in enumerate(self.stamps):
+            selected = kinds == kind
+            if selected.any():
+                blit_stamps(surface, stamps, self.x[:n][selected], self.y[:n][selected], self.life[:n][selected])
@@ -0,0 +1,100 @@
+"""
+Histórico compacto do caminho do jogador
+Os nós visitados ficam em um array('I') (4 bytes por nó, crescimento amortizado) em vez
+de uma lista de objetos int. Para gravar (replays, histórico de partidas) o caminho vira
+bytes com codificação delta: varint(quantidade) + varint(primeiro nó) + varints zigzag
+das diferenças entre nós consecutivos. Em níveis procedurais os vizinhos costumam ter
+números próximos, então um passo ocupa em geral 1 byte
+"""
+import operator
+from array import array
+from varint import encode_varint, decode_varint
+
+
+def _zigzag(value):
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def _unzigzag(value):
+    return value >> 1 if not value & 1 else -(value >> 1) - 1
+
+
+class PathHistory:
+    """Sequência de nós (inteiros não negativos) que se comporta como uma lista só de leitura + append
+
+    Nós vindos do NumPy (env, difficulty) são normalizados com operator.index
+    """
+
+    __slots__ = ("_nodes",)
+
+    def __init__(self, nodes=()):
+        self._nodes = array("I", map(operator.index, nodes))
+
+    def append(self, node):
+        self._nodes.append(operator.index(node))
+
+    @property
+    def last(self):
+        return self._nodes[-1] if self._nodes else None
+
+    @property
+    def nbytes(self):
+        """Memória ocupada pelos nós"""
+        return len(self._nodes) * self._nodes.itemsize
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __iter__(self):
+        return iter(self._nodes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._nodes[index].tolist()
+        return self._nodes[index]
+
+    def __contains__(self, node):
+        try:
+            node = operator.index(node)
+        except TypeError:
+            return False
+        return node >= 0 and node in self._nodes
+
+    def __eq__(self, other):
+        if isinstance(other, PathHistory):
+            return self._nodes == other._nodes
+        if isinstance(other, (list, tuple)):
+            return len(other) == len(self._nodes) and self._nodes.tolist() == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"PathHistory({self._nodes.tolist()})"
+
+    def tolist(self):
+        return self._nodes.tolist()
+
+    # ---- Serialização ----
+
+    def to_bytes(self):
+        out = bytearray()
+        encode_varint(len(self._nodes), out)
+        previous = 0
+        for node in self._nodes:
+            encode_varint(_zigzag(node - previous), out)
+            previous = node
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        count, offset = decode_varint(data, 0)
+        nodes = array("I")
+        node = 0
+        for _ in range(count):
+            delta, offset = decode_varint(data, offset)
+            node += _unzigzag(delta)
+            nodes.append(node)
+        history = cls()
+        history._nodes = nodes
+        return history
@@ -95,3 +95,30 @@ def calculate_path_efficiency(player_path_length, optimal_path_length):
     if optimal_path_length == 0:
         return 1.0
     return max(0, 1 - (player_path_length - optimal_path_length) / optimal_path_length)
+
+def edge_weights(graph):
+    """{nó: {vizinho: peso}} em dicionários comuns (consulta O(1) sem as views do networkx)"""
+    return {node: {neighbor: data.get('weight', 1) for neighbor, data in graph.adj[node].items()}
+            for node in graph.nodes()}
+
+def distances_to(weights, target):
+    """
+    Dijkstra a partir do alvo sobre {nó: {vizinho: peso}} (ex.: edge_weights do grafo)
+    Retorna o menor custo de cada nó até o alvo; nós sem caminho ficam de fora
+    """
+    distances = {target: 0}
+    pq = [(0, target)]
+    while pq:
+        current_dist, current = heapq.heappop(pq)
+        if current_dist > distances[current]:
+            continue
+        for neighbor, weight in weights[current].items():
+            distance = current_dist + weight
+            if distance < distances.get(neighbor, float('inf')):
+                distances[neighbor] = distance
+                heapq.heappush(pq, (distance, neighbor))
+    return distances
+
+def path_cost(graph, path):
+    """Soma dos pesos das arestas de um caminho"""
+    return sum(graph[a][b].get('weight', 1) for a, b in zip(path, path[1:]))
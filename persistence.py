@@ -0,0 +1,148 @@
+"""
+Persistência do progresso em segundo plano
+Os pedidos de gravação só guardam o estado mais recente e voltam na hora; uma thread
+espera um curto intervalo sem novos pedidos (debounce), grava uma única vez de forma
+atômica (arquivo temporário + fsync + os.replace) e tudo é descarregado ao sair
+"""
+import atexit
+import copy
+import json
+import os
+import tempfile
+import threading
+import time
+import weakref
+from game_logging import get_logger
+
+logger = get_logger("persistence")
+
+# Stores com gravação pendente são descarregados ao sair do interpretador
+_open_stores = weakref.WeakSet()
+
+
+def atomic_write(path, data):
+    """Grava 'data' (str ou bytes) em 'path' sem nunca deixar um arquivo pela metade
+
+    O conteúdo vai para um temporário no mesmo diretório, é sincronizado no disco e só
+    então substitui o arquivo original; um crash no meio mantém a versão anterior
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    # Sincroniza o diretório para a troca de nome também sobreviver a uma queda de energia
+    if hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+class ProgressStore:
+    """Arquivo JSON gravado por uma thread, com pedidos agrupados e escrita atômica"""
+
+    def __init__(self, path, debounce=0.5):
+        self.path = path
+        self.debounce = debounce  # Espera sem novos pedidos antes de gravar (s)
+        self.writes = 0  # Gravações feitas (pedidos agrupados contam uma vez)
+
+        self._cond = threading.Condition()
+        self._pending = None
+        self._deadline = 0.0
+        self._requested = 0  # Geração do último pedido
+        self._completed = 0  # Geração já gravada no disco
+        self._flush_now = False
+        self._closed = False
+        self._thread = None
+
+    def load(self):
+        """Lê o arquivo; retorna None se ele ainda não existir"""
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def save(self, data):
+        """Agenda a gravação de 'data' (uma cópia é serializada na thread de escrita)"""
+        snapshot = copy.deepcopy(data)  # O jogo pode continuar mexendo em 'data'; o json.dumps fica na thread
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("ProgressStore já foi fechado")
+            self._pending = snapshot
+            self._requested += 1
+            self._deadline = time.monotonic() + self.debounce
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._write_loop, name=f"progress:{self.path}",
+                                                daemon=True)
+                self._thread.start()
+                _open_stores.add(self)
+            self._cond.notify_all()
+
+    def flush(self, timeout=5.0):
+        """Grava o pedido pendente agora e espera terminar; retorna False se estourar o tempo"""
+        with self._cond:
+            target = self._requested
+            if self._completed >= target:
+                return True
+            self._flush_now = True
+            self._cond.notify_all()
+            return self._cond.wait_for(lambda: self._completed >= target, timeout)
+
+    def close(self, timeout=5.0):
+        """Descarrega o que falta e encerra a thread de escrita"""
+        flushed = self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        return flushed
+
+    def _write_loop(self):
+        while True:
+            with self._cond:
+                while True:
+                    if self._pending is not None:
+                        remaining = self._deadline - time.monotonic()
+                        if remaining <= 0 or self._flush_now or self._closed:
+                            break
+                        self._cond.wait(remaining)
+                    elif self._closed:
+                        return
+                    else:
+                        self._cond.wait()
+                data, generation = self._pending, self._requested
+                self._pending = None
+                self._flush_now = False
+
+            try:
+                atomic_write(self.path, json.dumps(data))
+                self.writes += 1
+                logger.debug("💾 %s gravado (pedido %s)", self.path, generation)
+            except (OSError, TypeError, ValueError) as e:  # Disco ou dado que não vira JSON
+                logger.error("⚠️ Erro ao salvar %s: %s", self.path, e)
+
+            with self._cond:
+                self._completed = generation
+                self._cond.notify_all()
+
+
+@atexit.register
+def _flush_open_stores():
+    for store in list(_open_stores):
+        store.close()
@@ -1,8 +1,16 @@
 """
 Módulo do personagem do jogador
 """
+from path_history import PathHistory
+
+# Eficiência mínima (%) para 3, 2 e 1 estrelas
+STAR_THRESHOLDS = (95, 80, 60)  # Perfeito ou quase perfeito, muito bom, razoável
 
 class Player:
+    # Atributos fixos, sem __dict__ por instância
+    __slots__ = ("name", "health", "max_health", "experience", "level", "points", "current_node",
+                 "path_taken", "score", "items", "best_times", "level_stars", "lives", "max_lives")
+
     def __init__(self, name="Explorador", starting_node=0):
         self.name = name
         self.health = 100
@@ -11,7 +19,8 @@ class Player:
         self.level = 1
         self.points = 0
         self.current_node = starting_node
-        self.path_taken = [starting_node]
+        self.path_taken = PathHistory((starting_node,))
+        self.score = None  # LiveScore do nível atual (custo e eficiência projetada)
         self.items = []
         self.best_times = {}  # {level_id: best_time}
         self.level_stars = {}  # {level_id: stars_earned}
@@ -23,8 +32,10 @@ class Player:
         old_node = self.current_node
         self.current_node = node
         # Só adiciona se não for o mesmo nó que já está no final do caminho
-        if len(self.path_taken) == 0 or self.path_taken[-1] != node:
+        if self.path_taken.last != node:
             self.path_taken.append(node)
+            if self.score is not None:
+                self.score.advance(node)
         
     def add_experience(self, amount):
         """Adiciona experiência e faz level up se necessário"""
@@ -69,10 +80,13 @@ class Player:
             "current_node": self.current_node
         }
     
-    def reset_level(self, starting_node):
-        """Reseta o estado para um novo nível"""
+    def reset_level(self, starting_node, score=None):
+        """Reseta o estado para um novo nível (score: LiveScore do World, opcional)"""
         self.current_node = starting_node
-        self.path_taken = [starting_node]
+        self.path_taken = PathHistory((starting_node,))  # Novo objeto: quem guardou o caminho anterior não o vê mudar
+        self.score = score
+        if score is not None:
+            score.reset(starting_node)
         self.health = self.max_health
     
     def calculate_stars(self, efficiency):
@@ -80,14 +94,10 @@ class Player:
         # Converte eficiência de 0-1 para 0-100
         efficiency_percent = efficiency * 100
         
-        if efficiency_percent >= 95:
-            return 3  # Perfeito ou quase perfeito (95%+)
-        elif efficiency_percent >= 80:
-            return 2  # Muito bom (80%+)
-        elif efficiency_percent >= 60:
-            return 1  # Razoavel (60%+)
-        else:
-            return 0  # 0 estrelas (<60%)
+        for stars, threshold in zip((3, 2, 1), STAR_THRESHOLDS):
+            if efficiency_percent >= threshold:
+                return stars
+        return 0  # 0 estrelas (<60%)
     
     def update_level_stars(self, level_id, stars):
         """Atualiza as estrelas de um nível (mantém o melhor resultado)"""
@@ -0,0 +1,52 @@
+"""
+Importação de módulos pesados em segundo plano
+O jogo mostra o primeiro quadro sem esperar networkx (geração dos níveis) nem cv2
+(vídeos); depois dele um thread importa esses módulos enquanto o menu roda, para que
+abrir o primeiro nível não trave. Quem precisar do módulo antes só espera o import terminar
+"""
+import importlib
+import threading
+import time
+from game_logging import get_logger
+
+logger = get_logger("preload")
+
+
+class ModulePreloader:
+    """Importa uma lista de módulos em um thread daemon, na ordem dada"""
+
+    def __init__(self, modules):
+        self.modules = tuple(modules)
+        self.timings = {}  # módulo -> segundos gastos (só o que ainda não estava carregado)
+        self.failed = {}  # módulo -> erro
+        self._thread = None
+        self._done = threading.Event()
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="module-preload", daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self):
+        try:
+            for name in self.modules:
+                started = time.perf_counter()
+                try:
+                    importlib.import_module(name)
+                except ImportError as e:
+                    self.failed[name] = e
+                    logger.warning("⚠️ Não foi possível pré-carregar %s: %s", name, e)
+                    continue
+                self.timings[name] = time.perf_counter() - started
+                logger.debug("📦 %s pré-carregado em %.1f ms", name, self.timings[name] * 1000)
+        finally:
+            self._done.set()
+
+    @property
+    def done(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        """Espera o fim dos imports; retorna False se o tempo acabar antes"""
+        return self._done.wait(timeout)
@@ -0,0 +1,178 @@
+"""
+Profiler de tempo de frame
+Mede quanto cada parte do frame leva (eventos, simulação, desenho e as etapas do
+draw_graph) com timers de baixo custo, guarda janelas móveis por seção para calcular
+p50/p95/p99, desenha um overlay opcional (F3) e grava um CSV ao sair
+
+Sem --profile nada é instrumentado: os métodos originais ficam intactos (custo zero)
+"""
+import csv
+import functools
+import sys
+import time
+from collections import deque
+import numpy as np
+import pygame
+from game_logging import get_logger
+
+logger = get_logger("profiler")
+
+FRAME = "frame"
+
+
+class FrameProfiler:
+    """Tempos por seção agregados por frame, com janela móvel para percentis"""
+
+    def __init__(self, window=300, history=36000):
+        self.window = window
+        self.samples = {}  # seção -> deque com os últimos 'window' tempos (ms)
+        self.frames = deque(maxlen=history)  # Linhas do CSV: uma por frame
+        self.overlay_visible = False
+        self._font = None
+
+        self._current = {}  # Tempos acumulados no frame atual (ms)
+        self._frame_start = None
+        self._frame_blocks = 0
+        self.frame_count = 0
+
+    # ---- Instrumentação ----
+
+    def instrument(self, obj, method_names, prefix=""):
+        """Troca métodos de uma instância por versões cronometradas"""
+        for name in method_names:
+            method = getattr(obj, name, None)
+            if method is None:
+                continue
+            setattr(obj, name, self._timed(method, prefix + name.lstrip("_")))
+
+    def _timed(self, method, section):
+        perf_counter = time.perf_counter
+        current = self._current
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            started = perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                current[section] = current.get(section, 0.0) + (perf_counter() - started) * 1000.0
+
+        return wrapper
+
+    # ---- Frames ----
+
+    def begin_frame(self):
+        self._current.clear()
+        self._frame_start = time.perf_counter()
+        self._frame_blocks = sys.getallocatedblocks()
+
+    def end_frame(self):
+        """Fecha o frame: total, seções chamadas e variação de blocos alocados"""
+        if self._frame_start is None:
+            return
+        frame_ms = (time.perf_counter() - self._frame_start) * 1000.0
+        allocations = sys.getallocatedblocks() - self._frame_blocks
+
+        self._record(FRAME, frame_ms)
+        self._record("allocations", allocations)
+        for section, elapsed in self._current.items():
+            self._record(section, elapsed)
+
+        row = {"index": self.frame_count, FRAME: frame_ms, "allocations": allocations}
+        row.update(self._current)
+        self.frames.append(row)
+        self.frame_count += 1
+        self._frame_start = None
+
+    def _record(self, section, value):
+        samples = self.samples.get(section)
+        if samples is None:
+            samples = self.samples[section] = deque(maxlen=self.window)
+        samples.append(value)
+
+    # ---- Estatísticas ----
+
+    def percentiles(self, section, quantiles=(50, 95, 99)):
+        """Percentis da janela móvel da seção (ms)"""
+        samples = self.samples.get(section)
+        if not samples:
+            return tuple(0.0 for _ in quantiles)
+        return tuple(float(value) for value in np.percentile(np.fromiter(samples, float), quantiles))
+
+    def histogram(self, section, bins=20):
+        """Histograma da janela móvel da seção: (contagens, limites dos intervalos)"""
+        samples = self.samples.get(section)
+        if not samples:
+            return np.zeros(bins, dtype=int), np.zeros(bins + 1)
+        return np.histogram(np.fromiter(samples, float), bins=bins)
+
+    def fps(self):
+        """FPS médio na janela móvel"""
+        frames = self.samples.get(FRAME)
+        if not frames:
+            return 0.0
+        mean_ms = sum(frames) / len(frames)
+        return 1000.0 / mean_ms if mean_ms > 0 else 0.0
+
+    def summary(self):
+        """{seção: (p50, p95, p99)} para todas as seções medidas"""
+        return {section: self.percentiles(section) for section in self.samples}
+
+    # ---- Saída ----
+
+    def toggle_overlay(self):
+        self.overlay_visible = not self.overlay_visible
+
+    def draw_overlay(self, surface, font=None):
+        """Painel com FPS, alocações e p50/p95/p99 de cada seção, mais o gráfico dos frames"""
+        if not self.overlay_visible:
+            return
+        if font is None:
+            if self._font is None:
+                self._font = pygame.font.Font(None, 18)
+            font = self._font
+        sections = [s for s in self.samples if s not in (FRAME, "allocations")]
+        lines = [
+            f"FPS {self.fps():5.1f}   alocações/frame p50 {self.percentiles('allocations')[0]:+.0f}",
+            f"{'seção':<18}{'p50':>7}{'p95':>7}{'p99':>7}  ms",
+        ]
+        for section in [FRAME] + sorted(sections):
+            p50, p95, p99 = self.percentiles(section)
+            lines.append(f"{section:<18}{p50:7.2f}{p95:7.2f}{p99:7.2f}")
+
+        line_height = font.get_linesize()
+        graph_height = 40
+        width = 300
+        height = 10 + line_height * len(lines) + graph_height + 10
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+
+        for i, line in enumerate(lines):
+            panel.blit(font.render(line, True, (230, 230, 230)), (8, 5 + i * line_height))
+
+        # Gráfico dos últimos frames (linha de referência em 16.7 ms = 60 FPS)
+        frames = list(self.samples.get(FRAME, ()))[-(width - 16):]
+        base_y = height - 8
+        budget_y = base_y - int(graph_height * 16.7 / 33.3)
+        pygame.draw.line(panel, (90, 90, 90), (8, budget_y), (width - 8, budget_y))
+        for x, frame_ms in enumerate(frames):
+            bar = min(graph_height, int(graph_height * frame_ms / 33.3))
+            color = (120, 220, 120) if frame_ms <= 16.7 else (240, 90, 90)
+            pygame.draw.line(panel, color, (8 + x, base_y), (8 + x, base_y - bar))
+
+        surface.blit(panel, (surface.get_width() - width - 10, 10))
+
+    def dump_csv(self, path):
+        """Grava um CSV com uma linha por frame e uma coluna por seção"""
+        columns = ["index", FRAME, "allocations"]
+        for row in self.frames:
+            for section in row:
+                if section not in columns:
+                    columns.append(section)
+
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=columns, restval="")
+            writer.writeheader()
+            writer.writerows(self.frames)
+        logger.info("📊 Perfil de %d frames salvo em %s", len(self.frames), path)
+        return path
@@ -0,0 +1,224 @@
+"""
+Ranking de níveis com skip list indexável
+Cada nível mantém as melhores partidas de cada jogador ordenadas por pontuação
+(maior primeiro) e tempo (menor primeiro). A skip list guarda em cada ligação quantos
+elementos ela pula, então inserir, remover, achar a posição de um jogador e acessar o
+i-ésimo colocado custam O(log n), sem reordenar a lista a cada consulta
+"""
+import json
+import math
+import random
+from persistence import atomic_write
+
+MAX_LEVELS = 24  # Suficiente para ~16 milhões de entradas por nível
+
+
+class _Node:
+    __slots__ = ("key", "next", "width")
+
+    def __init__(self, key, levels):
+        self.key = key
+        self.next = [None] * levels
+        self.width = [1] * levels  # Quantos elementos cada ligação avança
+
+
+class IndexableSkipList:
+    """Lista ordenada de chaves únicas com acesso por posição em O(log n)"""
+
+    def __init__(self, seed=None):
+        self.head = _Node(None, MAX_LEVELS)
+        self.size = 0
+        self._rng = random.Random(seed)
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        node = self.head.next[0]
+        while node is not None:
+            yield node.key
+            node = node.next[0]
+
+    def _random_levels(self):
+        # Distribuição geométrica (p = 1/2): metade dos nós tem 1 nível, 1/4 tem 2...
+        return min(MAX_LEVELS, 1 - int(math.log(1.0 - self._rng.random(), 2)))
+
+    def insert(self, key):
+        chain = [None] * MAX_LEVELS
+        steps_at_level = [0] * MAX_LEVELS
+        node = self.head
+        for level in reversed(range(MAX_LEVELS)):
+            following = node.next[level]
+            while following is not None and following.key < key:
+                steps_at_level[level] += node.width[level]
+                node = following
+                following = node.next[level]
+            chain[level] = node
+
+        levels = self._random_levels()
+        new_node = _Node(key, levels)
+        steps = 0
+        for level in range(levels):
+            previous = chain[level]
+            new_node.next[level] = previous.next[level]
+            previous.next[level] = new_node
+            new_node.width[level] = previous.width[level] - steps
+            previous.width[level] = steps + 1
+            steps += steps_at_level[level]
+        for level in range(levels, MAX_LEVELS):
+            chain[level].width[level] += 1
+        self.size += 1
+
+    def remove(self, key):
+        chain = [None] * MAX_LEVELS
+        node = self.head
+        for level in reversed(range(MAX_LEVELS)):
+            following = node.next[level]
+            while following is not None and following.key < key:
+                node = following
+                following = node.next[level]
+            chain[level] = node
+
+        target = chain[0].next[0]
+        if target is None or target.key != key:
+            raise KeyError(key)
+        for level in range(len(target.next)):
+            previous = chain[level]
+            previous.width[level] += target.width[level] - 1
+            previous.next[level] = target.next[level]
+        for level in range(len(target.next), MAX_LEVELS):
+            chain[level].width[level] -= 1
+        self.size -= 1
+
+    def index(self, key):
+        """Posição (0 = primeiro) da chave; KeyError se não existir"""
+        node = self.head
+        position = 0
+        for level in reversed(range(MAX_LEVELS)):
+            following = node.next[level]
+            while following is not None and following.key < key:
+                position += node.width[level]
+                node = following
+                following = node.next[level]
+        following = node.next[0]
+        if following is None or following.key != key:
+            raise KeyError(key)
+        return position
+
+    def _node_at(self, position):
+        node = self.head
+        remaining = position + 1
+        for level in reversed(range(MAX_LEVELS)):
+            while node.next[level] is not None and node.width[level] <= remaining:
+                remaining -= node.width[level]
+                node = node.next[level]
+        return node
+
+    def __getitem__(self, position):
+        if position < 0:
+            position += self.size
+        if not 0 <= position < self.size:
+            raise IndexError(position)
+        return self._node_at(position).key
+
+    def slice(self, start, stop):
+        """Chaves das posições [start, stop): O(log n + k)"""
+        start = max(0, start)
+        stop = min(stop, self.size)
+        keys = []
+        if start >= stop:
+            return keys
+        node = self._node_at(start)
+        for _ in range(stop - start):
+            keys.append(node.key)
+            node = node.next[0]
+        return keys
+
+
+class LevelRanking:
+    """Melhor partida de cada jogador em um nível"""
+
+    def __init__(self):
+        self.index = IndexableSkipList()
+        self.entries = {}  # jogador -> chave (-pontuação, tempo, ordem de envio, jogador)
+
+    def __len__(self):
+        return len(self.index)
+
+    def submit(self, player, score, time_taken, sequence):
+        """Registra a partida se for a melhor do jogador; retorna (posição 1-based, melhorou?)"""
+        key = (-score, time_taken, sequence, player)
+        previous = self.entries.get(player)
+        if previous is not None:
+            if previous[:2] <= key[:2]:
+                return self.index.index(previous) + 1, False
+            self.index.remove(previous)
+        self.index.insert(key)
+        self.entries[player] = key
+        return self.index.index(key) + 1, True
+
+    def rank(self, player):
+        key = self.entries.get(player)
+        return None if key is None else self.index.index(key) + 1
+
+    def _rows(self, keys, first_rank):
+        return [{"rank": first_rank + i, "player": player, "score": -negative_score, "time_taken": time_taken}
+                for i, (negative_score, time_taken, _, player) in enumerate(keys)]
+
+    def top(self, count):
+        return self._rows(self.index.slice(0, count), 1)
+
+    def around(self, player, radius=5):
+        """Vizinhos do jogador no ranking (radius acima e abaixo)"""
+        rank = self.rank(player)
+        if rank is None:
+            return []
+        start = max(0, rank - 1 - radius)
+        return self._rows(self.index.slice(start, rank + radius), start + 1)
+
+
+class Leaderboard:
+    """Rankings de todos os níveis, com snapshot em disco"""
+
+    def __init__(self):
+        self.levels = {}  # level_id -> LevelRanking
+        self.sequence = 0
+        self.dirty = False  # Mudou desde o último snapshot
+
+    def level(self, level_id):
+        ranking = self.levels.get(level_id)
+        if ranking is None:
+            ranking = self.levels[level_id] = LevelRanking()
+        return ranking
+
+    def submit(self, player, level_id, score, time_taken):
+        self.sequence += 1
+        ranking = self.level(level_id)
+        rank, improved = ranking.submit(player, score, time_taken, self.sequence)
+        self.dirty = self.dirty or improved
+        return {"level_id": level_id, "player": player, "rank": rank, "improved": improved, "total": len(ranking)}
+
+    def to_json(self):
+        """Snapshot em JSON (feito no thread do servidor; só a gravação vai para outro thread)"""
+        return json.dumps({
+            "sequence": self.sequence,
+            "levels": {str(level_id): list(ranking.index) for level_id, ranking in self.levels.items()},
+        })
+
+    def save(self, path, data=None):
+        atomic_write(path, data if data is not None else self.to_json())
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        leaderboard = cls()
+        leaderboard.sequence = data["sequence"]
+        for level_id, keys in data["levels"].items():
+            ranking = leaderboard.level(int(level_id))
+            for negative_score, time_taken, sequence, player in keys:
+                key = (negative_score, time_taken, sequence, player)
+                ranking.index.insert(key)
+                ranking.entries[player] = key
+        return leaderboard
@@ -0,0 +1,271 @@
+"""
+Gravação e replay determinístico das entradas do jogador
+Cada entrada (clique em nó, movimento WASD/diagonal, reinício, início de nível) é gravada
+com o passo de simulação (tick) em que aconteceu, em um fluxo binário compacto de varints.
+Como a simulação é de passo fixo e os inimigos dependem só da semente do nível, aplicar
+as mesmas entradas nos mesmos ticks reproduz a sessão inteira: em modo headless na
+velocidade máxima (testes de regressão de combate e pontuação) ou na tela em tempo real
+
+Formato: cabeçalho "<4sBdQ" (PFRP, versão, step_dt, semente) + eventos
+         varint(delta de ticks) + opcode (1 byte) + argumentos em varint
+"""
+import functools
+import struct
+from varint import encode_varint, decode_varint
+
+MAGIC = b"PFRP"
+VERSION = 1
+HEADER = struct.Struct("<4sBdQ")
+
+# Opcodes
+END = 0
+NODE_CLICK = 1
+MOVE = 2
+MOVE_DIAGONAL = 3
+RESTART = 4
+START_LEVEL = 5
+LEVEL_SEED = 6  # Conferência: a semente que o nível recebeu durante a gravação
+RESET_LIVES = 7
+LEVEL_STARS = 8  # Estado inicial: estrelas que liberam os níveis
+PLAYER_STATE = 9  # Estado inicial: vidas, vida, vida máxima, nível, experiência e pontos
+
+DIRECTIONS = ["up", "down", "left", "right", "northwest", "northeast", "southwest", "southeast"]
+
+# Métodos do Game gravados: nome -> (opcode, argumentos da chamada -> argumentos do evento)
+RECORDED_METHODS = {
+    "handle_node_click": (NODE_CLICK, lambda node, bypass_confirmation=False: (node, int(bypass_confirmation))),
+    "move_player_direction": (MOVE, lambda direction: (DIRECTIONS.index(direction),)),
+    "move_player_diagonal_direction": (MOVE_DIAGONAL, lambda direction: (DIRECTIONS.index(direction),)),
+    "restart_level": (RESTART, lambda: ()),
+    "start_level": (START_LEVEL, lambda level_id: (level_id,)),
+    "reset_player_lives": (RESET_LIVES, lambda: ()),
+}
+
+
+class ReplayDesyncError(Exception):
+    """O replay divergiu da gravação (semente de nível diferente)"""
+
+
+ARGUMENT_COUNTS = {END: 0, NODE_CLICK: 2, MOVE: 1, MOVE_DIAGONAL: 1, RESTART: 0, START_LEVEL: 1,
+                   LEVEL_SEED: 2, RESET_LIVES: 0, LEVEL_STARS: 2, PLAYER_STATE: 6}
+
+
+class Recording:
+    """Sessão gravada: semente, passo da simulação e eventos (tick, opcode, argumentos)"""
+
+    def __init__(self, seed, step_dt, events=None):
+        self.seed = seed
+        self.step_dt = step_dt
+        self.events = events if events is not None else []
+
+    @property
+    def duration_ticks(self):
+        return self.events[-1][0] if self.events else 0
+
+    def to_bytes(self):
+        out = bytearray(HEADER.pack(MAGIC, VERSION, self.step_dt, self.seed))
+        last_tick = 0
+        for tick, opcode, args in self.events:
+            encode_varint(tick - last_tick, out)
+            out.append(opcode)
+            for arg in args:
+                encode_varint(arg, out)
+            last_tick = tick
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, step_dt, seed = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Arquivo de replay inválido")
+        events = []
+        offset = HEADER.size
+        tick = 0
+        while offset < len(data):
+            delta, offset = decode_varint(data, offset)
+            opcode = data[offset]
+            offset += 1
+            args = []
+            for _ in range(ARGUMENT_COUNTS[opcode]):
+                value, offset = decode_varint(data, offset)
+                args.append(value)
+            tick += delta
+            events.append((tick, opcode, tuple(args)))
+        return cls(seed, step_dt, events)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+        return path
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+class InputRecorder:
+    """Grava as entradas de um Game trocando os métodos de entrada da instância por versões
+    que registram a chamada (só a mais externa: um movimento WASD que chama
+    handle_node_click vira um único evento)"""
+
+    def __init__(self, game, seed=None):
+        self.game = game
+        self.seed = seed if seed is not None else game.level_rng.getrandbits(32)
+        self.recording = Recording(self.seed, game.clock.step_dt)
+        self.base_tick = game.clock.tick_count
+        self._depth = 0
+
+        # A sessão gravada começa de um gerador de sementes conhecido
+        game.level_rng.seed(self.seed)
+        self._record_initial_state()
+
+        for name, (opcode, encode) in RECORDED_METHODS.items():
+            setattr(game, name, self._recorded(getattr(game, name), opcode, encode))
+        game.start_level = self._with_seed_check(game.start_level)
+        game.input_recorder = self
+
+    def _tick(self):
+        return self.game.clock.tick_count - self.base_tick
+
+    def _record_initial_state(self):
+        player = self.game.player
+        for level_id, stars in sorted(player.level_stars.items()):
+            self.recording.events.append((0, LEVEL_STARS, (level_id, stars)))
+        self.recording.events.append((0, PLAYER_STATE, (
+            player.lives, player.health, player.max_health, player.level, player.experience, player.points,
+        )))
+
+    def _recorded(self, method, opcode, encode):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            if self._depth == 0:
+                self.recording.events.append((self._tick(), opcode, encode(*args, **kwargs)))
+            self._depth += 1
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._depth -= 1
+        return wrapper
+
+    def _with_seed_check(self, start_level):
+        """Depois de cada início de nível (inclusive dentro de restart_level) grava a semente usada"""
+        @functools.wraps(start_level)
+        def wrapper(*args, **kwargs):
+            previous_world = self.game.world
+            result = start_level(*args, **kwargs)
+            if self.game.world is not previous_world:
+                self.recording.events.append((self._tick(), LEVEL_SEED,
+                                              (self.game.current_level, self.game.level_seed)))
+            return result
+        return wrapper
+
+    def finish(self):
+        """Marca o fim da sessão e retorna a gravação"""
+        events = self.recording.events
+        if not events or events[-1][1] != END:
+            events.append((self._tick(), END, ()))
+        return self.recording
+
+    def save(self, path):
+        return self.finish().save(path)
+
+
+def _apply(game, opcode, args):
+    """Aplica um evento gravado no jogo"""
+    player = game.player
+    if opcode == NODE_CLICK:
+        game.handle_node_click(args[0], bypass_confirmation=bool(args[1]))
+    elif opcode == MOVE:
+        game.move_player_direction(DIRECTIONS[args[0]])
+    elif opcode == MOVE_DIAGONAL:
+        game.move_player_diagonal_direction(DIRECTIONS[args[0]])
+    elif opcode == RESTART:
+        game.restart_level()
+    elif opcode == START_LEVEL:
+        game.start_level(args[0])
+    elif opcode == RESET_LIVES:
+        game.reset_player_lives()
+    elif opcode == LEVEL_STARS:
+        player.update_level_stars(*args)
+    elif opcode == PLAYER_STATE:
+        player.lives, player.health, player.max_health, player.level, player.experience, player.points = args
+    elif opcode == LEVEL_SEED:
+        level_id, seed = args
+        if game.current_level != level_id or game.level_seed != seed:
+            raise ReplayDesyncError(f"Nível {game.current_level} com semente {game.level_seed}, "
+                                    f"gravado: nível {level_id} com semente {seed}")
+
+
+def replay(recording, game=None, realtime=False, fps=60):
+    """Reproduz uma gravação e retorna o resultado da sessão
+
+    Sem 'realtime' roda headless na velocidade máxima; com 'realtime' desenha na tela no
+    ritmo normal (para reproduzir bugs). Levanta ReplayDesyncError se a sessão divergir
+    """
+    if game is None:
+        from main import Game
+        game = Game(headless=not realtime, seed=recording.seed)
+    if game.clock.step_dt != recording.step_dt:
+        raise ValueError(f"Gravação com passo {recording.step_dt}, jogo com {game.clock.step_dt}")
+
+    game.level_rng.seed(recording.seed)
+    game.replaying = True
+    events = recording.events
+    base_tick = game.clock.tick_count
+    index = 0
+
+    def apply_due():
+        nonlocal index
+        tick = game.clock.tick_count - base_tick
+        while index < len(events) and events[index][0] <= tick:
+            _, opcode, args = events[index]
+            _apply(game, opcode, args)
+            index += 1
+        return tick < recording.duration_ticks
+
+    if realtime:
+        import pygame
+        frame_clock = pygame.time.Clock()
+        running = True
+        while running:
+            game.clock.begin_frame()
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+            while running:
+                running = apply_due()
+                if not running or not game.clock.consume_step():
+                    break
+                game.update()
+            game.draw()
+            frame_clock.tick(fps)
+    else:
+        while apply_due():
+            game.step()
+
+    game.replaying = False
+    return {
+        "state": game.game_state,
+        "level_id": game.current_level,
+        "results": getattr(game, "level_results", None) if game.game_state == "level_complete" else None,
+        "path": game.player.path_taken,  # reset_level cria outro; este não muda mais
+        "lives": game.player.lives,
+        "points": game.player.points,
+        "ticks": game.clock.tick_count - base_tick,
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Reproduz uma sessão gravada com --record")
+    parser.add_argument("replay", help="Arquivo .pfr gravado")
+    parser.add_argument("--realtime", action="store_true", help="Mostra o replay na tela no ritmo normal")
+    args = parser.parse_args()
+
+    recording = Recording.load(args.replay)
+    print(f"🎬 {len(recording.events)} eventos, {recording.duration_ticks * recording.step_dt:.1f}s simulados")
+    result = replay(recording, realtime=args.realtime)
+    print(f"🏁 Estado final: {result['state']} | Nível {result['level_id']} | Caminho: {result['path'].tolist()} | "
+          f"Pontos: {result['points']}")
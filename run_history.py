@@ -0,0 +1,179 @@
+"""
+Histórico de partidas em SQLite
+Guarda cada nível concluído (tempo, caminho, eficiência, estrelas) e cada morte por
+perfil. O caminho é gravado como BLOB com a codificação delta de PathHistory (bancos
+antigos guardavam JSON; path_from_row lê os dois formatos). As inserções ficam em um buffer e entram no banco em lote, em uma transação;
+o banco usa WAL e índices por (perfil, nível) para as consultas de recordes e médias
+"""
+import json
+import sqlite3
+import time
+from game_logging import get_logger
+from path_history import PathHistory
+
+logger = get_logger("run_history")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    profile_id INTEGER NOT NULL REFERENCES profiles(id),
+    level_id INTEGER NOT NULL,
+    finished_at REAL NOT NULL,
+    time_taken REAL NOT NULL,
+    player_distance INTEGER NOT NULL,
+    optimal_distance INTEGER NOT NULL,
+    efficiency REAL NOT NULL,
+    stars INTEGER NOT NULL,
+    score INTEGER NOT NULL,
+    path BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS deaths (
+    id INTEGER PRIMARY KEY,
+    profile_id INTEGER NOT NULL REFERENCES profiles(id),
+    level_id INTEGER NOT NULL,
+    node INTEGER,
+    cause TEXT NOT NULL,
+    died_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_level_time ON runs (profile_id, level_id, time_taken);
+CREATE INDEX IF NOT EXISTS runs_by_level_efficiency ON runs (profile_id, level_id, efficiency);
+CREATE INDEX IF NOT EXISTS deaths_by_level ON deaths (profile_id, level_id);
+"""
+
+INSERT_RUN = """
+INSERT INTO runs (profile_id, level_id, finished_at, time_taken, player_distance,
+                  optimal_distance, efficiency, stars, score, path)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+INSERT_DEATH = "INSERT INTO deaths (profile_id, level_id, node, cause, died_at) VALUES (?, ?, ?, ?, ?)"
+
+
+def encode_path(path):
+    """Caminho (PathHistory ou lista de nós) -> bytes para a coluna path"""
+    if not isinstance(path, PathHistory):
+        path = PathHistory(path)
+    return path.to_bytes()
+
+
+def path_from_row(value):
+    """Coluna path -> PathHistory (BLOB delta ou o JSON das versões antigas)"""
+    if isinstance(value, str):
+        return PathHistory(json.loads(value))
+    return PathHistory.from_bytes(value)
+
+
+class RunHistory:
+    """Perfis, partidas e mortes em um banco SQLite local"""
+
+    def __init__(self, path="run_history.db", batch_size=32):
+        self.path = path
+        self.batch_size = batch_size  # Linhas no buffer antes de gravar um lote
+        self._runs = []
+        self._deaths = []
+        self._profiles = {}  # nome -> id
+
+        self.connection = sqlite3.connect(path)
+        if path != ":memory:":
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")  # Seguro com WAL, um fsync por checkpoint
+        self.connection.executescript(SCHEMA)
+        self.connection.commit()
+
+    # ---- Gravação ----
+
+    def profile_id(self, name):
+        """Id do perfil (criado na primeira vez)"""
+        profile_id = self._profiles.get(name)
+        if profile_id is None:
+            with self.connection:
+                self.connection.execute("INSERT OR IGNORE INTO profiles (name, created_at) VALUES (?, ?)",
+                                        (name, time.time()))
+            profile_id = self.connection.execute("SELECT id FROM profiles WHERE name = ?", (name,)).fetchone()[0]
+            self._profiles[name] = profile_id
+        return profile_id
+
+    def record_run(self, profile, results, path, stars):
+        """Registra um nível concluído (results de World.complete_level)"""
+        self._runs.append((
+            self.profile_id(profile), results["level_id"], time.time(), results["time_taken"],
+            results["player_distance"], results["optimal_distance"], results["efficiency"],
+            stars, results["total_score"], encode_path(path),
+        ))
+        self._maybe_flush()
+
+    def record_death(self, profile, level_id, node=None, cause="combat"):
+        """Registra uma morte do jogador"""
+        self._deaths.append((self.profile_id(profile), level_id, node, cause, time.time()))
+        self._maybe_flush()
+
+    def _maybe_flush(self):
+        if len(self._runs) + len(self._deaths) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Grava o buffer em uma única transação"""
+        if not self._runs and not self._deaths:
+            return
+        try:
+            with self.connection:
+                self.connection.executemany(INSERT_RUN, self._runs)
+                self.connection.executemany(INSERT_DEATH, self._deaths)
+        except sqlite3.Error as e:
+            logger.error("❌ Erro ao gravar histórico: %s", e)
+            return
+        logger.debug("🗃️ Histórico: %s partidas e %s mortes gravadas", len(self._runs), len(self._deaths))
+        self._runs.clear()
+        self._deaths.clear()
+
+    def close(self):
+        self.flush()
+        self.connection.close()
+
+    # ---- Consultas ----
+
+    def _query(self, sql, params):
+        self.flush()  # As consultas também veem o que ainda estava no buffer
+        return self.connection.execute(sql, params)
+
+    def best_path(self, profile, level_id):
+        """Caminho da partida mais eficiente (e mais rápida no empate) do nível; None sem partidas"""
+        row = self._query("""
+            SELECT path FROM runs WHERE profile_id = ? AND level_id = ?
+            ORDER BY efficiency DESC, time_taken ASC LIMIT 1""", (self.profile_id(profile), level_id)).fetchone()
+        return path_from_row(row[0]) if row else None
+
+    def best_times(self, profile):
+        """{nível: menor tempo de conclusão}"""
+        rows = self._query("SELECT level_id, MIN(time_taken) FROM runs WHERE profile_id = ? GROUP BY level_id",
+                           (self.profile_id(profile),))
+        return {level_id: best for level_id, best in rows}
+
+    def average_efficiency(self, profile):
+        """Média da melhor eficiência (0-1) de cada nível concluído; None sem partidas"""
+        row = self._query("""
+            SELECT AVG(best) FROM (
+                SELECT MAX(efficiency) AS best FROM runs WHERE profile_id = ? GROUP BY level_id
+            )""", (self.profile_id(profile),)).fetchone()
+        return row[0]
+
+    def level_stats(self, profile, level_id):
+        """Resumo de um nível: partidas, mortes, melhor tempo e eficiência"""
+        profile_id = self.profile_id(profile)
+        runs, best_time, best_efficiency, avg_efficiency, best_stars = self._query("""
+            SELECT COUNT(*), MIN(time_taken), MAX(efficiency), AVG(efficiency), MAX(stars)
+            FROM runs WHERE profile_id = ? AND level_id = ?""", (profile_id, level_id)).fetchone()
+        deaths = self._query("SELECT COUNT(*) FROM deaths WHERE profile_id = ? AND level_id = ?",
+                             (profile_id, level_id)).fetchone()[0]
+        return {
+            "runs": runs,
+            "deaths": deaths,
+            "best_time": best_time,
+            "best_efficiency": best_efficiency,
+            "avg_efficiency": avg_efficiency,
+            "best_stars": best_stars or 0,
+        }
@@ -0,0 +1,49 @@
+"""
+Pontuação ao vivo do caminho do jogador
+A eficiência compara o custo do caminho (soma dos pesos das arestas) com o custo do
+caminho ótimo do World, o mesmo critério do Dijkstra que o encontrou. LiveScore acumula
+custo e arestas a cada Player.move_to_node e projeta a melhor eficiência ainda possível
+com a distância até a saída calculada uma vez por nível, tudo em O(1) por passo: o HUD
+mostra as estrelas projetadas sem refazer contas a cada quadro
+"""
+from pathfinding import calculate_path_efficiency
+
+
+class LiveScore:
+    """Custo, arestas e eficiência projetada do caminho atual em um World"""
+
+    __slots__ = ("world", "weights", "distance_to_exit", "node", "cost", "hops")
+
+    def __init__(self, world, start_node=None):
+        self.world = world
+        self.weights = world.edge_weights
+        self.distance_to_exit = world.distance_to_exit
+        self.reset(world.start_node if start_node is None else start_node)
+
+    def reset(self, node):
+        self.node = node
+        self.cost = 0
+        self.hops = 0
+
+    def advance(self, node):
+        """Soma a aresta node atual → node (chamado por Player.move_to_node)"""
+        self.cost += self.weights[self.node][node]
+        self.hops += 1
+        self.node = node
+
+    @property
+    def remaining(self):
+        """Menor custo daqui até a saída (ignorando inimigos)"""
+        return self.distance_to_exit.get(self.node, float("inf"))
+
+    @property
+    def efficiency(self):
+        """Eficiência se o nível terminasse com o custo atual"""
+        return calculate_path_efficiency(self.cost, self.world.optimal_distance)
+
+    @property
+    def projected_efficiency(self):
+        """Melhor eficiência ainda possível: custo atual + caminho mais curto até a saída"""
+        if self.remaining == float("inf"):
+            return 0.0
+        return min(1.0, calculate_path_efficiency(self.cost + self.remaining, self.world.optimal_distance))
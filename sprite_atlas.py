@@ -0,0 +1,120 @@
+"""
+Atlas de sprites: junta as animações de cada personagem em uma única imagem já
+redimensionada (gerada offline) e expõe os frames como subsuperfícies em tempo de execução
+
+Gerar os atlas: python sprite_atlas.py
+"""
+import glob
+import json
+import os
+import pygame
+from game_logging import get_logger
+
+logger = get_logger("sprite_atlas")
+
+ATLAS_DIR = os.path.join("images", "atlas")
+
+# Personagem -> tamanho dos frames e lista de frames de cada animação
+ATLASES = {
+    "player": {
+        "frame_size": (120, 120),
+        "animations": {
+            "idle": [f"idle{i}.png" for i in range(5)],
+            "run": [f"run_{i}.png" for i in range(6)],
+            "run_left": [f"runleft{i}.png" for i in range(6)],
+            "attack": os.path.join("images", "person_attack", "*.png"),
+        },
+    },
+    "enemy": {
+        "frame_size": (80, 80),
+        "animations": {
+            "idle": os.path.join("images", "enemy", "idle", "*.png"),
+            "attack": os.path.join("images", "enemy", "attack", "*.png"),
+            "dead": os.path.join("images", "enemy", "dead", "*.png"),
+        },
+    },
+}
+
+
+def atlas_paths(name, atlas_dir=ATLAS_DIR):
+    """Caminhos da imagem e do índice (JSON) do atlas de um personagem"""
+    return os.path.join(atlas_dir, f"{name}.png"), os.path.join(atlas_dir, f"{name}.json")
+
+
+def frame_files(sources):
+    """Arquivos existentes de uma animação (lista fixa ou padrão glob, em ordem)"""
+    if isinstance(sources, str):
+        return sorted(glob.glob(sources))
+    return [path for path in sources if os.path.exists(path)]
+
+
+def build_atlas(name, spec, atlas_dir=ATLAS_DIR):
+    """Gera o atlas de um personagem: uma linha por animação, frames lado a lado"""
+    frame_w, frame_h = spec["frame_size"]
+    animations = {animation: frame_files(sources) for animation, sources in spec["animations"].items()}
+    columns = max((len(files) for files in animations.values()), default=0)
+    rows = len(animations)
+
+    atlas = pygame.Surface((max(1, columns * frame_w), max(1, rows * frame_h)), pygame.SRCALPHA)
+    index = {"frame_size": [frame_w, frame_h], "animations": {}}
+
+    for row, (animation, files) in enumerate(animations.items()):
+        rects = []
+        for column, path in enumerate(files):
+            frame = pygame.transform.scale(pygame.image.load(path), (frame_w, frame_h))
+            x, y = column * frame_w, row * frame_h
+            atlas.blit(frame, (x, y))
+            rects.append([x, y, frame_w, frame_h])
+        index["animations"][animation] = rects
+
+    os.makedirs(atlas_dir, exist_ok=True)
+    image_path, index_path = atlas_paths(name, atlas_dir)
+    pygame.image.save(atlas, image_path)
+    with open(index_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2)
+
+    total = sum(len(files) for files in animations.values())
+    logger.info("🗺️ Atlas '%s' gerado: %d frames em %s", name, total, image_path)
+    return image_path
+
+
+class SpriteSheet:
+    """Atlas carregado: cada frame é uma subsuperfície da mesma imagem"""
+
+    def __init__(self, image, index):
+        self.image = image
+        self.frame_size = tuple(index["frame_size"])
+        self.animations = {
+            animation: [image.subsurface(pygame.Rect(rect)) for rect in rects]
+            for animation, rects in index["animations"].items()
+        }
+
+    @staticmethod
+    def read_index(name, atlas_dir=ATLAS_DIR):
+        """Lê o índice do atlas; None se o atlas ainda não foi gerado"""
+        image_path, index_path = atlas_paths(name, atlas_dir)
+        if not (os.path.exists(image_path) and os.path.exists(index_path)):
+            return None
+        with open(index_path, encoding="utf-8") as f:
+            return json.load(f)
+
+    @classmethod
+    def load(cls, name, atlas_dir=ATLAS_DIR):
+        """Carrega o atlas de um personagem (precisa de display para convert_alpha)"""
+        index = cls.read_index(name, atlas_dir)
+        if index is None:
+            return None
+        image_path, _ = atlas_paths(name, atlas_dir)
+        return cls(pygame.image.load(image_path).convert_alpha(), index)
+
+    def frames(self, animation):
+        """Lista de frames de uma animação (vazia se não existir)"""
+        return list(self.animations.get(animation, []))
+
+
+if __name__ == "__main__":
+    from game_logging import setup_logging
+
+    setup_logging("INFO")  # Mostra o resumo de cada atlas gerado
+    for atlas_name, atlas_spec in ATLASES.items():
+        build_atlas(atlas_name, atlas_spec)
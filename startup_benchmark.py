@@ -0,0 +1,174 @@
+"""
+Benchmark de inicialização
+Mede em processos novos o custo de import de cada módulo (python -X importtime), o
+tempo até o primeiro quadro do jogo (main.py --first-frame-exit, com vídeo e áudio
+dummy) e a duração de cada fase até o menu (main.py --startup-profile). Cada medida é
+repetida e reporta mediana e mínimo para reduzir o ruído
+
+    python startup_benchmark.py --runs 5 --top 15
+"""
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+
+
+def _environment():
+    env = dict(os.environ)
+    env.setdefault("SDL_VIDEODRIVER", "dummy")
+    env.setdefault("SDL_AUDIODRIVER", "dummy")
+    env.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    return env
+
+
+def parse_importtime(stderr):
+    """[(módulo, tempo próprio µs, acumulado µs, profundidade)] da saída do -X importtime
+
+    A saída vem em pós-ordem: os imports feitos por um módulo aparecem antes dele
+    """
+    rows = []
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            own, cumulative, indent, name = match.groups()
+            rows.append((name, int(own), int(cumulative), len(indent) // 2))
+    return rows
+
+
+def direct_imports(rows, module):
+    """Imports feitos diretamente pelo módulo (profundidade 1 logo antes dele)"""
+    for position, (name, _, _, depth) in enumerate(rows):
+        if name == module and depth == 0:
+            children = []
+            for row in reversed(rows[:position]):
+                if row[3] == 0:
+                    break
+                if row[3] == 1:
+                    children.append(row)
+            return children
+    return []
+
+
+def import_times(module="main", runs=5):
+    """Import mais rápido em 'runs' processos novos: (total µs, imports diretos)"""
+    best = None
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                                cwd=ROOT, env=_environment(), capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"import {module} falhou:\n{result.stderr[-2000:]}")
+        rows = parse_importtime(result.stderr)
+        total = next(cumulative for name, _, cumulative, depth in rows if name == module and depth == 0)
+        if best is None or total < best[0]:
+            best = (total, direct_imports(rows, module))
+    return best
+
+
+def interpreter_startup(runs=5):
+    """Tempo de 'python -c pass' (piso de qualquer inicialização), em segundos"""
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], env=_environment(), check=True)
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def time_to_first_frame(runs=5, timeout=60.0, args=()):
+    """Segundos entre criar o processo do jogo e o primeiro quadro na tela"""
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        process = subprocess.Popen([sys.executable, "main.py", "--first-frame-exit", *args], cwd=ROOT,
+                                   env=_environment(), stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                   text=True)
+        elapsed = None
+        for line in process.stdout:
+            if line.strip() == "FIRST_FRAME":
+                elapsed = time.perf_counter() - started
+                break
+        process.stdout.close()
+        process.wait(timeout)
+        if elapsed is None:
+            raise RuntimeError(f"o jogo terminou (código {process.returncode}) sem mostrar um quadro")
+        samples.append(elapsed)
+    return samples
+
+
+def startup_phases(runs=5, timeout=60.0):
+    """Mediana de cada fase e marco do perfil de inicialização em 'runs' aberturas do jogo"""
+    phases = {}  # (profundidade, nome) -> [durações ms], na ordem da primeira execução
+    marks = {}
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "startup_profile.json")
+        for _ in range(runs):
+            subprocess.run([sys.executable, "main.py", "--exit-after-startup", "--startup-profile", path],
+                           cwd=ROOT, env=_environment(), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                           timeout=timeout, check=True)
+            with open(path, encoding="utf-8") as f:
+                profile = json.load(f)
+            for phase in profile["phases"]:
+                phases.setdefault((phase["depth"], phase["name"]), []).append(phase["duration_ms"])
+            for name, instant in profile["marks"].items():
+                marks.setdefault(name, []).append(instant)
+    return {
+        "phases": [{"name": name, "depth": depth, "median_ms": statistics.median(durations)}
+                   for (depth, name), durations in phases.items()],
+        "marks": {name: statistics.median(instants) for name, instants in marks.items()},
+    }
+
+
+def summary(samples):
+    return {"median_ms": statistics.median(samples) * 1000, "min_ms": min(samples) * 1000, "runs": len(samples)}
+
+
+def run_benchmark(runs=5, top=15, module="main"):
+    total, children = import_times(module, runs)
+    heaviest = sorted(children, key=lambda row: -row[2])[:top]
+    return {
+        "interpreter": summary(interpreter_startup(runs)),
+        "import": {"module": module, "total_ms": total / 1000,
+                   "heaviest": [{"module": name, "self_ms": own / 1000, "cumulative_ms": cumulative / 1000}
+                                for name, own, cumulative, _ in heaviest]},
+        "first_frame": summary(time_to_first_frame(runs)),
+        "startup": startup_phases(runs),
+    }
+
+
+def print_report(stats):
+    print(f"🐍 Interpretador: {stats['interpreter']['median_ms']:.0f} ms (mín {stats['interpreter']['min_ms']:.0f})")
+    print(f"📦 import {stats['import']['module']}: {stats['import']['total_ms']:.0f} ms (melhor de "
+          f"{stats['first_frame']['runs']})")
+    for row in stats["import"]["heaviest"]:
+        print(f"   {row['module']:<28} {row['cumulative_ms']:8.1f} ms  (próprio {row['self_ms']:.1f})")
+    print(f"🖼️ Primeiro quadro: {stats['first_frame']['median_ms']:.0f} ms "
+          f"(mín {stats['first_frame']['min_ms']:.0f})")
+    print("⏱️ Fases até o menu (mediana):")
+    for phase in stats["startup"]["phases"]:
+        print(f"   {phase['median_ms']:8.1f} ms  {'  ' * phase['depth']}{phase['name']}")
+    for name, instant in stats["startup"]["marks"].items():
+        print(f"   {instant:8.1f} ms  ▼ {name}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Tempo de import e tempo até o primeiro quadro")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="Quantos imports diretos mais caros listar")
+    parser.add_argument("--module", default="main", help="Módulo cujo import é medido")
+    parser.add_argument("--json", default=None, metavar="ARQUIVO")
+    args = parser.parse_args()
+
+    stats = run_benchmark(args.runs, args.top, args.module)
+    print_report(stats)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(stats, f, indent=2)
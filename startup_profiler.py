@@ -0,0 +1,114 @@
+"""
+Perfil do caminho crítico da inicialização
+Marca início e fim de cada fase da abertura do jogo (imports, pygame.init, criação do
+Visualizer e cada load_*, UI, vídeo do menu, progresso salvo, tela de carregamento) e
+os marcos primeiro quadro e menu pronto. Ao terminar mostra uma cascata (waterfall) no
+console e grava um JSON para comparar versões
+
+Sem --startup-profile nada é instrumentado; os métodos de classe trocados durante a
+abertura voltam ao original em finish()
+"""
+import functools
+import json
+import platform
+import sys
+import time
+from contextlib import contextmanager
+from persistence import atomic_write
+
+BAR_WIDTH = 48
+
+
+class StartupProfiler:
+    """Fases aninhadas com instantes relativos à origem (ms)"""
+
+    def __init__(self, origin=None):
+        self.origin = origin if origin is not None else time.perf_counter()
+        self.phases = []  # {"name", "start_ms", "duration_ms", "depth"} na ordem de início
+        self.marks = {}  # marco -> ms desde a origem
+        self.finished = False
+        self._depth = 0
+        self._patched = []  # (classe, nome, atributo original)
+
+    def _ms(self, instant):
+        return (instant - self.origin) * 1000.0
+
+    def add_phase(self, name, started, ended, depth=0):
+        """Registra uma fase já medida (instantes de time.perf_counter)"""
+        self.phases.append({"name": name, "start_ms": self._ms(started),
+                            "duration_ms": (ended - started) * 1000.0, "depth": depth})
+
+    @contextmanager
+    def phase(self, name):
+        entry = {"name": name, "start_ms": self._ms(time.perf_counter()), "duration_ms": None,
+                 "depth": self._depth}
+        self.phases.append(entry)
+        self._depth += 1
+        try:
+            yield entry
+        finally:
+            self._depth -= 1
+            entry["duration_ms"] = self._ms(time.perf_counter()) - entry["start_ms"]
+
+    def mark(self, name):
+        if name not in self.marks:
+            self.marks[name] = self._ms(time.perf_counter())
+
+    def instrument(self, cls, method_names):
+        """Cronometra métodos de uma classe (inclusive os chamados dentro do __init__)"""
+        for name in method_names:
+            original = cls.__dict__.get(name)
+            if original is None:
+                continue
+            self._patched.append((cls, name, original))
+            setattr(cls, name, self._timed(original, f"{cls.__name__}.{name}"))
+
+    def _timed(self, function, section):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with self.phase(section):
+                return function(*args, **kwargs)
+        return wrapper
+
+    def finish(self):
+        """Devolve os métodos originais; as medidas continuam disponíveis"""
+        for cls, name, original in reversed(self._patched):
+            setattr(cls, name, original)
+        self._patched = []
+        self.finished = True
+
+    # ---- Relatórios ----
+
+    def total_ms(self):
+        ends = [phase["start_ms"] + (phase["duration_ms"] or 0.0) for phase in self.phases]
+        return max(ends + list(self.marks.values()) + [0.0])
+
+    def to_dict(self):
+        return {
+            "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "total_ms": self.total_ms(),
+            "marks": dict(self.marks),
+            "phases": list(self.phases),
+        }
+
+    def write_json(self, path):
+        atomic_write(path, json.dumps(self.to_dict(), indent=2))
+
+    def waterfall(self, width=BAR_WIDTH):
+        """Cascata em texto: início, barra proporcional, duração e nome de cada fase"""
+        total = self.total_ms() or 1.0
+        scale = width / total
+        lines = [f"⏱️ Inicialização: {total:.0f} ms"]
+        for phase in self.phases:
+            duration = phase["duration_ms"] or 0.0
+            start = int(phase["start_ms"] * scale)
+            length = max(1, int(round(duration * scale)))
+            bar = (" " * start + "█" * length)[:width].ljust(width)
+            lines.append(f"{phase['start_ms']:8.1f} ms |{bar}| {duration:8.1f} ms  "
+                         f"{'  ' * phase['depth']}{phase['name']}")
+        for name, instant in sorted(self.marks.items(), key=lambda item: item[1]):
+            position = min(width - 1, int(instant * scale))
+            lines.append(f"{instant:8.1f} ms |{(' ' * position + '▼').ljust(width)}|              {name}")
+        return "\n".join(lines)
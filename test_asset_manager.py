@@ -0,0 +1,95 @@
+"""
+Testes do carregamento assíncrono de assets
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+from asset_manager import AssetManager, DerivedImageCache
+
+def _init_display():
+    pygame.display.init()
+    pygame.display.set_mode((10, 10))
+
+def test_images_load_in_background_and_are_deduplicated():
+    """Cada arquivo é decodificado uma vez; tamanhos diferentes são variantes do mesmo arquivo"""
+    print("🧪 Carregando sprites em segundo plano...")
+    _init_display()
+    assets = AssetManager()
+    try:
+        first = assets.load_image("run_0.png", (120, 120))
+        again = assets.load_image("run_0.png", (120, 120))
+        small = assets.load_image("run_0.png", (40, 40))
+        assets.load_image("nao_existe.png")
+
+        assert first == again
+        assert assets.requested == 3
+        assets.wait()
+
+        print(f"   Progresso: {assets.progress:.0%} ({assets.loaded}/{assets.requested})")
+        assert assets.done and assets.progress == 1.0
+        assert assets.get(first).get_size() == (120, 120)
+        assert assets.get(small).get_size() == (40, 40)
+        assert assets.get_image("nao_existe.png") is None
+        assert len(assets._decoded) == 2  # run_0.png decodificado uma vez só
+    finally:
+        assets.shutdown()
+
+def test_conversion_happens_on_pump():
+    """A conversão para o formato da tela só acontece quando a thread principal chama pump()"""
+    print("🧪 Verificando conversão na thread principal...")
+    _init_display()
+    assets = AssetManager()
+    try:
+        key = assets.load_image("level1_1.png", (200, 100), alpha=False)
+        assets._pending[key].result()  # Decodificado na thread, ainda não entregue
+        assert assets.get(key) is None
+
+        assets.wait()
+        image = assets.get(key)
+        assert image.get_bitsize() == pygame.display.get_surface().get_bitsize()
+    finally:
+        assets.shutdown()
+
+def test_end_screen_artwork_is_derived_once():
+    """Estrelas escalonadas/escurecidas e backgrounds das telas finais são calculados uma vez"""
+    print("🧪 Verificando cache das artes das telas finais...")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    from visualizer import Visualizer
+    pygame.init()
+    visualizer = Visualizer()
+    try:
+        visualizer.finish_loading()
+        cache = visualizer.derived_images
+
+        for _ in range(3):
+            stars = visualizer._end_screen_stars(3)
+            dark = visualizer._end_screen_stars(1, darkened=True)
+            background = visualizer._level_complete_background(2)
+
+        source = visualizer.star_images[3]
+        print(f"   Variantes: {len(cache)} | acertos: {cache.hits} | cálculos: {cache.misses}")
+        assert stars.get_size() == (int(source.get_width() * 0.7), int(source.get_height() * 0.7))
+        assert dark is not visualizer._end_screen_stars(1)
+        assert background is visualizer.quase_la_bg  # Já está no tamanho da tela
+        assert cache.misses == 3 and cache.hits == 4
+    finally:
+        visualizer.assets.shutdown()
+
+def test_derived_image_cache_builds_once():
+    """build() só é chamado na primeira vez para cada chave"""
+    cache = DerivedImageCache()
+    calls = []
+    build = lambda: calls.append(1) or "imagem"
+    assert cache.get(("a", 1), build) == "imagem"
+    assert cache.get(("a", 1), build) == "imagem"
+    assert len(calls) == 1
+    cache.clear()
+    cache.get(("a", 1), build)
+    assert len(calls) == 2
+
+if __name__ == "__main__":
+    test_images_load_in_background_and_are_deduplicated()
+    test_conversion_happens_on_pump()
+    test_end_screen_artwork_is_derived_once()
+    test_derived_image_cache_builds_once()
+    print("\n🏁 Testes de assets concluídos!")
@@ -0,0 +1,52 @@
+"""
+Testes dos fundos pré-calculados (gradientes e texturas via surfarray)
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+import backgrounds
+
+def test_gradient_matches_per_row_drawing():
+    """O gradiente NumPy tem os mesmos pixels do desenho linha a linha"""
+    print("🧪 Comparando gradiente com smoothstep...")
+    top, bottom = (255, 220, 130), (235, 185, 80)
+    width, height = 40, 120
+
+    expected = pygame.Surface((width, height))
+    for y in range(height):
+        ratio = y / height
+        smooth = ratio * ratio * (3.0 - 2.0 * ratio)
+        color = tuple(int(top[i] * (1 - smooth) + bottom[i] * smooth) for i in range(3))
+        pygame.draw.line(expected, color, (0, y), (width, y))
+
+    gradient = backgrounds.vertical_gradient((width, height), top, bottom, smooth=True)
+    mismatches = sum(
+        1 for y in range(height)
+        if tuple(gradient.get_at((7, y)))[:3] != tuple(expected.get_at((7, y)))[:3]
+    )
+    print(f"   Linhas diferentes: {mismatches}/{height}")
+    assert mismatches == 0
+
+def test_surfaces_are_cached_by_size_and_palette():
+    """Mesmo tamanho e paleta devolvem a mesma superfície; outra paleta gera outra"""
+    first = backgrounds.vertical_gradient((50, 50), (0, 0, 0), (255, 255, 255))
+    again = backgrounds.vertical_gradient((50, 50), (0, 0, 0), (255, 255, 255))
+    other = backgrounds.vertical_gradient((50, 50), (0, 0, 0), (255, 0, 0))
+    assert first is again
+    assert other is not first
+
+    texture = backgrounds.speckle_texture((200, 100), (20, 5, 10), seed=42)
+    assert texture is backgrounds.speckle_texture((200, 100), (20, 5, 10), seed=42)
+
+def test_glass_panel_alpha_gradient():
+    """O vidro começa com o alpha pedido e perde até 1/3 na base"""
+    panel = backgrounds.glass_panel((30, 90), (45, 45, 56), 150)
+    assert panel.get_at((10, 0)).a == 150
+    assert panel.get_at((10, 89)).a == 150 - (89 * 150 // 90 // 3)
+    assert tuple(panel.get_at((10, 45)))[:3] == (45, 45, 56)
+
+if __name__ == "__main__":
+    test_gradient_matches_per_row_drawing()
+    test_surfaces_are_cached_by_size_and_palette()
+    test_glass_panel_alpha_gradient()
+    print("\n🏁 Testes de fundos concluídos!")
@@ -0,0 +1,69 @@
+"""
+Testes dos bots de carga e soak
+"""
+import random
+from main import Game
+from bots import (STRATEGIES, make_strategy, check_invariants, greedy_by_weight, avoid_enemies, run_bot,
+                  run_soak, memory_growth)
+
+def test_strategies_return_valid_inputs():
+    """Cada estratégia devolve um vizinho do nó atual ou uma direção"""
+    game = Game(headless=True, seed=3)
+    game.start_level(1)
+    for name in STRATEGIES:
+        choice = make_strategy(name, random.Random(0))(game)
+        print(f"   {name}: {choice}")
+        if isinstance(choice, str):
+            assert choice in ("up", "down", "left", "right")
+        else:
+            assert game.world.graph.has_edge(game.player.current_node, choice)
+    assert greedy_by_weight(game) is not None
+    assert avoid_enemies(game) not in game.world.enemies or not game.world.enemies
+
+def test_invariants_catch_stuck_combat():
+    """Combate ativo fora do estado 'playing' é uma violação"""
+    game = Game(headless=True, seed=3)
+    game.start_level(1)
+    assert check_invariants(game) == []
+    game.combat_state = "fighting"
+    game.combat_node = None
+    game.game_state = "level_complete"
+    problems = check_invariants(game)
+    print(f"   problemas: {problems}")
+    assert any("combate ativo" in problem for problem in problems)
+
+def test_bots_run_without_crashes():
+    """Todas as estratégias jogam vários níveis sem exceções nem violações"""
+    print("🤖 Rodando um bot de cada estratégia...")
+    for name in STRATEGIES:
+        report = run_bot(name, seed=1, duration=30, max_sessions=20, chaos=0.3, memory_every=5)
+        print(f"   {name}: {report['sessions']} sessões, estados {report['states']}")
+        assert report["sessions"] == 20
+        assert report["crashes"] == 0, report["crash_samples"]
+        assert report["violations"] == 0, report["violation_samples"]
+    assert run_bot("optimal", seed=1, max_sessions=20)["states"].get("level_complete", 0) >= 15
+
+def test_soak_in_process_pool():
+    """Bots em processos separados e relatório agregado"""
+    summary = run_soak(bots=2, duration=30, strategies=("optimal", "chaos"), max_sessions=10)
+    print(f"   {summary['sessions']} sessões, {summary['sessions_per_second']:.1f}/s")
+    assert summary["bots"] == 2 and summary["sessions"] == 20
+    assert summary["crashes"] == 0 and summary["violations"] == 0
+    assert {bot["strategy"] for bot in summary["per_bot"]} == {"optimal", "chaos"}
+
+def test_memory_growth_slope():
+    """Crescimento linear da memória é detectado; memória estável dá ~0"""
+    leaking = [(i * 100, 50000 + i * 10, 1000 + i) for i in range(20)]
+    rss_growth, blocks_growth = memory_growth(leaking)
+    assert abs(rss_growth - 100) < 1e-6 and abs(blocks_growth - 10) < 1e-6
+    rss_growth, blocks_growth = memory_growth([(i, 50000, 1000) for i in range(20)])
+    assert abs(rss_growth) < 1e-6 and abs(blocks_growth) < 1e-6
+
+if __name__ == "__main__":
+    print("=" * 50)
+    test_strategies_return_valid_inputs()
+    test_invariants_catch_stuck_combat()
+    test_bots_run_without_crashes()
+    test_soak_in_process_pool()
+    test_memory_growth_slope()
+    print("\n✅ Testes dos bots passaram!")
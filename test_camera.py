@@ -0,0 +1,134 @@
+"""
+Testes da câmera (pan, zoom, acompanhamento) e do recorte pela área visível
+"""
+import math
+import os
+from types import SimpleNamespace
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+import networkx as nx
+import pygame
+from camera import Camera
+from main import Game
+from player import Player
+
+def _close(a, b):
+    return math.dist(a, b) < 1e-6
+
+def _big_world(nodes=1500, seed=4):
+    graph = nx.random_geometric_graph(nodes, 0.05, seed=seed)
+    for a, b in graph.edges():
+        graph[a][b]["weight"] = 1 + (a + b) % 9
+    return SimpleNamespace(graph=graph, level_id=99, end_node=nodes - 1, enemies=set(), optimal_path=[0],
+                           config={"name": "Teste"})
+
+def test_round_trip_and_zoom_anchor():
+    """to_world desfaz to_screen e o zoom mantém parado o ponto sob o cursor"""
+    camera = Camera(1000, 700)
+    camera.reset((0, 0, 5000, 4000))
+    camera.pan(-300, 120)
+    for point in [(0, 0), (1234.5, 987.25), (4999, 3999)]:
+        assert _close(camera.to_world(camera.to_screen(point)), point)
+
+    cursor = (820, 140)
+    anchor = camera.to_world(cursor)
+    camera.zoom_at(Camera.ZOOM_STEP ** 3, cursor)
+    assert camera.zoom > 1
+    assert _close(camera.to_screen(anchor), cursor)
+    camera.zoom_at(100, cursor)
+    assert camera.zoom == Camera.MAX_ZOOM
+
+def test_small_map_stays_centered():
+    """Um mapa que cabe na tela fica centralizado: pan e acompanhamento não o tiram do lugar"""
+    camera = Camera(1000, 700)
+    camera.reset((100, 100, 700, 500))
+    assert camera.min_zoom == 1.0
+    assert camera.center == (400, 300)
+    camera.pan(250, -80)
+    camera.follow((690, 490), 1.0)
+    assert camera.center == (400, 300)
+    camera.zoom_at(0.5, (10, 10))
+    assert camera.zoom == 1.0
+
+def test_existing_level_positions_unchanged():
+    """Os níveis atuais continuam centralizados na tela como antes da câmera"""
+    game = Game(headless=True)
+    game.start_level(1)
+    visualizer = game.visualizer
+    positions = visualizer._calculate_node_positions(game.world.graph)
+    layout = visualizer.graph_layout(game.world.graph)
+    for node in game.world.graph.nodes():
+        assert _close(positions[node], layout.positions[node])
+    xs = [x for x, _ in positions.values()]
+    ys = [y for _, y in positions.values()]
+    center = ((min(xs) + max(xs)) / 2, (min(ys) + max(ys)) / 2)
+    assert _close(center, (visualizer.width / 2, visualizer.height / 2))
+
+def test_large_map_follows_pans_and_hit_tests():
+    """Num mapa grande a câmera segue o jogador, arrasta com o mouse e os cliques acham o nó certo"""
+    game = Game()
+    game.start_level(1)
+    game.game_state = "playing"
+    visualizer = game.visualizer
+    camera = visualizer.camera
+    world = _big_world()
+    layout = visualizer.graph_layout(world.graph)
+    assert layout.bounds[2] - layout.bounds[0] > visualizer.width  # O mundo cresce com o número de nós
+
+    target = max(world.graph.nodes(), key=lambda node: layout.positions[node][0])
+    player = Player(starting_node=target)
+    camera.follow(layout.positions[target], 1.0)
+    assert math.dist(camera.to_screen(layout.positions[target]), (visualizer.width / 2, visualizer.height / 2)) \
+        < visualizer.width / 2
+
+    game.mouse_pos = (500, 350)
+    game.handle_camera_event(pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=2))
+    assert _close((camera.zoom,), (Camera.ZOOM_STEP ** 2,))
+    before = camera.center
+    game.handle_camera_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=3, pos=(500, 350)))
+    game.handle_camera_event(pygame.event.Event(pygame.MOUSEMOTION, rel=(40, -30), pos=(540, 320), buttons=(0, 0, 1)))
+    game.handle_camera_event(pygame.event.Event(pygame.MOUSEBUTTONUP, button=3, pos=(540, 320)))
+    assert camera.center != before and not camera.following
+    assert not game.camera_drag
+    game.handle_camera_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_c, mod=0, unicode="c", scancode=0))
+    assert camera.following
+
+    visible = layout.nodes_in(camera.view_rect())
+    assert visible
+    node = visible[len(visible) // 2]
+    x, y = camera.to_screen(layout.positions[node])
+    found = visualizer.nodes_at(world.graph, (x + 3, y), 40)
+    assert found[0][1] == node and abs(found[0][0] - 3) < 1e-6
+    assert all(distance <= 40 for distance, _ in found)
+    visualizer.draw_graph(world, player)
+
+def test_only_visible_nodes_are_drawn():
+    """Nós fora da área visível da câmera não chegam a _draw_nodes"""
+    game = Game()
+    visualizer = game.visualizer
+    world = _big_world()
+    layout = visualizer.graph_layout(world.graph)
+    visualizer.camera.zoom_at(Camera.MAX_ZOOM, (0, 0))
+    drawn = []
+    original = visualizer._draw_nodes
+    def spy(world, player, node_positions, clicked_nodes, hovered_node, nodes=None, detail=None):
+        drawn.extend(nodes)
+        return original(world, player, node_positions, clicked_nodes, hovered_node, nodes, detail)
+    visualizer._draw_nodes = spy
+    visualizer.draw_graph(world, Player(starting_node=0))
+    print(f"🎥 {len(drawn)} de {len(layout.positions)} nós desenhados")
+    assert 0 < len(drawn) < len(layout.positions) / 4
+    margin = visualizer.VIEW_MARGIN
+    for node in drawn:
+        x, y = visualizer.camera.to_screen(layout.positions[node])
+        assert -margin - 1 <= x <= visualizer.width + margin + 1
+        assert -margin - 1 <= y <= visualizer.height + margin + 1
+
+if __name__ == "__main__":
+    print("=" * 50)
+    test_round_trip_and_zoom_anchor()
+    test_small_map_stays_centered()
+    test_existing_level_positions_unchanged()
+    test_large_map_follows_pans_and_hit_tests()
+    test_only_visible_nodes_are_drawn()
+    print("\n✅ Todos os testes da câmera passaram!")
@@ -0,0 +1,66 @@
+"""
+Testes do estimador de dificuldade (Monte Carlo)
+"""
+import numpy as np
+from player import Player
+from level_data import level_data
+from difficulty import MODELS, PlayerModel, LevelArrays, simulate, score, estimate_level, estimate
+
+def test_level_arrays_distances():
+    """Custo até a saída bate com o caminho ótimo quando não há inimigos"""
+    level = level_data(1, 0)
+    arrays = LevelArrays(level)
+    assert arrays.distance[arrays.end] == 0
+    assert arrays.distance[arrays.start] == level.optimal_cost
+    assert arrays.enemy_count == 0
+    for i in range(len(arrays.degree)):
+        assert arrays.closer_count[i] > 0 or i == arrays.end
+
+def test_perfect_player_always_scores_three_stars():
+    """Jogador que sempre se aproxima da saída faz o caminho ótimo no nível sem inimigos"""
+    arrays = LevelArrays(level_data(1, 0))
+    run = simulate(arrays, PlayerModel(skill=1.0, caution=1.0, think=0.0), 500, np.random.default_rng(0))
+    efficiency, stars, _ = score(arrays, run)
+    assert (run["status"] == 1).all()
+    assert (run["cost"] == arrays.distance[arrays.start]).all()
+    assert np.allclose(run["elapsed"], run["steps"] * 0.5)
+    assert (stars == 3).all() and np.allclose(efficiency, 1.0)
+
+def test_stars_match_player_rules():
+    """Estrelas vetorizadas iguais às de Player.calculate_stars"""
+    arrays = LevelArrays(level_data(3, 0))
+    run = simulate(arrays, MODELS["novato"], 2000, np.random.default_rng(1))
+    efficiency, stars, _ = score(arrays, run)
+    player = Player()
+    for value, star in zip(efficiency[:300], stars[:300]):
+        assert player.calculate_stars(float(value)) == star
+
+def test_estimates_are_reproducible_and_ordered():
+    """Mesma semente, mesmo resultado; jogadores melhores concluem mais e ganham mais estrelas"""
+    print("🎲 Estimando nível 7...")
+    row = estimate_level(7, walkers=3000, rng_seed=5)
+    assert row == estimate_level(7, walkers=3000, rng_seed=5)
+    novice, master = row["models"]["novato"], row["models"]["mestre"]
+    print(f"   novato: {novice['completion_rate']:.2f} | mestre: {master['completion_rate']:.2f}")
+    assert row["enemies"] > 0
+    assert master["completion_rate"] > novice["completion_rate"]
+    assert master["expected_stars"] > novice["expected_stars"]
+    for stats in row["models"].values():
+        rates = stats["completion_rate"] + stats["death_rate"] + stats["timeout_rate"]
+        assert abs(rates - 1) < 1e-9
+        assert abs(sum(stats["stars"]) - 1) < 1e-9 or stats["completion_rate"] == 0
+
+def test_estimate_in_process_pool():
+    """Vários níveis e sementes em paralelo, na ordem pedida"""
+    rows = estimate(levels=(1, 4), seeds=(1, 2), models=("casual",), walkers=500, max_workers=2)
+    assert [(row["level_id"], row["seed"]) for row in rows] == [(1, 1), (1, 2), (4, 1), (4, 2)]
+    assert rows == estimate(levels=(1, 4), seeds=(1, 2), models=("casual",), walkers=500, max_workers=1)
+
+if __name__ == "__main__":
+    print("=" * 50)
+    test_level_arrays_distances()
+    test_perfect_player_always_scores_three_stars()
+    test_stars_match_player_rules()
+    test_estimates_are_reproducible_and_ordered()
+    test_estimate_in_process_pool()
+    print("\n✅ Testes do estimador de dificuldade passaram!")
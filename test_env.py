@@ -0,0 +1,97 @@
+"""
+Testes do ambiente de aprendizado por reforço (simples e vetorizado)
+"""
+import numpy as np
+from env import PathfinderEnv, VectorPathfinderEnv, benchmark
+
+def _optimal_actions(env):
+    """Ações que seguem o caminho ótimo do World do ambiente"""
+    path = env.world.optimal_path
+    actions = []
+    for current, following in zip(path, path[1:]):
+        row = list(env.arrays.neighbors[env.index[current], :env.arrays.degree[env.index[current]]])
+        actions.append(row.index(env.index[following]))
+    return actions
+
+def test_single_env_optimal_episode():
+    """Seguir o caminho ótimo conclui o nível com 3 estrelas e retorno igual à eficiência"""
+    env = PathfinderEnv(level_id=3, seed=7)
+    obs, info = env.reset()
+    assert obs["node"] == env.index[env.world.start_node]
+    assert info["action_mask"].sum() == env.arrays.degree[obs["node"]]
+    total = 0.0
+    for action in _optimal_actions(env):
+        obs, reward, terminated, truncated, info = env.step(action)
+        total += reward
+    assert terminated and not truncated
+    assert info["results"]["efficiency"] == 1.0 and info["results"]["stars"] == 3
+    assert abs(total - 1.0) < 1e-9
+
+def test_invalid_action_and_death():
+    """Ação fora da máscara não move; entrar em dois inimigos mata"""
+    env = PathfinderEnv(level_id=5, seed=1)
+    obs, info = env.reset()
+    obs2, _, terminated, _, info = env.step(env.max_actions)
+    assert info["invalid_action"] and obs2["node"] == obs["node"] and not terminated
+
+    enemies = set(env.world.enemies)
+    assert len(enemies) >= 2
+    env.reset()
+    env.world.enemies.update(env.world.graph.neighbors(env.world.start_node))
+    obs, _, terminated, _, info = env.step(0)
+    assert obs["health"] == 50 and not terminated
+    neighbor = next(iter(env.world.graph.neighbors(env.player.current_node)))
+    env.world.enemies.add(neighbor)
+    row = list(env.arrays.neighbors[obs["node"], :env.arrays.degree[obs["node"]]])
+    _, reward, terminated, _, info = env.step(row.index(env.index[neighbor]))
+    assert terminated and info["died"] and reward < -1
+
+def test_vector_env_matches_single_env():
+    """Mesmas ações nos dois ambientes: mesmas posições, vidas, recompensas e fins"""
+    print("🧠 Comparando ambiente simples e vetorizado...")
+    rng = np.random.default_rng(3)
+    for level_id in (1, 5, 7, 12, 17):
+        single = PathfinderEnv(level_id=level_id, seed=0)
+        vector = VectorPathfinderEnv(levels=[(level_id, 0)], num_envs=1)
+        single.reset()
+        vector.reset()
+        for _ in range(200):
+            action = int(vector.sample_actions(rng)[0])
+            obs, reward, terminated, truncated, info = single.step(action)
+            vobs, vreward, vterminated, vtruncated, vinfo = vector.step([action])
+            assert abs(reward - vreward[0]) < 1e-12
+            assert terminated == vterminated[0] and truncated == vtruncated[0]
+            if terminated or truncated:
+                if "results" in info:
+                    assert abs(info["results"]["efficiency"] - vinfo["efficiency"][0]) < 1e-12
+                single.reset()
+                continue
+            assert obs["node"] == vobs["node"][0] and obs["health"] == vobs["health"][0]
+            assert (obs["enemies"] == vobs["enemies"][0, :len(obs["enemies"])]).all()
+
+def test_vector_env_autoreset_and_throughput():
+    """Ambientes que terminam recomeçam sozinhos; o passo vetorizado é rápido"""
+    env = VectorPathfinderEnv(levels=range(1, 21), num_envs=256)
+    obs, info = env.reset()
+    assert info["action_mask"].shape == (256, env.max_actions)
+    rng = np.random.default_rng(0)
+    finished = 0
+    for _ in range(300):
+        obs, reward, terminated, truncated, info = env.step(env.sample_actions(rng))
+        done = info["done"]
+        finished += int(done.sum())
+        assert (obs["steps"][done] == 0).all() and (obs["health"][done] == 100).all()
+        assert (info["action_mask"][np.arange(256), 0]).all()
+    assert finished > 0
+
+    stats = benchmark(num_envs=4096, steps=100)
+    print(f"   {stats['steps_per_second']:,.0f} passos/s")
+    assert stats["steps_per_second"] > 100_000
+
+if __name__ == "__main__":
+    print("=" * 50)
+    test_single_env_optimal_episode()
+    test_invalid_action_and_death()
+    test_vector_env_matches_single_env()
+    test_vector_env_autoreset_and_throughput()
+    print("\n✅ Testes do ambiente de RL passaram!")
@@ -0,0 +1,66 @@
+"""
+Testes do relógio de simulação com passo fixo
+"""
+from game_clock import GameClock, VirtualTimeSource
+
+def _run_frames(frame_times):
+    """Simula frames de duração variável e retorna o relógio"""
+    source = VirtualTimeSource()
+    clock = GameClock(time_source=source)
+    clock.begin_frame()
+
+    for frame_time in frame_times:
+        source.advance(frame_time)
+        clock.begin_frame()
+        while clock.consume_step():
+            pass
+    return clock
+
+def test_fixed_steps_independent_of_frame_rate():
+    """O número de passos depende só do tempo total, não da taxa de frames"""
+    print("🧪 Testando passos fixos com frames irregulares...")
+
+    smooth = _run_frames([1 / 60] * 120)
+    dropped = _run_frames([1 / 60] * 30 + [0.2] * 5 + [1 / 60] * 30)
+    uncapped = _run_frames([1 / 240] * 480)
+
+    print(f"   Passos: suave={smooth.tick_count} travado={dropped.tick_count} sem limite={uncapped.tick_count}")
+    assert abs(smooth.tick_count - 120) <= 1
+    assert abs(dropped.tick_count - 120) <= 1
+    assert abs(uncapped.tick_count - 120) <= 1
+    assert smooth.now() == smooth.tick_count * smooth.step_dt
+
+def test_frame_time_is_clamped():
+    """Uma travada longa não gera milhares de passos de uma vez"""
+    print("🧪 Testando limite de tempo por frame...")
+
+    clock = _run_frames([5.0])
+    max_steps = clock.seconds_to_steps(clock.max_frame_time)
+    print(f"   Passos após travada de 5s: {clock.tick_count} (máximo {max_steps})")
+    assert clock.tick_count <= max_steps
+
+def test_interpolation_alpha():
+    """O tempo de renderização fica entre o passo atual e o próximo"""
+    print("🧪 Testando interpolação para renderização...")
+
+    clock = _run_frames([1.5 / 60])
+    print(f"   Passos: {clock.tick_count} | alpha: {clock.alpha:.2f}")
+    assert clock.tick_count == 1
+    assert 0.0 <= clock.alpha < 1.0
+    assert clock.now() <= clock.render_time() < clock.now() + clock.step_dt
+
+def test_virtual_step():
+    """step() avança a simulação e o tempo virtual juntos"""
+    source = VirtualTimeSource()
+    clock = GameClock(time_source=source)
+    for _ in range(clock.seconds_to_steps(1.0)):
+        clock.step()
+    assert clock.tick_count == 60
+    assert abs(source() - 1.0) < 1e-9
+
+if __name__ == "__main__":
+    test_fixed_steps_independent_of_frame_rate()
+    test_frame_time_is_clamped()
+    test_interpolation_alpha()
+    test_virtual_step()
+    print("\n🏁 Testes do relógio concluídos!")
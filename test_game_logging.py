@@ -0,0 +1,103 @@
+"""
+Testes do sistema de logging do jogo
+"""
+import contextlib
+import io
+import logging
+import os
+import tempfile
+import threading
+import game_logging
+from game_logging import get_logger, setup_logging, shutdown_logging
+
+class _Expensive:
+    """Objeto cujo __str__ conta as formatações"""
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return "caro"
+
+class _ThreadRecorder(logging.Handler):
+    """Guarda a thread em que cada registro foi escrito"""
+    def __init__(self):
+        super().__init__()
+        self.threads = []
+
+    def emit(self, record):
+        self.threads.append(threading.current_thread().name)
+
+def test_disabled_level_does_not_format():
+    """Abaixo do nível configurado a mensagem nem é formatada"""
+    print("🧪 Logando em nível desativado...")
+    setup_logging("WARNING", console=False)
+    try:
+        logger = get_logger("teste")
+        value = _Expensive()
+        for _ in range(1000):
+            logger.debug("valor: %s", value)
+        print(f"   formatações: {value.formatted}")
+        assert value.formatted == 0
+        assert not logger.isEnabledFor(logging.DEBUG)
+        assert logger.isEnabledFor(logging.WARNING)
+    finally:
+        shutdown_logging()
+
+def test_records_are_written_off_the_main_thread():
+    """O jogo só enfileira; a escrita acontece na thread do QueueListener"""
+    print("🧪 Verificando escrita em segundo plano...")
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = os.path.join(tmp, "jogo.log")
+        setup_logging("DEBUG", log_file=log_file, console=False)
+        recorder = _ThreadRecorder()
+        game_logging._listener.handlers += (recorder,)
+
+        logger = get_logger("teste")
+        logger.info("🎮 Nível %s iniciado", 3)
+        logger.debug("movimento %s → %s", 1, 2)
+        shutdown_logging()  # Esvazia a fila antes de ler o arquivo
+
+        with open(log_file, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        print(f"   {len(lines)} linhas, threads: {set(recorder.threads)}")
+        assert len(lines) == 2
+        assert "INFO" in lines[0] and "pathfinder.teste" in lines[0] and "Nível 3 iniciado" in lines[0]
+        assert "movimento 1 → 2" in lines[1]
+        assert recorder.threads and threading.main_thread().name not in recorder.threads
+
+def test_game_modules_use_game_loggers():
+    """world, visualizer e main registram no logger 'pathfinder'"""
+    import world
+    import visualizer
+    import main
+    for module in (world, visualizer, main):
+        assert module.logger.name.startswith(game_logging.ROOT_LOGGER + ".")
+
+def test_level_generation_is_quiet_without_setup():
+    """Sem setup_logging (uso como biblioteca) gerar níveis não escreve nada nem avisa"""
+    print("🧪 Gerando níveis sem configurar o logging...")
+    from world import World
+    shutdown_logging()
+    warnings = _ThreadRecorder()
+    warnings.setLevel(logging.WARNING)
+    root = logging.getLogger(game_logging.ROOT_LOGGER)
+    root.addHandler(warnings)
+    stderr = io.StringIO()
+    try:
+        with contextlib.redirect_stderr(stderr):
+            for level_id in range(1, 21):
+                World(level_id, seed=0)
+    finally:
+        root.removeHandler(warnings)
+    assert stderr.getvalue() == ""
+    assert warnings.threads == []  # Desvio dos inimigos é rotina, não aviso
+    assert any(isinstance(handler, logging.NullHandler) for handler in root.handlers)
+
+if __name__ == "__main__":
+    print("=" * 50)
+    test_disabled_level_does_not_format()
+    test_records_are_written_off_the_main_thread()
+    test_game_modules_use_game_loggers()
+    test_level_generation_is_quiet_without_setup()
+    print("\n✅ Todos os testes de logging passaram!")
@@ -0,0 +1,98 @@
+"""
+Testes do layout com índice espacial e do desenho com nível de detalhe (LOD)
+"""
+import math
+import os
+import random
+import time
+from types import SimpleNamespace
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+import networkx as nx
+from graph_layout import GraphLayout, decompose_trails
+from main import Game
+from player import Player
+from visualizer import LOD_DOTS, LOD_FULL
+
+def _big_graph(nodes=2000, seed=1):
+    graph = nx.random_geometric_graph(nodes, 0.04, seed=seed)
+    for a, b in graph.edges():
+        graph[a][b]["weight"] = 1 + (a + b) % 9
+    return graph
+
+def test_trails_cover_each_edge_once():
+    """Cada aresta aparece em exatamente uma trilha e as trilhas respeitam o limite"""
+    graph = _big_graph(500)
+    trails = decompose_trails(graph, max_edges=16)
+    used = [frozenset(pair) for trail in trails for pair in zip(trail, trail[1:])]
+    print(f"🧵 {graph.number_of_edges()} arestas em {len(trails)} trilhas")
+    assert len(used) == len(set(used)) == graph.number_of_edges()
+    assert all(graph.has_edge(*pair) for pair in map(tuple, used))
+    assert all(len(trail) <= 17 for trail in trails)
+    assert len(trails) < graph.number_of_edges() / 2
+
+def test_spatial_queries_match_brute_force():
+    """Consultas por retângulo e por raio dão o mesmo que percorrer todos os nós"""
+    graph = _big_graph(800, seed=2)
+    rng = random.Random(3)
+    positions = {node: (rng.uniform(0, 1000), rng.uniform(0, 700)) for node in graph.nodes()}
+    layout = GraphLayout(graph, positions)
+    for _ in range(50):
+        x, y = rng.uniform(-100, 1100), rng.uniform(-100, 800)
+        rect = (x, y, x + rng.uniform(0, 300), y + rng.uniform(0, 300))
+        inside = {n for n, (px, py) in positions.items() if rect[0] <= px <= rect[2] and rect[1] <= py <= rect[3]}
+        assert set(layout.nodes_in(rect)) == inside
+
+        near = sorted((math.dist((x, y), p), n) for n, p in positions.items() if math.dist((x, y), p) <= 40)
+        assert [n for _, n in layout.nodes_near((x, y), 40)] == [n for _, n in near]
+
+def test_clicks_use_cached_layout():
+    """Clique e hover acham o nó pelo índice espacial; as posições não são recalculadas"""
+    game = Game(headless=True)
+    game.start_level(1)
+    positions = game.visualizer._calculate_node_positions(game.world.graph)
+    assert positions is game.visualizer._calculate_node_positions(game.world.graph)
+    node = game.world.end_node
+    x, y = positions[node]
+    assert game.get_clicked_node((x + 10, y)) == node
+    assert game.get_clicked_node((x + 45, y + 45)) is None
+    game.mouse_pos = (x, y - 5)
+    game.detect_hovered_node()
+    assert game.hovered_node == node
+
+def test_large_graph_renders_with_less_detail():
+    """Um grafo de 2000 nós visto inteiro é desenhado como pontos e sem rótulos, mais rápido que com tudo"""
+    game = Game()
+    visualizer = game.visualizer
+    game.start_level(1)
+    assert visualizer.detail_level(visualizer.graph_layout(game.world.graph)) == LOD_FULL
+
+    graph = _big_graph()
+    world = SimpleNamespace(graph=graph, level_id=99, end_node=1999, enemies={10, 20}, optimal_path=[0],
+                            config={"name": "Teste"})
+    player = Player(starting_node=0)
+    layout = visualizer.graph_layout(graph)
+    visualizer.camera.zoom_at(0, (visualizer.width / 2, visualizer.height / 2))  # Afasta até o mapa inteiro caber
+    assert visualizer.detail_level(layout) == LOD_DOTS
+
+    def frame_time():
+        started = time.perf_counter()
+        for _ in range(5):
+            visualizer.draw_graph(world, player)
+        return (time.perf_counter() - started) / 5
+
+    visualizer._labels.clear()
+    dots = frame_time()
+    assert "9" not in visualizer._labels  # Nenhum peso renderizado
+    visualizer.LOD_LABEL_SPACING = visualizer.LOD_DOT_SPACING = 0  # Força o detalhe completo
+    full = frame_time()
+    print(f"🖼️ 2000 nós: {dots * 1000:.1f} ms com LOD, {full * 1000:.1f} ms com todos os detalhes")
+    assert dots < full
+
+if __name__ == "__main__":
+    print("=" * 50)
+    test_trails_cover_each_edge_once()
+    test_spatial_queries_match_brute_force()
+    test_clicks_use_cached_layout()
+    test_large_graph_renders_with_less_detail()
+    print("\n✅ Todos os testes de layout passaram!")
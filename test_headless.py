@@ -0,0 +1,54 @@
+"""
+Testes do modo headless (sem tela, áudio ou vídeo, em tempo virtual)
+"""
+from main import Game
+from headless import run_session, random_walk
+import random
+
+def test_headless_game_has_no_display():
+    """Game headless não abre janela nem mixer"""
+    print("🧪 Criando Game headless...")
+    game = Game(headless=True)
+
+    assert game.visualizer.screen is None
+    assert game.video_player is None
+    assert game.persist_progress is False
+    print("✅ Nenhuma janela criada")
+
+def test_headless_session_completes_level():
+    """Seguindo o caminho ótimo o nível termina com 3 estrelas"""
+    print("🧪 Jogando nível 1 em modo headless...")
+    result = run_session(1)
+
+    print(f"   Estado: {result['state']} | Caminho: {result['path']} | Tempo simulado: {result['sim_time']:.2f}s")
+    assert result["state"] == "level_complete"
+    assert result["results"]["efficiency"] == 1.0
+    assert result["results"]["stars_earned"] == 3
+
+def test_headless_sessions_are_deterministic():
+    """Mesma estratégia e mesma semente produzem a mesma sessão"""
+    print("🧪 Verificando determinismo do tempo virtual...")
+    first = run_session(2, choose_move=random_walk(random.Random(7)), max_seconds=60)
+    second = run_session(2, choose_move=random_walk(random.Random(7)), max_seconds=60)
+
+    assert first["path"] == second["path"]
+    assert first["sim_time"] == second["sim_time"]
+    if first["results"]:
+        assert first["results"]["time_taken"] == second["results"]["time_taken"]
+
+def test_headless_combat_loop():
+    """Níveis com inimigos rodam combate e pontuação sem tela"""
+    print("🧪 Jogando nível com inimigos em modo headless...")
+    game = Game(headless=True)
+    result = run_session(5, game=game)
+
+    print(f"   Estado: {result['state']} | Inimigos restantes: {list(game.world.enemies)}")
+    assert result["state"] in ("level_complete", "player_dead", "game_over")
+    assert not game.is_in_combat()
+
+if __name__ == "__main__":
+    test_headless_game_has_no_display()
+    test_headless_session_completes_level()
+    test_headless_sessions_are_deterministic()
+    test_headless_combat_loop()
+    print("\n🏁 Testes headless concluídos!")
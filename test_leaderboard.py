@@ -0,0 +1,138 @@
+"""
+Testes do ranking em skip list e do servidor de placar
+"""
+import asyncio
+import bisect
+import json
+import os
+import random
+import tempfile
+from ranking import IndexableSkipList, Leaderboard
+from leaderboard_server import LeaderboardServer, load_test, _request
+from headless import run_session
+from main import Game
+from verifier import submission_from_game
+
+def test_skip_list_matches_sorted_list():
+    """Inserções, remoções, posições e fatias batem com uma lista ordenada"""
+    print("🧪 Comparando skip list com lista ordenada...")
+    rng = random.Random(1)
+    skip = IndexableSkipList(seed=2)
+    reference = []
+    for _ in range(3000):
+        if reference and rng.random() < 0.3:
+            key = reference.pop(rng.randrange(len(reference)))
+            skip.remove(key)
+        else:
+            key = (rng.randint(0, 500), rng.random())
+            bisect.insort(reference, key)
+            skip.insert(key)
+
+    assert len(skip) == len(reference)
+    assert list(skip) == reference
+    for position in rng.sample(range(len(reference)), 50):
+        assert skip[position] == reference[position]
+        assert skip.index(reference[position]) == position
+    assert skip.slice(10, 25) == reference[10:25]
+    assert skip[-1] == reference[-1]
+
+def test_leaderboard_keeps_best_run_per_player():
+    """Cada jogador aparece uma vez, com a melhor partida (pontuação, depois tempo)"""
+    board = Leaderboard()
+    board.submit("ana", 1, 120, 30.0)
+    board.submit("bia", 1, 140, 40.0)
+    board.submit("caio", 1, 120, 25.0)
+    assert board.submit("ana", 1, 100, 10.0)["improved"] is False  # Pior: ignorada
+    result = board.submit("ana", 1, 150, 50.0)
+    assert result == {"level_id": 1, "player": "ana", "rank": 1, "improved": True, "total": 3}
+
+    ranking = board.levels[1]
+    assert [row["player"] for row in ranking.top(10)] == ["ana", "bia", "caio"]
+    assert ranking.rank("caio") == 3
+    assert [row["rank"] for row in ranking.around("bia", radius=1)] == [1, 2, 3]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "placar.json")
+        board.save(path)
+        loaded = Leaderboard.load(path)
+    assert loaded.levels[1].top(10) == ranking.top(10)
+    assert loaded.submit("dani", 1, 1, 1.0)["rank"] == 4
+
+def test_server_end_to_end_and_load():
+    """O servidor responde às rotas, valida partidas e aguenta o teste de carga"""
+    print("🧪 Subindo servidor de placar...")
+
+    async def verified(game_submission):
+        server = await LeaderboardServer(port=0).start()
+        reader, writer = await asyncio.open_connection(server.host, server.port)
+        try:
+            status, body = await _request(reader, writer, "POST", "/submit", game_submission)
+            assert status == 200 and body["rank"] == 1, body
+
+            # Com verificação, pontuação informada sem caminho não entra no placar
+            claimed = {"player": "ana", "level_id": 1, "total_score": 150, "time_taken": 0.1}
+            status, body = await _request(reader, writer, "POST", "/submit", claimed)
+            assert status == 422 and "caminho" in body["error"], body
+
+            cheat = {"player": "trapaça", "level_id": 1, "seed": 1, "path": [0, 5], "times": [0.0, 0.1],
+                     "total_score": 150, "time_taken": 0.1}
+            status, body = await _request(reader, writer, "POST", "/submit", cheat)
+            assert status == 422, body
+            seedless = {key: value for key, value in game_submission.items() if key != "seed"}
+            status, body = await _request(reader, writer, "POST", "/submit", dict(seedless, player="sem semente"))
+            assert status == 422 and "semente" in body["error"], body
+        finally:
+            writer.close()
+            await server.close()
+
+    async def scenario(tmp):
+        snapshot = os.path.join(tmp, "placar.json")
+        # Sem verificação (como no --bench): rotas e carga com pontuações informadas
+        server = await LeaderboardServer(port=0, snapshot_path=snapshot, snapshot_interval=60, verify=False).start()
+        reader, writer = await asyncio.open_connection(server.host, server.port)
+        try:
+            status, body = await _request(reader, writer, "POST", "/submit",
+                                          {"player": "ana", "level_id": 3, "total_score": 130, "time_taken": 12.5})
+            assert status == 200 and body["rank"] == 1
+
+            status, body = await _request(reader, writer, "GET", "/levels/3/rank?player=ana")
+            assert status == 200 and body["rank"] == 1
+            status, _ = await _request(reader, writer, "GET", "/levels/3/rank?player=ninguem")
+            assert status == 404
+
+            stats = await load_test(server.host, server.port, total=4000, concurrency=16)
+            print(f"   {stats['requests']} req em {stats['elapsed']:.2f}s → {stats['requests_per_second']:.0f} req/s")
+            assert stats["requests"] == 4000 and stats["errors"] == 0
+
+            status, body = await _request(reader, writer, "GET", "/levels/3/top?n=5")
+            scores = [row["score"] for row in body["top"]]
+            assert scores == sorted(scores, reverse=True)
+
+            # Linha de requisição ou Content-Length malformados: 400 e a conexão é fechada
+            for raw in (b"LIXO\r\n\r\n", b"POST /submit HTTP/1.1\r\nContent-Length: abc\r\n\r\n",
+                        b"POST /submit HTTP/1.1\r\nContent-Length: -5\r\n\r\n"):
+                bad_reader, bad_writer = await asyncio.open_connection(server.host, server.port)
+                bad_writer.write(raw)
+                await bad_writer.drain()
+                response = await asyncio.wait_for(bad_reader.read(), timeout=5)
+                bad_writer.close()
+                assert response.startswith(b"HTTP/1.1 400") and b"Connection: close" in response, response
+        finally:
+            writer.close()
+            await server.close()
+
+        with open(snapshot, encoding="utf-8") as f:
+            assert "ana" in json.dumps(json.load(f))
+
+    game = Game(headless=True, seed=3)
+    assert run_session(1, game=game, max_seconds=120)["state"] == "level_complete"
+    asyncio.run(verified(dict(submission_from_game(game), player="bia")))
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(scenario(tmp))
+
+if __name__ == "__main__":
+    print("=" * 50)
+    test_skip_list_matches_sorted_list()
+    test_leaderboard_keeps_best_run_per_player()
+    test_server_end_to_end_and_load()
+    print("\n✅ Todos os testes do placar passaram!")
@@ -0,0 +1,77 @@
+"""
+Testes do sistema de partículas vetorizado
+"""
+import os
+import time
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import numpy as np
+import pygame
+from particles import ParticleSystem, StampSet
+
+def _dot_stamps():
+    return StampSet((4, 4), lambda stamp, alpha: pygame.draw.circle(stamp, (255, 255, 255, alpha), (2, 2), 2))
+
+def test_dead_particles_are_swap_removed():
+    """Partículas mortas saem e as vivas continuam com os próprios dados"""
+    print("🧪 Testando remoção por troca...")
+    system = ParticleSystem([_dot_stamps()], capacity=4)
+    lives = [30, 3, 60, 3, 90, 6]
+    system.emit(np.arange(6), 0, 1, 0, life=lives)  # x = índice original
+
+    assert system.capacity >= 6  # Cresceu além da capacidade inicial
+    system.update(decay=3)  # Morrem as partículas de vida 3
+    assert len(system) == 4
+    survivors = sorted(zip(system.x[:4].tolist(), system.life[:4].tolist()))
+    print(f"   Vivas (x, vida): {survivors}")
+    assert survivors == [(1.0, 27.0), (3.0, 57.0), (5.0, 87.0), (6.0, 3.0)]
+
+    system.update(decay=3)
+    assert len(system) == 3
+
+def test_matches_dict_particles():
+    """Mesma simulação do sistema antigo (lista de dicts com remove)"""
+    rng = np.random.default_rng(3)
+    vx, vy = rng.uniform(-1, 1, 200), rng.uniform(-1, 1, 200)
+    lives = rng.integers(1, 255, 200)
+
+    reference = [{'x': 0.0, 'y': 0.0, 'vx': vx[i], 'vy': vy[i], 'life': int(lives[i])} for i in range(200)]
+    system = ParticleSystem([_dot_stamps()])
+    system.emit(0.0, 0.0, vx, vy, life=lives)
+
+    for _ in range(40):
+        for particle in reference[:]:
+            particle['x'] += particle['vx']
+            particle['y'] += particle['vy']
+            particle['life'] -= 3
+            if particle['life'] <= 0:
+                reference.remove(particle)
+        system.update(decay=3)
+
+    assert len(system) == len(reference)
+    expected = np.sort([p['x'] for p in reference])
+    assert np.allclose(np.sort(system.x[:len(system)]), expected, atol=1e-3)  # float32 x float64
+
+def test_thousands_of_particles_per_frame():
+    """Milhares de partículas atualizadas e desenhadas por frame"""
+    print("🧪 Medindo 5000 partículas...")
+    pygame.display.init()
+    screen = pygame.display.set_mode((800, 600))
+    system = ParticleSystem([_dot_stamps()])
+    rng = np.random.default_rng(0)
+    system.emit(rng.uniform(0, 800, 5000), rng.uniform(0, 600, 5000),
+                rng.uniform(-1, 1, 5000), rng.uniform(-1, 1, 5000), life=rng.uniform(100, 255, 5000))
+
+    started = time.perf_counter()
+    for _ in range(10):
+        system.update(decay=3)
+        system.draw(screen)
+    per_frame = (time.perf_counter() - started) / 10
+    print(f"   {len(system)} partículas: {per_frame * 1000:.2f} ms por frame")
+    assert len(system) == 5000
+    assert per_frame < 0.1
+
+if __name__ == "__main__":
+    test_dead_particles_are_swap_removed()
+    test_matches_dict_particles()
+    test_thousands_of_particles_per_frame()
+    print("\n🏁 Testes de partículas concluídos!")
@@ -0,0 +1,75 @@
+"""
+Testes do histórico compacto de caminho (PathHistory) e do Player com __slots__
+"""
+import sys
+import numpy as np
+from path_history import PathHistory
+from player import Player
+from run_history import RunHistory, path_from_row
+
+def test_path_history_behaves_like_a_list():
+    """Acesso, fatias, igualdade e pertinência funcionam como na lista antiga"""
+    print("🧪 PathHistory como lista...")
+    path = PathHistory([0, 3, 1])
+    path.append(7)
+    assert len(path) == 4 and path[-1] == 7 and path.last == 7
+    assert path[1:3] == [3, 1]
+    assert path == [0, 3, 1, 7] and path == (0, 3, 1, 7) and path != [0, 3, 1]
+    assert 3 in path and 5 not in path and -1 not in path and "a" not in path
+    assert list(path) == path.tolist() == [0, 3, 1, 7]
+    assert PathHistory().last is None
+
+    # Nós do NumPy (env vetorizado, difficulty) valem como int
+    path.append(np.int64(9))
+    assert np.int64(9) in path and np.int32(3) in path and np.int64(5) not in path
+    assert type(path.last) is int and PathHistory(np.array([4, 2])) == [4, 2]
+
+def test_delta_encoding_round_trip_is_compact():
+    """Caminhos longos com vizinhos próximos ocupam cerca de 1 byte por passo"""
+    print("🧪 Codificação delta...")
+    nodes = [(i * 7) % 50 for i in range(10000)] + [2 ** 32 - 1, 0]
+    path = PathHistory(nodes)
+    data = path.to_bytes()
+    print(f"   {len(nodes)} nós: {len(data)} bytes codificados, {path.nbytes} no array, "
+          f"{sys.getsizeof(nodes)} só na lista")
+    assert PathHistory.from_bytes(data) == nodes
+    assert PathHistory.from_bytes(PathHistory().to_bytes()) == []
+    assert len(data) < 2 * len(nodes)
+
+def test_player_uses_slots_and_new_path_per_level():
+    """Os atributos do Player ficam nos slots e reset_level não altera o caminho já entregue"""
+    print("🧪 Player compacto...")
+    player = Player("Ana", 4)
+    assert "path_taken" in Player.__slots__ and not hasattr(player, "__dict__")  # Tudo nos slots
+    player.move_to_node(5)
+    player.move_to_node(5)  # Repetido não entra
+    player.move_to_node(2)
+    finished = player.path_taken
+    assert finished == [4, 5, 2]
+
+    player.reset_level(0)
+    player.move_to_node(1)
+    assert finished == [4, 5, 2] and player.path_taken == [0, 1]
+
+def test_run_history_reads_blob_and_legacy_json_paths():
+    """O histórico grava o caminho em BLOB e ainda lê o JSON dos bancos antigos"""
+    print("🧪 Caminho no histórico...")
+    history = RunHistory(":memory:")
+    results = {"level_id": 1, "time_taken": 5.0, "player_distance": 2, "optimal_distance": 2,
+               "efficiency": 1.0, "total_score": 100}
+    history.record_run("ana", results, PathHistory([0, 4, 9]), 3)
+    history.record_run("ana", dict(results, efficiency=0.5), [0, 1, 2, 9], 1)
+    stored = history._query("SELECT path FROM runs ORDER BY id", ()).fetchall()
+    assert all(isinstance(row[0], bytes) for row in stored)
+    assert history.best_path("ana", 1) == [0, 4, 9]
+    assert history.best_path("ana", 2) is None
+    assert path_from_row("[0, 1, 2]") == [0, 1, 2]
+    history.close()
+
+if __name__ == "__main__":
+    print("=" * 50)
+    test_path_history_behaves_like_a_list()
+    test_delta_encoding_round_trip_is_compact()
+    test_player_uses_slots_and_new_path_per_level()
+    test_run_history_reads_blob_and_legacy_json_paths()
+    print("\n✅ Todos os testes do histórico de caminho passaram!")
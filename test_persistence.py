@@ -0,0 +1,80 @@
+"""
+Testes da persistência do progresso em segundo plano
+"""
+import json
+import os
+import tempfile
+import time
+from persistence import ProgressStore, atomic_write
+
+def test_atomic_write_replaces_whole_file():
+    """A escrita atômica troca o arquivo inteiro e não deixa temporários"""
+    print("🧪 Gravando de forma atômica...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "progresso.json")
+        atomic_write(path, '{"a": 1}')
+        atomic_write(path, b'{"a": 2}')
+        with open(path, encoding="utf-8") as f:
+            assert json.load(f) == {"a": 2}
+        assert os.listdir(tmp) == ["progresso.json"]
+
+def test_atomic_write_keeps_previous_version_on_failure():
+    """Se a gravação falhar no meio, o arquivo anterior continua intacto"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "progresso.json")
+        atomic_write(path, '{"nivel": 3}')
+
+        class _Broken:
+            pass
+        try:
+            atomic_write(path, _Broken())  # Falha ao escrever: não é str nem bytes
+        except TypeError:
+            pass
+        else:
+            assert False, "deveria falhar"
+        with open(path, encoding="utf-8") as f:
+            assert json.load(f) == {"nivel": 3}
+        assert os.listdir(tmp) == ["progresso.json"]
+
+def test_saves_are_coalesced_off_thread():
+    """Vários pedidos seguidos viram uma única gravação com o estado mais recente"""
+    print("🧪 Agrupando pedidos de gravação...")
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ProgressStore(os.path.join(tmp, "progresso.json"), debounce=0.2)
+        data = {"stars_earned": {}, "current_level": 1}
+
+        started = time.perf_counter()
+        for level in range(1, 51):
+            data["stars_earned"][level] = 3
+            data["current_level"] = level
+            store.save(data)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        print(f"   50 pedidos em {elapsed_ms:.2f} ms, gravações até agora: {store.writes}")
+        assert store.writes == 0  # Ainda dentro do debounce
+        assert store.load() is None
+
+        data["current_level"] = 999  # Mexer depois do save não altera o que foi agendado
+        assert store.flush()
+        assert store.writes == 1
+        saved = store.load()
+        assert saved["current_level"] == 50
+        assert len(saved["stars_earned"]) == 50
+        store.close()
+
+def test_close_flushes_pending_save():
+    """Fechar grava o pedido pendente mesmo com debounce longo"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "progresso.json")
+        store = ProgressStore(path, debounce=60)
+        store.save({"current_level": 7})
+        assert store.close()
+        with open(path, encoding="utf-8") as f:
+            assert json.load(f) == {"current_level": 7}
+
+if __name__ == "__main__":
+    print("=" * 50)
+    test_atomic_write_replaces_whole_file()
+    test_atomic_write_keeps_previous_version_on_failure()
+    test_saves_are_coalesced_off_thread()
+    test_close_flushes_pending_save()
+    print("\n✅ Todos os testes de persistência passaram!")
@@ -0,0 +1,82 @@
+"""
+Testes do profiler de tempo de frame
+"""
+import csv
+import os
+import tempfile
+import time
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+from profiler import FrameProfiler
+from main import Game
+
+class _Stage:
+    def fast(self):
+        return "ok"
+
+    def _slow(self):
+        time.sleep(0.002)
+
+def test_sections_are_timed_per_frame():
+    """Cada método instrumentado soma o seu tempo dentro do frame"""
+    print("🧪 Instrumentando métodos...")
+    profiler = FrameProfiler(window=50)
+    stage = _Stage()
+    profiler.instrument(stage, ["fast", "_slow"])
+
+    for _ in range(10):
+        profiler.begin_frame()
+        assert stage.fast() == "ok"
+        stage._slow()
+        stage._slow()
+        profiler.end_frame()
+
+    p50, p95, p99 = profiler.percentiles("slow")
+    print(f"   slow p50={p50:.2f} p95={p95:.2f} p99={p99:.2f} ms | FPS {profiler.fps():.0f}")
+    assert p50 >= 4.0  # Duas chamadas de 2 ms por frame
+    assert p50 <= p95 <= p99
+    assert profiler.percentiles("fast")[0] < p50
+    assert profiler.percentiles("frame")[0] >= p50
+    assert len(profiler.samples["frame"]) == 10
+    assert profiler.histogram("slow", bins=5)[0].sum() == 10
+
+def test_csv_and_overlay():
+    """O CSV tem uma linha por frame e o overlay desenha sem erros"""
+    pygame.init()
+    profiler = FrameProfiler()
+    stage = _Stage()
+    profiler.instrument(stage, ["fast"])
+    for _ in range(3):
+        profiler.begin_frame()
+        stage.fast()
+        profiler.end_frame()
+
+    profiler.toggle_overlay()
+    profiler.draw_overlay(pygame.Surface((800, 600)))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = profiler.dump_csv(os.path.join(tmp, "frames.csv"))
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+    assert len(rows) == 3
+    assert {"index", "frame", "allocations", "fast"} <= set(rows[0])
+    assert [row["index"] for row in rows] == ["0", "1", "2"]
+
+def test_game_profiler_is_opt_in():
+    """Sem profiler os métodos do Game não são embrulhados"""
+    game = Game(headless=True)
+    assert game.profiler is None
+    assert "update" not in vars(game)
+
+    profiler = game.enable_profiler()
+    game.start_level(1)
+    profiler.begin_frame()
+    game.step(3)
+    profiler.end_frame()
+    assert len(profiler.samples["update"]) == 1
+
+if __name__ == "__main__":
+    test_sections_are_timed_per_frame()
+    test_csv_and_overlay()
+    test_game_profiler_is_opt_in()
+    print("\n🏁 Testes do profiler concluídos!")
@@ -0,0 +1,92 @@
+"""
+Testes da gravação e replay determinístico de entradas
+"""
+import os
+import random
+import tempfile
+from main import Game
+from headless import run_session, random_walk
+from replay import (InputRecorder, Recording, ReplayDesyncError, replay, encode_varint, decode_varint,
+                    LEVEL_SEED, NODE_CLICK, RESET_LIVES)
+
+def _recorded_session(level_id, choose_move, seed=123):
+    game = Game(headless=True)
+    game.player.update_level_stars(level_id - 1, 3)  # Libera o nível antes de gravar
+    recorder = InputRecorder(game, seed=seed)
+    result = run_session(level_id, choose_move=choose_move, game=game, unlock=False, max_seconds=60)
+    game.reset_player_lives()
+    game.restart_level()
+    if game.game_state == "playing":
+        game.move_player_direction("right")
+    game.advance(1.0)
+    return recorder.finish(), result, game
+
+def test_varints_roundtrip():
+    """Varints ocupam 1 byte até 127 e voltam ao mesmo valor"""
+    out = bytearray()
+    values = [0, 1, 127, 128, 300, 2**32 - 1]
+    for value in values:
+        encode_varint(value, out)
+    assert out[0] == 0 and out[2] == 127
+    offset = 0
+    for value in values:
+        decoded, offset = decode_varint(out, offset)
+        assert decoded == value
+    assert offset == len(out)
+
+def test_recording_roundtrip_and_replay_matches():
+    """Replay headless reproduz a sessão gravada: caminho, combate, vidas e pontos"""
+    print("🧪 Gravando sessão com inimigos...")
+    recording, result, game = _recorded_session(5, random_walk(random.Random(3)))
+    data = recording.to_bytes()
+    print(f"   {len(recording.events)} eventos em {len(data)} bytes, {recording.duration_ticks} ticks")
+    assert any(opcode == NODE_CLICK for _, opcode, _ in recording.events)
+    assert sum(1 for _, opcode, _ in recording.events if opcode == LEVEL_SEED) == 2  # Início + restart
+    assert any(opcode == RESET_LIVES for _, opcode, _ in recording.events)  # Gravado pelo lado do Game
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = recording.save(os.path.join(tmp, "sessao.pfr"))
+        loaded = Recording.load(path)
+    assert loaded.events == recording.events
+    assert loaded.seed == 123
+
+    print("🧪 Reproduzindo em modo headless...")
+    replayed = replay(loaded)
+    print(f"   gravado: {game.game_state} {game.player.path_taken} | replay: {replayed['state']} {replayed['path']}")
+    assert replayed["state"] == game.game_state
+    assert replayed["path"] == list(game.player.path_taken)
+    assert replayed["lives"] == game.player.lives
+    assert replayed["points"] == game.player.points
+    assert replayed["ticks"] == recording.duration_ticks
+
+def test_replay_of_completed_level_has_same_score():
+    """O resultado do nível (tempo, eficiência, pontuação) é idêntico no replay"""
+    game = Game(headless=True)
+    recorder = InputRecorder(game, seed=9)
+    result = run_session(1, game=game, unlock=False)
+    recording = recorder.finish()
+
+    replayed = replay(Recording.from_bytes(recording.to_bytes()))
+    assert result["state"] == replayed["state"] == "level_complete"
+    for key in ("time_taken", "efficiency", "total_score", "stars_earned"):
+        assert replayed["results"][key] == result["results"][key]
+
+def test_desync_is_detected():
+    """Uma gravação com semente adulterada é rejeitada"""
+    recording, _, _ = _recorded_session(4, random_walk(random.Random(5)))
+    events = [(tick, opcode, (args[0], args[1] ^ 1) if opcode == LEVEL_SEED else args)
+              for tick, opcode, args in recording.events]
+    try:
+        replay(Recording(recording.seed, recording.step_dt, events))
+    except ReplayDesyncError as e:
+        print(f"   ✅ Divergência detectada: {e}")
+    else:
+        assert False, "deveria detectar a divergência"
+
+if __name__ == "__main__":
+    print("=" * 50)
+    test_varints_roundtrip()
+    test_recording_roundtrip_and_replay_matches()
+    test_replay_of_completed_level_has_same_score()
+    test_desync_is_detected()
+    print("\n✅ Todos os testes de replay passaram!")
@@ -0,0 +1,85 @@
+"""
+Testes do histórico de partidas em SQLite
+"""
+import os
+import tempfile
+from run_history import RunHistory
+from main import Game
+from headless import run_session
+
+def _results(level_id, time_taken, efficiency):
+    return {
+        "level_id": level_id,
+        "time_taken": time_taken,
+        "player_distance": 5,
+        "optimal_distance": 4,
+        "efficiency": efficiency,
+        "total_score": int(efficiency * 100),
+    }
+
+def test_inserts_are_batched_and_queries_see_them():
+    """As partidas ficam no buffer até completar o lote; consultas gravam antes de ler"""
+    print("🧪 Gravando partidas em lote...")
+    with tempfile.TemporaryDirectory() as tmp:
+        history = RunHistory(os.path.join(tmp, "historico.db"), batch_size=3)
+        assert history.connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+        history.record_run("ana", _results(1, 12.0, 0.8), [0, 1, 2], 2)
+        history.record_run("ana", _results(1, 9.5, 1.0), [0, 2], 3)
+        count = history.connection.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+        assert count == 0  # Ainda no buffer
+
+        history.record_death("ana", 1, node=2)  # Completa o lote de 3
+        count = history.connection.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+        assert count == 2
+
+        history.record_run("ana", _results(2, 30.0, 0.6), [0, 3, 4], 1)
+        history.record_run("bia", _results(1, 5.0, 0.5), [0, 1], 0)
+
+        print(f"   melhores tempos: {history.best_times('ana')}")
+        assert history.best_times("ana") == {1: 9.5, 2: 30.0}
+        assert history.best_times("bia") == {1: 5.0}
+        assert abs(history.average_efficiency("ana") - 0.8) < 1e-9  # (1.0 + 0.6) / 2
+        assert history.average_efficiency("ninguem") is None
+
+        stats = history.level_stats("ana", 1)
+        assert stats["runs"] == 2 and stats["deaths"] == 1
+        assert stats["best_time"] == 9.5 and stats["best_stars"] == 3
+        assert abs(stats["avg_efficiency"] - 0.9) < 1e-9
+        history.close()
+
+        # Reabrindo o banco os dados continuam lá
+        reopened = RunHistory(os.path.join(tmp, "historico.db"))
+        assert reopened.best_times("ana") == {1: 9.5, 2: 30.0}
+        reopened.close()
+
+def test_game_records_completed_levels():
+    """Concluir um nível grava a partida e atualiza Player.best_times e a tela final"""
+    print("🧪 Registrando partida do jogo...")
+    game = Game(headless=True)
+    game.run_history = RunHistory(":memory:")
+
+    result = run_session(1, game=game)
+    assert result["state"] == "level_complete"
+
+    time_taken = result["results"]["time_taken"]
+    assert game.player.best_times[1] == time_taken
+    assert game.run_history.best_times(game.player.name) == {1: time_taken}
+    assert game.get_final_stats()["avg_efficiency"] == 100.0
+
+    # A tela final consulta o histórico uma vez, ao entrar, e não a cada quadro
+    game._execute_goto_final_screen()
+    queries = []
+    average = game.run_history.average_efficiency
+    game.run_history.average_efficiency = lambda *args: queries.append(args) or average(*args)
+    game.present_frame = lambda: None  # Headless: sem janela para mostrar
+    for _ in range(5):
+        game.draw()
+    assert queries == [] and game.final_stats["avg_efficiency"] == 100.0
+    game.run_history.close()
+
+if __name__ == "__main__":
+    print("=" * 50)
+    test_inserts_are_batched_and_queries_see_them()
+    test_game_records_completed_levels()
+    print("\n✅ Todos os testes do histórico passaram!")
@@ -0,0 +1,105 @@
+"""
+Testes da pontuação por custo (pesos das arestas) e da projeção ao vivo (LiveScore)
+"""
+import networkx as nx
+from main import Game
+from headless import run_session
+from pathfinding import dijkstra, distances_to, edge_weights, path_cost
+from player import Player
+from scoring import LiveScore
+from world import World, score_level
+
+def test_distances_to_exit_match_dijkstra():
+    """O custo até a saída de cada nó é o mesmo do Dijkstra do nó até a saída"""
+    world = World(12, seed=3)
+    for node in world.graph.nodes():
+        _, distance = dijkstra(world.graph, node, world.end_node)
+        assert world.distance_to_exit[node] == distance
+
+def test_live_score_tracks_cost_and_projection():
+    """Cada movimento soma o peso da aresta; a projeção cai ao sair do caminho ótimo"""
+    print("🧪 Projeção de eficiência ao vivo...")
+    world = World(3, seed=0)
+    player = Player()
+    player.reset_level(world.start_node, LiveScore(world))
+    world.start_level()
+    assert player.score.projected_efficiency == 1.0
+
+    # Segue o caminho ótimo com um desvio (ida e volta) no primeiro nó que tiver vizinho fora dele
+    detoured = False
+    for node in world.optimal_path[1:]:
+        player.move_to_node(node)
+        detour = [n for n in world.graph.neighbors(node) if n not in world.optimal_path]
+        if not detoured and detour and node != world.end_node:
+            assert player.score.projected_efficiency == 1.0
+            player.move_to_node(detour[0])
+            player.move_to_node(node)
+            detoured = True
+    assert detoured
+    score = player.score
+    print(f"   custo {score.cost} (ótimo {world.optimal_distance}), eficiência {score.efficiency:.2f}")
+    assert score.hops == len(player.path_taken) - 1
+    assert score.cost == path_cost(world.graph, player.path_taken)
+    assert score.projected_efficiency == score.efficiency < 1.0
+
+    results = world.complete_level(player.path_taken, score.cost)
+    assert results == dict(world.complete_level(player.path_taken), time_taken=results["time_taken"])
+    assert results["player_cost"] == score.cost and results["optimal_cost"] == world.optimal_distance
+
+def test_efficiency_uses_edge_weights():
+    """Um caminho com menos arestas mas mais pesado é menos eficiente que o ótimo"""
+    graph = nx.Graph()
+    graph.add_edge(0, 3, weight=10)
+    graph.add_edge(0, 1, weight=1)
+    graph.add_edge(1, 2, weight=1)
+    graph.add_edge(2, 3, weight=1)
+    assert distances_to(edge_weights(graph), 3) == {3: 0, 2: 1, 1: 2, 0: 3}
+    direct = score_level(1, 3, 10.0, 60, path_cost(graph, [0, 3]), 3)
+    assert direct["efficiency"] == 0.0
+    assert score_level(1, 3, 10.0, 60)["efficiency"] > 1.0  # Contando arestas, o atalho pesado parecia melhor
+
+def test_game_scores_by_cost():
+    """O Game usa o custo acumulado pelo LiveScore do jogador"""
+    game = Game(headless=True, seed=7)
+    result = run_session(5, game=game)
+    assert result["state"] == "level_complete"
+    assert game.level_results["player_cost"] == path_cost(game.world.graph, game.player.path_taken)
+
+def test_losing_a_life_restarts_path_and_cost():
+    """Perder uma vida no combate volta caminho e LiveScore ao início; sem LiveScore o custo vem do caminho"""
+    game = Game(headless=True, seed=7)
+    game.start_level(1)
+    start = game.world.start_node
+    first = min(game.world.graph.neighbors(start))
+    second = next(n for n in game.world.graph.neighbors(first) if n != start)
+    game.player.move_to_node(first)
+    game.player.move_to_node(second)
+    game.arrival_times += [0.5, 1.0]
+
+    # Derrota no combate em 'second' com vidas sobrando
+    game.combat_node = second
+    game.combat_state = "fighting"
+    game.combat_enemy_health = 100
+    game.player.health = 0
+    game._resolve_combat()
+    assert game.player.current_node == start and game.player.lives == 2
+    assert game.player.path_taken == [start] and game.arrival_times == [0.0]
+    assert game.player.score.node == start and game.player.score.cost == 0
+
+    game.player.move_to_node(first)
+    assert game.player.score.cost == game.world.graph[start][first].get("weight", 1)
+
+    game.player.score = None
+    for node in nx.shortest_path(game.world.graph, first, game.world.end_node)[1:]:
+        game.player.move_to_node(node)
+    game.complete_level()
+    assert game.level_results["player_cost"] == path_cost(game.world.graph, game.player.path_taken)
+
+if __name__ == "__main__":
+    print("=" * 50)
+    test_distances_to_exit_match_dijkstra()
+    test_live_score_tracks_cost_and_projection()
+    test_efficiency_uses_edge_weights()
+    test_game_scores_by_cost()
+    test_losing_a_life_restarts_path_and_cost()
+    print("\n✅ Todos os testes de pontuação passaram!")
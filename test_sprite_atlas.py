@@ -0,0 +1,43 @@
+"""
+Testes do atlas de sprites (geração offline + SpriteSheet com subsuperfícies)
+"""
+import os
+import tempfile
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+from sprite_atlas import ATLASES, SpriteSheet, build_atlas, frame_files
+
+def test_atlas_frames_match_individual_sprites():
+    """Cada frame do atlas é igual ao PNG individual redimensionado"""
+    print("🧪 Gerando atlas do jogador...")
+    pygame.display.init()
+    pygame.display.set_mode((10, 10))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        build_atlas("player", ATLASES["player"], atlas_dir=tmp)
+        sheet = SpriteSheet.load("player", atlas_dir=tmp)
+
+        run_files = frame_files(ATLASES["player"]["animations"]["run"])
+        run_frames = sheet.frames("run")
+        print(f"   {len(run_frames)} frames de corrida | atlas {sheet.image.get_size()}")
+        assert len(run_frames) == len(run_files)
+        assert all(frame.get_parent() is sheet.image for frame in run_frames)
+
+        expected = pygame.transform.scale(pygame.image.load(run_files[2]), (120, 120)).convert_alpha()
+        frame = run_frames[2]
+        assert frame.get_size() == (120, 120)
+        for point in [(0, 0), (60, 60), (30, 90), (119, 119)]:
+            assert frame.get_at(point) == expected.get_at(point)
+
+        assert sheet.frames("nao_existe") == []
+
+def test_missing_atlas():
+    """Sem atlas gerado o jogo volta para os PNGs individuais"""
+    with tempfile.TemporaryDirectory() as tmp:
+        assert SpriteSheet.read_index("player", atlas_dir=tmp) is None
+        assert SpriteSheet.load("player", atlas_dir=tmp) is None
+
+if __name__ == "__main__":
+    test_atlas_frames_match_individual_sprites()
+    test_missing_atlas()
+    print("\n🏁 Testes do atlas concluídos!")
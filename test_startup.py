@@ -0,0 +1,99 @@
+"""
+Testes da inicialização: imports adiados, pré-carregamento e benchmark
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from preload import ModulePreloader
+from startup_profiler import StartupProfiler
+from startup_benchmark import ROOT, parse_importtime, direct_imports, time_to_first_frame, startup_phases
+
+def test_main_import_skips_heavy_modules():
+    """Importar main não carrega networkx, cv2, world, os perfis nem o SQLite do histórico"""
+    deferred = ("networkx", "cv2", "world", "profiler", "startup_profiler", "run_history", "sqlite3")
+    code = f"import main, sys; print(*(name in sys.modules for name in {deferred!r}))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+    print(f"   {'/'.join(deferred)} carregados: {result.stdout.splitlines()[-1]}")
+    assert result.stdout.splitlines()[-1].split() == ["False"] * len(deferred)
+
+def test_preloader_imports_in_background():
+    """Módulos são importados no thread; erro de import não derruba o jogo"""
+    preloader = ModulePreloader(["colorsys", "modulo_que_nao_existe"]).start()
+    assert preloader.wait(10) and preloader.done
+    assert "colorsys" in sys.modules and "colorsys" in preloader.timings
+    assert "modulo_que_nao_existe" in preloader.failed
+
+def test_parse_importtime():
+    """Linhas do -X importtime viram (módulo, próprio, acumulado, profundidade)"""
+    stderr = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       100 |        100 |     c",
+        "import time:       200 |        300 |   b",
+        "import time:        50 |         50 |   d",
+        "import time:        10 |        360 | a",
+    ])
+    rows = parse_importtime(stderr)
+    assert rows[0] == ("c", 100, 100, 2) and rows[-1] == ("a", 10, 360, 0)
+    assert [row[0] for row in direct_imports(rows, "a")] == ["d", "b"]
+
+def test_time_to_first_frame():
+    """O jogo mostra o primeiro quadro e sai com --first-frame-exit"""
+    samples = time_to_first_frame(runs=1)
+    print(f"   primeiro quadro em {samples[0] * 1000:.0f} ms")
+    assert 0 < samples[0] < 30
+
+class _Loader:
+    def __init__(self):
+        self.load_a()
+
+    def load_a(self):
+        time.sleep(0.01)
+
+def test_startup_profiler_phases_and_restore():
+    """Fases aninhadas (inclusive dentro de __init__), cascata, JSON e métodos restaurados"""
+    original_init, original_load = _Loader.__init__, _Loader.load_a
+    profiler = StartupProfiler()
+    profiler.instrument(_Loader, ["__init__", "load_a", "nao_existe"])
+    with profiler.phase("abertura"):
+        _Loader()
+    profiler.mark("first_frame")
+    profiler.finish()
+    assert _Loader.__init__ is original_init and _Loader.load_a is original_load
+
+    names = [(phase["name"], phase["depth"]) for phase in profiler.phases]
+    assert names == [("abertura", 0), ("_Loader.__init__", 1), ("_Loader.load_a", 2)]
+    assert profiler.phases[2]["duration_ms"] >= 10
+    assert profiler.phases[0]["duration_ms"] >= profiler.phases[1]["duration_ms"]
+    waterfall = profiler.waterfall()
+    print(waterfall)
+    assert "_Loader.load_a" in waterfall and "first_frame" in waterfall
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "perfil.json")
+        profiler.write_json(path)
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    assert data["marks"]["first_frame"] <= data["total_ms"]
+    assert len(data["phases"]) == 3
+
+def test_game_startup_profile():
+    """O jogo grava as fases reais da abertura até o menu"""
+    stats = startup_phases(runs=1)
+    names = {phase["name"] for phase in stats["phases"]}
+    print(f"   menu pronto em {stats['marks']['menu_ready']:.0f} ms")
+    assert {"imports", "pygame.init", "Visualizer.__init__", "Visualizer.load_button_images",
+            "Game.load_video_background", "Game.load_star_progress"} <= names
+    assert stats["marks"]["first_frame"] <= stats["marks"]["menu_ready"]
+
+if __name__ == "__main__":
+    print("=" * 50)
+    test_main_import_skips_heavy_modules()
+    test_preloader_imports_in_background()
+    test_parse_importtime()
+    test_time_to_first_frame()
+    test_startup_profiler_phases_and_restore()
+    test_game_startup_profile()
+    print("\n✅ Testes de inicialização passaram!")
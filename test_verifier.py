@@ -0,0 +1,87 @@
+"""
+Testes do verificador de partidas em lote
+"""
+import random
+from main import Game
+from headless import run_session, random_walk
+from level_data import level_data
+from combat_rules import fight
+from verifier import submission_from_game, verify_submission, verify_batch
+
+def _completed_submission(level_id, choose_move=None, seed=None):
+    """Joga até concluir o nível e monta a partida"""
+    rng = random.Random(seed)
+    for _ in range(50):
+        game = Game(headless=True, seed=rng.getrandbits(32))
+        kwargs = {"choose_move": choose_move(rng)} if choose_move else {}
+        result = run_session(level_id, game=game, max_seconds=120, **kwargs)
+        if result["state"] == "level_complete":
+            return submission_from_game(game)
+    raise AssertionError("nenhuma sessão concluiu o nível")
+
+def test_combat_rules():
+    """Primeiro inimigo custa metade da vida; o segundo é morte certa"""
+    assert fight(100, 100, 0) == (50, True)
+    assert fight(50, 100, 1) == (0, False)
+    assert fight(40, 100, 0) == (0, False)
+
+def test_recorded_games_verify_exactly():
+    """Partidas jogadas de verdade passam e a pontuação recalculada é idêntica"""
+    print("🧪 Verificando partidas jogadas em modo headless...")
+    for level_id in (1, 3, 5, 12, 20):
+        submission = _completed_submission(level_id)
+        verdict = verify_submission(submission, level_data(level_id, submission["seed"]))
+        print(f"   nível {level_id}: {verdict['valid']} {verdict['reason'] or ''}")
+        assert verdict["valid"], verdict["reason"]
+        assert verdict["results"]["total_score"] == submission["claimed"]["total_score"]
+
+    # Caminho aleatório (com voltas e combates)
+    submission = _completed_submission(5, choose_move=random_walk, seed=11)
+    verdict = verify_submission(submission, level_data(5, submission["seed"]))
+    assert verdict["valid"], verdict["reason"]
+
+def test_tampered_submissions_are_rejected():
+    """Aresta inexistente, tempo impossível e pontuação inflada são rejeitados"""
+    submission = _completed_submission(1)
+    level = level_data(1, submission["seed"])
+
+    shortcut = dict(submission, path=[submission["path"][0], submission["path"][-1]],
+                    times=[0.0, submission["times"][-1]])
+    if not level.is_edge(*shortcut["path"]):
+        assert "aresta" in verify_submission(shortcut, level)["reason"]
+
+    too_fast = dict(submission, times=[t / 4 for t in submission["times"]])
+    assert "antes do possível" in verify_submission(too_fast, level)["reason"]
+
+    inflated = dict(submission, claimed=dict(submission["claimed"], total_score=999))
+    verdict = verify_submission(inflated, level)
+    assert not verdict["valid"] and "total_score" in verdict["reason"]
+
+    # Sem semente o nível não é reproduzível: rejeitada em vez de sortear os inimigos
+    seedless = dict(submission)
+    del seedless["seed"]
+    verdict = verify_submission(seedless, level)
+    assert not verdict["valid"] and "semente" in verdict["reason"]
+    assert not verify_batch([seedless], max_workers=1)[0]["valid"]
+    assert not verify_submission(dict(submission, seed=submission["seed"] + 1), level)["valid"]
+
+def test_batch_runs_in_process_pool():
+    """Lote grande em processos devolve os veredictos na ordem das partidas"""
+    print("🧪 Verificando lote em paralelo...")
+    good = _completed_submission(5)
+    bad = dict(good, claimed=dict(good["claimed"], efficiency=2.0))
+    batch = [good, bad] * 300
+
+    verdicts = verify_batch(batch, max_workers=2, chunk_size=100)
+    assert len(verdicts) == len(batch)
+    assert all(v["valid"] for v in verdicts[::2])
+    assert not any(v["valid"] for v in verdicts[1::2])
+    assert verify_batch(batch[:4], max_workers=1) == verdicts[:4]
+
+if __name__ == "__main__":
+    print("=" * 50)
+    test_combat_rules()
+    test_recorded_games_verify_exactly()
+    test_tampered_submissions_are_rejected()
+    test_batch_runs_in_process_pool()
+    print("\n✅ Todos os testes do verificador passaram!")
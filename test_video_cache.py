@@ -0,0 +1,61 @@
+"""
+Testes do cache de vídeo pré-transcodificado (mmap + frombuffer)
+"""
+import os
+import tempfile
+import video_cache
+from video_cache import build_cache, is_cache_valid, cache_path, CachedVideo
+from test_video_player import _write_test_video
+
+def test_cache_is_built_and_validated():
+    """O cache tem todos os frames no tamanho alvo e é invalidado se o vídeo mudar"""
+    print("🧪 Gerando cache de vídeo...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "clip.avi")
+        _write_test_video(path, frames=30)
+        cache_dir = os.path.join(tmp, "cache")
+
+        assert not is_cache_valid(path, (40, 30), cache_dir)
+        build_cache(path, (40, 30), cache_dir)
+        assert is_cache_valid(path, (40, 30), cache_dir)
+        assert not is_cache_valid(path, (80, 60), cache_dir)
+
+        expected = video_cache.HEADER_SIZE + 30 * 40 * 30 * 3
+        assert os.path.getsize(cache_path(path, (40, 30), cache_dir)) == expected
+
+        # Vídeo regravado (mtime/tamanho diferentes) invalida o cache
+        _write_test_video(path, frames=20)
+        os.utime(path, (0, 0))
+        assert not is_cache_valid(path, (40, 30), cache_dir)
+
+def test_cached_video_presents_frames_by_time():
+    """Frames vêm direto do arquivo mapeado, no tamanho certo e conforme o tempo"""
+    print("🧪 Reproduzindo a partir do cache...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "clip.avi")
+        _write_test_video(path, frames=30)
+        cache_dir = os.path.join(tmp, "cache")
+        build_cache(path, (40, 30), cache_dir, max_fps=15)
+
+        player = CachedVideo(cache_path(path, (40, 30), cache_dir))
+        try:
+            assert player.frame_count == 15 and player.fps == 15.0
+            first = player.get_frame(10.0)
+            assert first.get_size() == (40, 30)
+            assert player.current_index == 0
+            assert player.get_frame(10.01) is first  # Mesmo frame: nada a fazer
+
+            player.get_frame(10.5)
+            print(f"   frame: {player.current_index} | descartados: {player.dropped_frames}")
+            assert player.current_index == 7
+            assert player.dropped_frames == 6
+
+            player.get_frame(11.0 + 1 / 30)  # Volta ao início (loop)
+            assert player.current_index == 0
+        finally:
+            player.stop()
+
+if __name__ == "__main__":
+    test_cache_is_built_and_validated()
+    test_cached_video_presents_frames_by_time()
+    print("\n🏁 Testes do cache de vídeo concluídos!")
@@ -0,0 +1,73 @@
+"""
+Testes do player de vídeo com decodificação em segundo plano
+"""
+import os
+import tempfile
+import time
+import numpy as np
+from video_player import VideoPlayer, open_video
+
+def _write_test_video(path, frames=30, fps=30, size=(64, 48)):
+    """Gera um vídeo pequeno em que cada frame tem uma cor diferente"""
+    import cv2
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), fps, size)
+    for i in range(frames):
+        frame = np.full((size[1], size[0], 3), (i * 8) % 256, dtype=np.uint8)
+        writer.write(frame)
+    writer.release()
+
+def _wait_for_frame(player, now, timeout=2.0):
+    """Espera (no teste, não no jogo) até a thread entregar um frame"""
+    deadline = time.time() + timeout
+    frame = player.get_frame(now)
+    while frame is None and time.time() < deadline:
+        time.sleep(0.01)
+        frame = player.get_frame(now)
+    return frame
+
+def test_frames_are_resized_and_presented_by_timestamp():
+    """Frames chegam já no tamanho da tela e avançam conforme o tempo"""
+    print("🧪 Testando apresentação por timestamp...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "clip.avi")
+        _write_test_video(path)
+
+        player = VideoPlayer(path, (120, 80)).start()
+        try:
+            first = _wait_for_frame(player, 0.0)
+            assert first is not None
+            assert first.get_size() == (120, 80)
+            assert player.current_pts == 0.0
+
+            time.sleep(0.2)
+            player.get_frame(0.5)
+            print(f"   pts apresentado: {player.current_pts:.3f} | descartados: {player.dropped_frames}")
+            assert 0.0 < player.current_pts <= 0.5
+            assert player.dropped_frames > 0
+        finally:
+            player.stop()
+
+def test_get_frame_never_blocks():
+    """Sem frame pronto o jogo recebe o último frame (ou None) imediatamente"""
+    print("🧪 Testando que get_frame não bloqueia...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "clip.avi")
+        _write_test_video(path)
+
+        player = VideoPlayer(path, (120, 80))
+        started = time.perf_counter()
+        player.get_frame(0.0)
+        elapsed = time.perf_counter() - started
+        player.stop()
+        print(f"   Primeira chamada: {elapsed * 1000:.2f} ms")
+        assert elapsed < 0.05
+
+def test_missing_video():
+    """Vídeo inexistente não cria player"""
+    assert open_video("videos/nao_existe.mp4", (100, 100)) is None
+
+if __name__ == "__main__":
+    test_frames_are_resized_and_presented_by_timestamp()
+    test_get_frame_never_blocks()
+    test_missing_video()
+    print("\n🏁 Testes do player de vídeo concluídos!")
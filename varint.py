@@ -0,0 +1,25 @@
+"""
+Inteiros de tamanho variável (varint)
+7 bits por byte, com o bit mais alto indicando que há mais bytes: valores até 127 ocupam
+1 byte. Usado pelo fluxo de eventos do replay e pelo caminho compacto do PathHistory
+"""
+
+
+def encode_varint(value, out):
+    """Acrescenta um inteiro não negativo em 'out' (bytearray), 7 bits por byte"""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def decode_varint(data, offset):
+    """Lê um varint de 'data' a partir de 'offset'; retorna (valor, novo offset)"""
+    value = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
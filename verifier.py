@@ -0,0 +1,140 @@
+"""
+Verificador de partidas em lote
+Refaz a pontuação de World.complete_level a partir do caminho e dos instantes de chegada
+de cada partida, confere se cada passo é uma aresta do grafo, se o tempo respeita a
+duração dos movimentos e combates e aplica as regras de combate aos inimigos do nível.
+Milhares de partidas são divididas em lotes entre processos; os dados dos níveis são
+calculados uma vez e enviados uma única vez para cada processo
+
+Partida: {"level_id", "seed" (obrigatória), "path": [nós], "times": [chegada em cada nó, s],
+          "max_health" (opcional), "claimed": {pontuação informada} (opcional)}
+"""
+from concurrent.futures import ProcessPoolExecutor
+from combat_rules import MOVE_DURATION, COMBAT_DURATION, fight
+from level_data import precompute
+from world import score_level
+
+TIME_TOLERANCE = 1e-6
+CHECKED_FIELDS = ("player_distance", "optimal_distance", "player_cost", "optimal_cost", "efficiency", "base_score", "time_bonus",
+                  "total_score")
+
+_worker_levels = {}  # Dados dos níveis no processo do verificador
+
+
+def submission_from_game(game):
+    """Monta a partida a partir de um Game que acabou de concluir um nível"""
+    return {
+        "level_id": game.current_level,
+        "seed": game.level_seed,
+        "path": list(game.player.path_taken),
+        "times": list(game.arrival_times),
+        "max_health": game.player.max_health,
+        "claimed": dict(game.level_results),
+    }
+
+
+def _invalid(reason):
+    return {"valid": False, "reason": reason, "results": None}
+
+
+def verify_submission(submission, level):
+    """Valida uma partida contra o LevelData do nível; retorna valid, reason e results"""
+    if submission.get("seed") is None:
+        return _invalid("partida sem semente do nível")
+    if level is None or submission["seed"] != level.seed or submission["level_id"] != level.level_id:
+        return _invalid(f"semente {submission['seed']} não corresponde aos dados do nível")
+    path = submission["path"]
+    times = submission["times"]
+    max_health = submission.get("max_health", 100)
+
+    if len(path) < 2 or len(times) != len(path):
+        return _invalid("caminho ou tempos incompletos")
+    if path[0] != level.start_node:
+        return _invalid(f"começa no nó {path[0]}, não no início {level.start_node}")
+    if path[-1] != level.end_node:
+        return _invalid(f"termina no nó {path[-1]}, não no fim {level.end_node}")
+    if times[0] != 0:
+        return _invalid("o primeiro instante deve ser 0")
+
+    enemies = set(level.enemies)
+    optimal_length = level.optimal_length
+    optimal_cost = level.optimal_cost
+    cost = 0
+    health = max_health
+    enemies_fought = 0
+    busy_until = 0.0  # Até quando o jogador está ocupado (movimento ou combate)
+
+    for step in range(1, len(path)):
+        previous, node = path[step - 1], path[step]
+        if not level.is_edge(previous, node):
+            return _invalid(f"passo {step}: {previous} → {node} não é aresta")
+        cost += level.weight(previous, node)
+        if times[step] + TIME_TOLERANCE < busy_until + MOVE_DURATION:
+            return _invalid(f"passo {step}: chegou em {times[step]:.3f}s, antes do possível")
+        busy_until = times[step]
+
+        if node in enemies:
+            health, enemy_killed = fight(health, max_health, enemies_fought)
+            if health <= 0:
+                return _invalid(f"passo {step}: jogador morreu no nó {node}")
+            enemies_fought += 1
+            if enemy_killed:
+                enemies.discard(node)
+                optimal_length = level.optimal_after_kill[node]  # O World recalcula o ótimo
+                optimal_cost = level.optimal_cost_after_kill[node]
+            busy_until += COMBAT_DURATION
+
+    results = score_level(len(path) - 1, optimal_length, times[-1], level.time_limit, cost, optimal_cost)
+    claimed = submission.get("claimed")
+    if claimed:
+        for field in CHECKED_FIELDS:
+            if field in claimed and claimed[field] != results[field]:
+                return {"valid": False, "reason": f"{field} informado {claimed[field]}, calculado {results[field]}",
+                        "results": results}
+    return {"valid": True, "reason": None, "results": results}
+
+
+def _init_worker(levels):
+    global _worker_levels
+    _worker_levels = levels
+
+
+def _verify_chunk(submissions):
+    return [verify_submission(s, _worker_levels.get((s["level_id"], s.get("seed")))) for s in submissions]
+
+
+def verify_batch(submissions, max_workers=None, chunk_size=256):
+    """Valida uma lista de partidas, em paralelo quando compensa; resultados na mesma ordem"""
+    submissions = list(submissions)
+    levels = precompute((s["level_id"], s.get("seed")) for s in submissions)
+
+    if max_workers == 1 or len(submissions) <= chunk_size:
+        _init_worker(levels)
+        return _verify_chunk(submissions)
+
+    chunks = [submissions[i:i + chunk_size] for i in range(0, len(submissions), chunk_size)]
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(levels,)) as pool:
+        return [result for chunk in pool.map(_verify_chunk, chunks) for result in chunk]
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+    import time
+
+    parser = argparse.ArgumentParser(description="Valida partidas gravadas (JSON lines)")
+    parser.add_argument("submissions", help="Arquivo com uma partida JSON por linha")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    with open(args.submissions, encoding="utf-8") as f:
+        batch = [json.loads(line) for line in f if line.strip()]
+
+    started = time.perf_counter()
+    verdicts = verify_batch(batch, max_workers=args.workers)
+    elapsed = time.perf_counter() - started
+    valid = sum(1 for verdict in verdicts if verdict["valid"])
+    print(f"🔎 {len(verdicts)} partidas verificadas em {elapsed:.2f}s: {valid} válidas, {len(verdicts) - valid} rejeitadas")
+    for submission, verdict in zip(batch, verdicts):
+        if not verdict["valid"]:
+            print(f"   ❌ nível {submission['level_id']}: {verdict['reason']}")
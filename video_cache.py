@@ -0,0 +1,206 @@
+"""
+Cache de vídeo pré-transcodificado e mapeado em memória
+Cada vídeo é decodificado uma única vez, já no tamanho da tela, para um arquivo de
+frames RGB crus; depois o arquivo é mapeado com mmap e os frames viram superfícies
+com pygame.image.frombuffer sem cópia (nada de decodificar ou redimensionar no menu)
+
+Atenção: o cache é grande (largura * altura * 3 bytes por frame); use max_fps para
+reduzir a taxa de frames guardada quando o disco for limitado
+"""
+import mmap
+import os
+import struct
+import threading
+import pygame
+from game_logging import get_logger
+
+logger = get_logger("video_cache")
+
+CACHE_DIR = os.path.join("cache", "videos")
+MAGIC = b"PFVC"
+VERSION = 1
+# magic, versão, largura, altura, fps, número de frames, tamanho e mtime do vídeo original
+HEADER_FORMAT = "<4sIIIdIQd"
+HEADER_SIZE = 64  # Cabeçalho fixo (com folga) para manter os frames alinhados
+
+
+def cache_path(video_path, size, cache_dir=CACHE_DIR):
+    """Caminho do arquivo de cache para um vídeo em uma resolução"""
+    name = os.path.splitext(os.path.basename(video_path))[0]
+    return os.path.join(cache_dir, f"{name}_{size[0]}x{size[1]}.rgb")
+
+
+def _source_signature(video_path):
+    """Tamanho e data de modificação do vídeo original (invalida o cache se mudar)"""
+    stat = os.stat(video_path)
+    return stat.st_size, stat.st_mtime
+
+
+def _read_header(path):
+    """Lê o cabeçalho do cache; retorna None se o arquivo não for um cache válido"""
+    try:
+        with open(path, "rb") as f:
+            data = f.read(HEADER_SIZE)
+    except OSError:
+        return None
+
+    if len(data) < struct.calcsize(HEADER_FORMAT):
+        return None
+    magic, version, width, height, fps, frame_count, src_size, src_mtime = struct.unpack_from(HEADER_FORMAT, data)
+    if magic != MAGIC or version != VERSION:
+        return None
+    return {
+        "width": width, "height": height, "fps": fps, "frame_count": frame_count,
+        "source_size": src_size, "source_mtime": src_mtime,
+    }
+
+
+def is_cache_valid(video_path, size, cache_dir=CACHE_DIR):
+    """Verifica se existe cache completo e atualizado para o vídeo nesta resolução"""
+    path = cache_path(video_path, size, cache_dir)
+    header = _read_header(path)
+    if header is None or not os.path.exists(video_path):
+        return False
+
+    src_size, src_mtime = _source_signature(video_path)
+    frame_bytes = size[0] * size[1] * 3
+    expected = HEADER_SIZE + header["frame_count"] * frame_bytes
+    return (
+        (header["width"], header["height"]) == tuple(size)
+        and header["source_size"] == src_size
+        and header["source_mtime"] == src_mtime
+        and header["frame_count"] > 0
+        and os.path.getsize(path) == expected
+    )
+
+
+def build_cache(video_path, size, cache_dir=CACHE_DIR, max_fps=None):
+    """Decodifica o vídeo uma vez no tamanho alvo e grava os frames RGB crus"""
+    import cv2
+
+    os.makedirs(cache_dir, exist_ok=True)
+    path = cache_path(video_path, size, cache_dir)
+    tmp_path = path + ".tmp"
+
+    capture = cv2.VideoCapture(video_path)
+    try:
+        fps = capture.get(cv2.CAP_PROP_FPS) or 30.0
+        keep_every = 1
+        if max_fps and fps > max_fps:
+            keep_every = int(round(fps / max_fps))
+        out_fps = fps / keep_every
+
+        frame_count = 0
+        index = 0
+        with open(tmp_path, "wb") as f:
+            f.write(b"\0" * HEADER_SIZE)  # Reserva o cabeçalho; preenchido no final
+            while True:
+                ret, frame = capture.read()
+                if not ret:
+                    break
+                if index % keep_every == 0:
+                    frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                    frame = cv2.resize(frame, tuple(size))
+                    f.write(frame.tobytes())
+                    frame_count += 1
+                index += 1
+
+            src_size, src_mtime = _source_signature(video_path)
+            f.seek(0)
+            f.write(struct.pack(HEADER_FORMAT, MAGIC, VERSION, size[0], size[1],
+                                out_fps, frame_count, src_size, src_mtime))
+            f.flush()
+            os.fsync(f.fileno())
+    finally:
+        capture.release()
+
+    os.replace(tmp_path, path)  # Só aparece completo: nunca um cache pela metade
+    logger.info("💾 Cache de vídeo criado: %s (%d frames, %.1f FPS)", path, frame_count, out_fps)
+    return path
+
+
+def build_cache_in_background(video_path, size, cache_dir=CACHE_DIR, max_fps=None):
+    """Gera o cache em uma thread de baixa prioridade para a próxima execução"""
+    def worker():
+        try:
+            build_cache(video_path, size, cache_dir, max_fps)
+        except Exception as e:
+            logger.error("⚠️ Erro ao gerar cache de vídeo %s: %s", video_path, e)
+
+    thread = threading.Thread(target=worker, name=f"video-cache:{video_path}", daemon=True)
+    thread.start()
+    return thread
+
+
+class CachedVideo:
+    """Reprodutor de vídeo a partir do cache mapeado em memória (mesma API do VideoPlayer)"""
+
+    def __init__(self, path):
+        header = _read_header(path)
+        if header is None:
+            raise ValueError(f"Cache de vídeo inválido: {path}")
+
+        self.path = path
+        self.size = (header["width"], header["height"])
+        self.fps = header["fps"]
+        self.frame_count = header["frame_count"]
+        self.frame_bytes = self.size[0] * self.size[1] * 3
+
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+
+        self.start_time = None
+        self.current_index = None
+        self.current_surface = None
+        self.presented_frames = 0
+        self.dropped_frames = 0
+
+    def start(self):
+        return self
+
+    def frame_surface(self, index):
+        """Superfície que aponta direto para o frame no arquivo mapeado (sem cópia)"""
+        offset = HEADER_SIZE + index * self.frame_bytes
+        return pygame.image.frombuffer(self._view[offset:offset + self.frame_bytes], self.size, "RGB")
+
+    def get_frame(self, now):
+        """Retorna o frame do instante 'now'; se ainda é o mesmo frame, não faz nada"""
+        if self.start_time is None:
+            self.start_time = now
+
+        index = int((now - self.start_time) * self.fps) % self.frame_count
+        if index != self.current_index:
+            if self.current_index is not None:
+                skipped = (index - self.current_index) % self.frame_count - 1
+                self.dropped_frames += max(0, skipped)
+            self.current_surface = self.frame_surface(index)
+            self.current_index = index
+            self.presented_frames += 1
+        return self.current_surface
+
+    def stop(self):
+        """Libera o mapeamento (as superfícies apontam para ele)"""
+        self.current_surface = None
+        try:
+            self._view.release()
+            self._map.close()
+        except (BufferError, ValueError):
+            pass  # Ainda há superfícies usando o buffer; o SO libera ao sair
+        self._file.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Pré-transcodifica os vídeos de fundo")
+    parser.add_argument("videos", nargs="*", default=["videos/Math.mp4", "videos/final.mp4"])
+    parser.add_argument("--width", type=int, default=1200)
+    parser.add_argument("--height", type=int, default=800)
+    parser.add_argument("--max-fps", type=float, default=None)
+    args = parser.parse_args()
+
+    from game_logging import setup_logging
+    setup_logging("INFO")  # Mostra o resumo de cada cache gerado
+    for video in args.videos:
+        build_cache(video, (args.width, args.height), max_fps=args.max_fps)
@@ -0,0 +1,185 @@
+"""
+Módulo de reprodução de vídeo em segundo plano
+Decodifica em uma thread separada para um buffer circular limitado de frames RGB
+já redimensionados; o loop do jogo só apresenta o frame certo para o tempo atual
+"""
+import atexit
+import os
+import threading
+import weakref
+import pygame
+from game_logging import get_logger
+
+logger = get_logger("video")
+
+# Players com thread ativa: param ao sair do interpretador, antes das threads daemon
+# serem interrompidas no meio de uma chamada do OpenCV
+_active_players = weakref.WeakSet()
+
+
+class VideoPlayer:
+    """Player de vídeo com decodificação em thread e apresentação por timestamp"""
+
+    def __init__(self, path, size, buffer_size=8, loop=True, resync_threshold=0.5):
+        self.path = path
+        self.size = size  # (largura, altura) da tela
+        self.loop = loop
+        self.buffer_size = buffer_size
+        self.resync_threshold = resync_threshold  # Atraso máximo antes de ressincronizar (s)
+
+        # Buffer circular: cada posição guarda (pts, frame_rgb)
+        self._buffer = [None] * buffer_size
+        self._read_index = 0
+        self._write_index = 0
+        self._count = 0
+        self._lock = threading.Lock()
+        self._not_full = threading.Condition(self._lock)
+
+        self._stop_event = threading.Event()
+        self._thread = None
+        self.fps = 30.0
+        self.finished = False
+
+        # Estado da apresentação (thread principal)
+        self.start_time = None
+        self.current_surface = None
+        self.current_pts = None
+        self.presented_frames = 0
+        self.dropped_frames = 0
+
+    def start(self):
+        """Inicia a thread de decodificação"""
+        if self._thread is not None:
+            return self
+        self._thread = threading.Thread(target=self._decode_loop, name=f"video:{self.path}", daemon=True)
+        self._thread.start()
+        _active_players.add(self)
+        return self
+
+    def stop(self):
+        """Para a decodificação e libera a thread"""
+        self._stop_event.set()
+        with self._not_full:
+            self._not_full.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def _decode_loop(self):
+        """Thread de decodificação: lê, converte para RGB e redimensiona à frente do jogo"""
+        import cv2
+
+        capture = cv2.VideoCapture(self.path)
+        try:
+            fps = capture.get(cv2.CAP_PROP_FPS)
+            self.fps = fps if fps and fps > 0 else 30.0
+            frame_index = 0
+            loop_offset = 0.0
+
+            while not self._stop_event.is_set():
+                ret, frame = capture.read()
+                if not ret:
+                    if not self.loop or frame_index == 0:
+                        self.finished = True
+                        break
+                    # Reinicia o vídeo mantendo os timestamps crescentes
+                    loop_offset += frame_index / self.fps
+                    frame_index = 0
+                    capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                    continue
+
+                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                frame = cv2.resize(frame, self.size)
+                pts = loop_offset + frame_index / self.fps
+                frame_index += 1
+
+                with self._not_full:
+                    # Espera espaço no buffer (só a thread de vídeo espera, nunca o jogo)
+                    while self._count >= self.buffer_size and not self._stop_event.is_set():
+                        self._not_full.wait(timeout=0.1)
+                    if self._stop_event.is_set():
+                        break
+                    self._buffer[self._write_index] = (pts, frame)
+                    self._write_index = (self._write_index + 1) % self.buffer_size
+                    self._count += 1
+        finally:
+            capture.release()
+
+    def _pop_due_frame(self, video_time):
+        """Retira do buffer o frame mais recente com pts <= video_time (descarta os anteriores)"""
+        chosen = None
+        with self._not_full:
+            while self._count > 0:
+                pts, frame = self._buffer[self._read_index]
+                if pts > video_time:
+                    break
+                if chosen is not None:
+                    self.dropped_frames += 1
+                chosen = (pts, frame)
+                self._buffer[self._read_index] = None
+                self._read_index = (self._read_index + 1) % self.buffer_size
+                self._count -= 1
+            if chosen is not None:
+                self._not_full.notify()
+        return chosen
+
+    def _peek_next_pts(self):
+        """Timestamp do próximo frame no buffer (ou None)"""
+        with self._lock:
+            if self._count == 0:
+                return None
+            return self._buffer[self._read_index][0]
+
+    def get_frame(self, now):
+        """Retorna a superfície do frame para o instante 'now' sem nunca bloquear"""
+        if self._thread is None:
+            self.start()
+        if self.start_time is None:
+            self.start_time = now
+
+        video_time = now - self.start_time
+
+        # Se a decodificação ficou para trás (ou o vídeo ficou pausado fora do menu),
+        # ressincroniza o relógio do vídeo em vez de acelerar para alcançar
+        next_pts = self._peek_next_pts()
+        if next_pts is not None and video_time - next_pts > self.resync_threshold:
+            self.start_time = now - next_pts
+            video_time = next_pts
+
+        due = self._pop_due_frame(video_time)
+        if due is not None:
+            pts, frame = due
+            width, height = self.size
+            self.current_surface = pygame.image.frombuffer(frame, (width, height), "RGB")
+            self.current_pts = pts
+            self.presented_frames += 1
+
+        return self.current_surface
+
+
+@atexit.register
+def _stop_active_players():
+    for player in list(_active_players):
+        player.stop()
+
+
+def open_video(path, size, use_cache=False, **kwargs):
+    """Cria um VideoPlayer se o arquivo existir; retorna None caso contrário
+
+    Com use_cache=True usa o cache pré-transcodificado em disco (mmap, sem decodificar);
+    se ainda não existir, gera o cache em segundo plano e decodifica normalmente nesta execução
+    """
+    if not os.path.exists(path):
+        return None
+
+    if use_cache:
+        import video_cache
+        if video_cache.is_cache_valid(path, size):
+            try:
+                return video_cache.CachedVideo(video_cache.cache_path(path, size))
+            except (OSError, ValueError) as e:
+                logger.warning("⚠️ Cache de vídeo inválido, decodificando: %s", e)
+        else:
+            video_cache.build_cache_in_background(path, size)
+
+    return VideoPlayer(path, size, **kwargs).start()
@@ -3,13 +3,78 @@ Módulo de visualização do grafo e interface do jogo usando Pygame
 """
 import pygame
 import math
+import numpy as np
+import backgrounds
 from collections import defaultdict
+from game_clock import GameClock
+from asset_manager import AssetManager, DerivedImageCache
+from sprite_atlas import ATLASES, SpriteSheet, atlas_paths, frame_files
+from particles import StampSet, blit_stamps
+from graph_layout import GraphLayout
+from camera import Camera, ScreenPositions
+from game_logging import get_logger
+
+logger = get_logger("visualizer")
+
+# Níveis de detalhe do grafo (escolhidos pelo espaçamento dos nós na tela)
+LOD_DOTS, LOD_SIMPLE, LOD_FULL = 0, 1, 2
 
 class Visualizer:
-    def __init__(self, width=1200, height=800):
+    # Arquivos de assets (carregados em segundo plano pelo AssetManager)
+    BACKGROUND_PATH = "level1_1.png"
+    LEVEL_COMPLETE_BACKGROUNDS = {
+        'level_complete_bg': "images/background/nivelcompleto.png",
+        'quase_la_bg': "images/background/quase-la.png",
+        'tente_nova_bg': "images/background/tente-nova.png",
+    }
+    DEATH_BACKGROUND_PATH = "images/background/youdied.png"
+    STAR_IMAGE_PATHS = {
+        1: "images/elements/onestar.png",
+        2: "images/elements/twostars.png",
+        3: "images/elements/threestarts.png",
+    }
+    BUTTON_PATHS = {
+        'newgame': 'bttns/novojogo (1).png',
+        'continue': 'bttns/continuar (1).png',
+        'continue_disabled': 'bttns/continuardisabled (1).png',
+        'exit': 'bttns/sair (2).png',
+        'next_level': 'bttns/nextlevel.png',
+        'repeat_level': 'bttns/repeatlevel.png',
+        'main_menu': 'bttns/gotomenu.png',
+    }
+    # Atributo com a lista de frames -> (atlas, animação) em sprite_atlas.ATLASES
+    SPRITE_ANIMATIONS = {
+        'idle_sprites': ("player", "idle"),
+        'run_sprites': ("player", "run"),
+        'run_left_sprites': ("player", "run_left"),
+        'player_attack_sprites': ("player", "attack"),
+        'enemy_idle_sprites': ("enemy", "idle"),
+        'enemy_attack_sprites': ("enemy", "attack"),
+        'enemy_dead_sprites': ("enemy", "dead"),
+    }
+    WHOOSH_SOUND_PATH = "sounds/810736__mokasza__fast-whoosh.mp3"
+    # Espaçamento típico entre nós (px) abaixo do qual o grafo perde detalhes
+    LOD_LABEL_SPACING = 60  # Sem pesos das arestas, sombras e números dos nós distantes
+    LOD_DOT_SPACING = 24  # Nós longe do jogador viram pontos e arestas ficam finas
+    VIEW_MARGIN = 60  # Folga do recorte: brilhos, sprites e rótulos passam do centro do nó
+    LAYOUT_REFERENCE_NODES = 50  # Até este tamanho o grafo cabe no círculo da tela; maiores crescem no mundo
+    PATH_CHUNK = 64  # Pontos por trecho do caminho do jogador (recorte por trecho)
+    VICTORY_SOUND_PATH = "sounds/victory.wav"
+    
+    def __init__(self, width=1200, height=800, clock=None, vsync=False, video_cache=False):
         self.width = width
         self.height = height
-        self.screen = pygame.display.set_mode((width, height))
+        self.video_cache = video_cache  # Vídeo final a partir do cache pré-transcodificado
+        self._projection_cache = None  # (custo, nó, ótimo) -> superfície da projeção de estrelas no HUD
+        
+        # Relógio compartilhado com a simulação (animações usam o tempo interpolado)
+        self.clock = clock or GameClock()
+        
+        if vsync:
+            # vsync exige SCALED (ou OPENGL) no pygame 2
+            self.screen = pygame.display.set_mode((width, height), pygame.SCALED, vsync=1)
+        else:
+            self.screen = pygame.display.set_mode((width, height))
         pygame.display.set_caption("🧙 PathFinder Adventure")
         
         # Cores (paleta ninja)
@@ -38,29 +103,37 @@ class Visualizer:
         self.NINJA_GOLD = (255, 215, 0)  # Ouro ninja
         self.NINJA_DARK = (40, 5, 15)  # Ninja escuro
         
-        # Carregar background ninja
-        self.load_background()
-        
-        # Carregar background de nível completo
-        self.load_level_complete_background()
-        
-        # Carregar background de morte
-        self.load_death_background()
-        
-        # Carregar imagens de estrelas
-        self.load_star_images()
-        
-        # Sistema de vídeo final
-        self.final_video_cap = None
-        
-        # Carregar imagens de inimigos
-        self.load_enemy_images()
-        
-        # Sistema de som ninja
-        self.load_ninja_sounds()
-        
-        # Carregar botões de imagem
-        self.load_button_images()
+        # Assets (imagens e sons) carregados em segundo plano; ficam vazios até
+        # finish_loading() e o desenho usa os fallbacks vetoriais enquanto isso
+        self.assets = AssetManager()
+        self.background_image = None
+        self.level_complete_bg = None
+        self.quase_la_bg = None
+        self.tente_nova_bg = None
+        self.death_bg = None
+        self.star_images = {}
+        self.enemy_idle_sprites = []
+        self.enemy_attack_sprites = []
+        self.enemy_dead_sprites = []
+        self.player_attack_sprites = []
+        self.button_images = {}
+        self.whoosh_sound = None
+        self.victory_sound = None
+        self.sprite_sheets = {}  # Atlas de sprites por personagem (sprite_atlas.SpriteSheet)
+        self.derived_images = DerivedImageCache()  # Variantes prontas das artes das telas finais
+        self._stamps = None  # Imagens das partículas (criadas no primeiro uso)
+        self._layout = None  # GraphLayout do grafo atual (posições no mundo e índice espacial)
+        self.camera = Camera(width, height)
+        self._screen_positions = None  # ScreenPositions do layout atual
+        self._labels = {}  # Texto -> superfície (pesos e números dos nós)
+        self._path_cache = (None, [], 0)  # (caminho, trechos [pontos no mundo, caixa envolvente], nós lidos)
+        self._last_graph_draw = None  # Instante do último draw_graph (acompanhamento da câmera)
+        
+        # Sistema de vídeo final (decodificado em thread separada)
+        self.final_video_player = None
+        
+        # Sistema de som ninja (mixer e música de fundo na thread principal)
+        self.init_ninja_audio()
         
         # Sistema de transições melhorado
         self.is_transitioning = False
@@ -100,10 +173,8 @@ class Visualizer:
         # Direção atual do movimento
         self.current_movement_direction = None
         
-        # Carregar sprites de animação
-        self.load_idle_sprites()
-        self.load_run_sprites()
-        self.load_run_left_sprites()
+        # Pede todos os assets às threads de carregamento (não bloqueia)
+        self.request_assets()
         
         # Sistema de sprites (removido o sistema antigo em favor do novo sistema de animação)
         
@@ -119,40 +190,22 @@ class Visualizer:
             self.font_large = pygame.font.Font(None, 48)
             self.font_title = pygame.font.Font(None, 64)
     
-    def load_idle_sprites(self):
-        """Carrega os sprites de animação idle (idle0.png até idle4.png)"""
-        import os
-        
-        self.idle_sprites = []
-        
-        # Tenta carregar idle0.png até idle4.png
-        for i in range(5):
-            sprite_path = f"idle{i}.png"
-            if os.path.exists(sprite_path):
-                try:
-                    sprite = pygame.image.load(sprite_path).convert_alpha()
-                    # Redimensiona para tamanho adequado (40x40 pixels)
-                    sprite = pygame.transform.scale(sprite, (120, 120))
-                    self.idle_sprites.append(sprite)
-                    print(f"✅ Sprite carregado: {sprite_path}")
-                except pygame.error as e:
-                    print(f"❌ Erro ao carregar {sprite_path}: {e}")
-            else:
-                print(f"⚠️ Arquivo não encontrado: {sprite_path}")
-        
-        if not self.idle_sprites:
-            print("🎨 Nenhum sprite encontrado, usando desenho vetorial")
-            self.use_sprites = False
-        else:
-            print(f"🎬 {len(self.idle_sprites)} sprites carregados para animação idle")
+    def set_cursor(self, cursor):
+        """Troca o cursor do sistema só quando muda; drivers sem cursor (ex.: dummy) ignoram"""
+        if cursor == getattr(self, '_cursor', None):
+            return
+        self._cursor = cursor
+        try:
+            pygame.mouse.set_cursor(cursor)
+        except pygame.error:
+            logger.debug("Cursor do sistema indisponível neste driver de vídeo")
     
     def update_idle_animation(self):
         """Atualiza a animação idle do personagem"""
         if not self.idle_sprites:
             return
             
-        import time
-        current_time = time.time()
+        current_time = self.clock.render_time()
         
         if current_time - self.idle_animation_timer >= self.idle_frame_duration:
             self.current_idle_frame = (self.current_idle_frame + 1) % len(self.idle_sprites)
@@ -160,39 +213,20 @@ class Visualizer:
     
     def load_run_sprites(self):
         """Carrega os sprites de animação de corrida (run_0.png até run_5.png)"""
-        import os
-        import time
-        
-        self.run_sprites = []
-        self.run_animation_timer = time.time()
-        
-        # Tenta carregar run_0.png até run_5.png
-        for i in range(6):
-            sprite_path = f"run_{i}.png"
-            if os.path.exists(sprite_path):
-                try:
-                    sprite = pygame.image.load(sprite_path).convert_alpha()
-                    # Redimensiona para tamanho adequado (120x120 pixels)
-                    sprite = pygame.transform.scale(sprite, (120, 120))
-                    self.run_sprites.append(sprite)
-                    print(f"🏃 Sprite de corrida carregado: {sprite_path}")
-                except pygame.error as e:
-                    print(f"❌ Erro ao carregar {sprite_path}: {e}")
-            else:
-                print(f"⚠️ Arquivo não encontrado: {sprite_path}")
+        self.run_animation_timer = self.clock.render_time()
+        self.run_sprites = self._animation_frames('run_sprites')
         
         if not self.run_sprites:
-            print("⚠️ Nenhum sprite de corrida encontrado")
+            logger.warning("⚠️ Nenhum sprite de corrida encontrado")
         else:
-            print(f"🏃 {len(self.run_sprites)} sprites de corrida carregados!")
+            logger.info("🏃 %s sprites de corrida carregados!", len(self.run_sprites))
     
     def update_run_animation(self):
         """Atualiza a animação de corrida do personagem"""
         if not self.run_sprites:
             return
             
-        import time
-        current_time = time.time()
+        current_time = self.clock.render_time()
         
         if current_time - self.run_animation_timer >= self.run_frame_duration:
             self.current_run_frame = (self.current_run_frame + 1) % len(self.run_sprites)
@@ -200,39 +234,20 @@ class Visualizer:
     
     def load_run_left_sprites(self):
         """Carrega os sprites de animação de corrida para a esquerda (runleft0.png até runleft5.png)"""
-        import os
-        import time
-        
-        self.run_left_sprites = []
-        self.run_left_animation_timer = time.time()
-        
-        # Tenta carregar runleft0.png até runleft5.png
-        for i in range(6):
-            sprite_path = f"runleft{i}.png"
-            if os.path.exists(sprite_path):
-                try:
-                    sprite = pygame.image.load(sprite_path).convert_alpha()
-                    # Redimensiona para tamanho adequado (120x120 pixels)
-                    sprite = pygame.transform.scale(sprite, (120, 120))
-                    self.run_left_sprites.append(sprite)
-                    print(f"🏃⬅️ Sprite de corrida esquerda carregado: {sprite_path}")
-                except pygame.error as e:
-                    print(f"❌ Erro ao carregar {sprite_path}: {e}")
-            else:
-                print(f"⚠️ Arquivo não encontrado: {sprite_path}")
+        self.run_left_animation_timer = self.clock.render_time()
+        self.run_left_sprites = self._animation_frames('run_left_sprites')
         
         if not self.run_left_sprites:
-            print("⚠️ Nenhum sprite de corrida esquerda encontrado")
+            logger.warning("⚠️ Nenhum sprite de corrida esquerda encontrado")
         else:
-            print(f"🏃⬅️ {len(self.run_left_sprites)} sprites de corrida esquerda carregados!")
+            logger.info("🏃⬅️ %s sprites de corrida esquerda carregados!", len(self.run_left_sprites))
     
     def update_run_left_animation(self):
         """Atualiza a animação de corrida para a esquerda do personagem"""
         if not self.run_left_sprites:
             return
             
-        import time
-        current_time = time.time()
+        current_time = self.clock.render_time()
         
         if current_time - self.run_left_animation_timer >= self.run_frame_duration:
             self.current_run_left_frame = (self.current_run_left_frame + 1) % len(self.run_left_sprites)
@@ -240,8 +255,8 @@ class Visualizer:
         
     def draw_graph(self, world, player, clicked_nodes=None, show_optimal_path=False, hovered_node=None, animated_player_pos=None, game_instance=None):
         """Desenha o grafo na tela com visual profissional"""
-        # Atualiza animação
-        self.animation_time += 0.1
+        # Atualiza animação (0.1 por frame a 60 FPS, agora independente da taxa de renderização)
+        self.animation_time = self.clock.render_time() * 6.0
         self.player_pulse = math.sin(self.animation_time * 3) * 0.3 + 1
         
         # Desenha background ninja
@@ -250,28 +265,32 @@ class Visualizer:
         if clicked_nodes is None:
             clicked_nodes = set()
         
-        # Calcula posições dos nós
-        node_positions = self._calculate_node_positions(world.graph)
+        # Posições dos nós (calculadas uma vez por grafo), câmera, recorte e nível de detalhe
+        layout = self.graph_layout(world.graph)
+        self._follow_player(layout, player)
+        node_positions = self._screen_positions
+        view = self.camera.view_rect(self.VIEW_MARGIN)  # No mundo
+        detail = self.detail_level(layout)
         
         # Desenha caminho ótimo se solicitado
         if show_optimal_path and hasattr(world, 'optimal_path'):
             self._draw_optimal_path(world.optimal_path, node_positions)
         
         # Desenha arestas com estilo profissional
-        self._draw_edges(world.graph, node_positions)
+        self._draw_edges(layout, view, detail)
         
         # Destaca conexões do nó hovered
         if hovered_node is not None:
             self._draw_hovered_connections(world.graph, node_positions, hovered_node)
         
         # Desenha o caminho do jogador
-        self._draw_player_path(player.path_taken, node_positions)
+        self._draw_player_path(player.path_taken, layout.positions, view)
         
         # Desenha nós com efeitos visuais
-        self._draw_nodes(world, player, node_positions, clicked_nodes, hovered_node)
+        self._draw_nodes(world, player, node_positions, clicked_nodes, hovered_node, layout.nodes_in(view), detail)
         
         # Desenha inimigos (se houver)
-        self._draw_enemies(world, node_positions, game_instance)
+        self._draw_enemies(world, node_positions, game_instance, detail=detail)
         
         # Desenha indicadores direcionais
         self._draw_directional_indicators(world, player, node_positions)
@@ -287,80 +306,130 @@ class Visualizer:
     
     def _draw_gradient_background(self):
         """Desenha um fundo com gradiente ninja refinado"""
-        # Desenhar gradiente base
-        for y in range(self.height):
-            ratio = y / self.height
-            # Suavizar transição com curva
-            smooth_ratio = ratio * ratio * (3.0 - 2.0 * ratio)  # Smoothstep
-            
-            r = int(self.BG_GRADIENT_TOP[0] * (1 - smooth_ratio) + self.BG_GRADIENT_BOTTOM[0] * smooth_ratio)
-            g = int(self.BG_GRADIENT_TOP[1] * (1 - smooth_ratio) + self.BG_GRADIENT_BOTTOM[1] * smooth_ratio)
-            b = int(self.BG_GRADIENT_TOP[2] * (1 - smooth_ratio) + self.BG_GRADIENT_BOTTOM[2] * smooth_ratio)
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (self.width, y))
+        # Gradiente base (smoothstep) pré-calculado para este tamanho e paleta
+        gradient = backgrounds.vertical_gradient(
+            (self.width, self.height), self.BG_GRADIENT_TOP, self.BG_GRADIENT_BOTTOM, smooth=True
+        )
+        self.screen.blit(gradient, (0, 0))
         
         # Adicionar textura ninja sutil
         self._add_ninja_texture()
     
     def _add_ninja_texture(self):
-        """Adiciona uma textura ninja sutil ao fundo"""
-        import random
-        random.seed(42)  # Seed fixo para consistência
-        
-        # Adicionar pontos ninja sutis
-        for _ in range(30):
-            x = random.randint(0, self.width)
-            y = random.randint(0, self.height)
-            alpha = random.randint(8, 20)
-            size = random.randint(1, 2)
-            
-            ninja_surface = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
-            ninja_color = (*self.NINJA_SHADOW, alpha)
-            pygame.draw.circle(ninja_surface, ninja_color, (size, size), size)
-            self.screen.blit(ninja_surface, (x-size, y-size))
-    
-    def _draw_edges(self, graph, node_positions):
-        """Desenha arestas com estilo profissional"""
-        for start, end, data in graph.edges(data=True):
-            start_pos = node_positions[start]
-            end_pos = node_positions[end]
-            weight = data.get('weight', 1)
-            
-            # Desenha sombra da aresta
+        """Adiciona uma textura ninja sutil ao fundo (pontos fixos, gerados uma vez)"""
+        texture = backgrounds.speckle_texture((self.width, self.height), self.NINJA_SHADOW, seed=42)
+        self.screen.blit(texture, (0, 0))
+    
+    def graph_layout(self, graph):
+        """GraphLayout do grafo (refeito só quando o nível troca de grafo, junto com a câmera)"""
+        if self._layout is None or self._layout.graph is not graph:
+            self._layout = GraphLayout(graph, self._layout_positions(graph))
+            self._screen_positions = ScreenPositions(self._layout.positions, self.camera)
+            left, top, right, bottom = self._layout.bounds
+            margin = self.VIEW_MARGIN
+            self.camera.reset((left - margin, top - margin, right + margin, bottom + margin))
+            self._path_cache = (None, [], 0)
+        return self._layout
+    
+    def _follow_player(self, layout, player):
+        """Câmera acompanha o nó do jogador (no tempo de renderização, suavizado)"""
+        now = self.clock.render_time()
+        dt = 0.0 if self._last_graph_draw is None else now - self._last_graph_draw
+        self._last_graph_draw = now
+        if player.current_node in layout.positions:
+            self.camera.follow(layout.positions[player.current_node], dt)
+    
+    def nodes_at(self, graph, pos, radius):
+        """[(distância na tela, nó)] dos nós a até 'radius' pixels de pos, do mais próximo ao mais distante"""
+        layout = self.graph_layout(graph)
+        zoom = self.camera.zoom
+        return [(distance * zoom, node)
+                for distance, node in layout.nodes_near(self.camera.to_world(pos), radius / zoom)]
+    
+    def _view_rect(self):
+        """Área da tela (left, top, right, bottom) com folga para o recorte"""
+        margin = self.VIEW_MARGIN
+        return (-margin, -margin, self.width + margin, self.height + margin)
+    
+    def detail_level(self, layout):
+        """LOD_FULL, LOD_SIMPLE ou LOD_DOTS conforme o espaçamento dos nós na tela (com o zoom)"""
+        spacing = layout.spacing * self.camera.zoom
+        if spacing >= self.LOD_LABEL_SPACING:
+            return LOD_FULL
+        if spacing >= self.LOD_DOT_SPACING:
+            return LOD_SIMPLE
+        return LOD_DOTS
+    
+    def _label(self, text):
+        """Texto renderizado uma vez e reaproveitado nos quadros seguintes"""
+        surface = self._labels.get(text)
+        if surface is None:
+            surface = self._labels[text] = self.font_small.render(text, True, self.TEXT_COLOR)
+        return surface
+    
+    def _draw_edges(self, layout, view, detail):
+        """Desenha as arestas visíveis ('view' no mundo), uma chamada de draw.lines por trilha"""
+        to_screen = self.camera.to_screen
+        trails = [[to_screen(point) for point in layout.trail_points[i]] for i in layout.trails_in(view)]
+        
+        if detail == LOD_FULL:
+            # Sombra das arestas
             shadow_offset = 2
-            pygame.draw.line(self.screen, (0, 0, 0, 50), 
-                           (start_pos[0] + shadow_offset, start_pos[1] + shadow_offset),
-                           (end_pos[0] + shadow_offset, end_pos[1] + shadow_offset), 3)
-            
-            # Desenha aresta principal
-            pygame.draw.line(self.screen, self.EDGE_COLOR, start_pos, end_pos, 3)
-            
-            # Desenha o peso da aresta com fundo
-            mid_x = (start_pos[0] + end_pos[0]) / 2
-            mid_y = (start_pos[1] + end_pos[1]) / 2
-            
-            weight_text = self.font_small.render(str(weight), True, self.TEXT_COLOR)
-            text_rect = weight_text.get_rect(center=(mid_x, mid_y))
-            
-            # Fundo do texto
-            padding = 4
+            for points in trails:
+                pygame.draw.lines(self.screen, (0, 0, 0, 50), False,
+                                  [(x + shadow_offset, y + shadow_offset) for x, y in points], 3)
+        
+        # Arestas principais (finas quando os nós viram pontos)
+        width = 1 if detail == LOD_DOTS else 3
+        for points in trails:
+            pygame.draw.lines(self.screen, self.EDGE_COLOR, False, points, width)
+        
+        if detail != LOD_FULL:
+            return
+        
+        # Peso de cada aresta com fundo
+        padding = 4
+        for i in layout.edges_in(view):
+            weight_text = self._label(str(layout.edges[i][2]))
+            text_rect = weight_text.get_rect(center=to_screen(layout.midpoint(i)))
             bg_rect = text_rect.inflate(padding * 2, padding * 2)
             pygame.draw.rect(self.screen, self.PANEL_COLOR, bg_rect)
             pygame.draw.rect(self.screen, self.PANEL_BORDER, bg_rect, 1)
-            
             self.screen.blit(weight_text, text_rect)
     
-    def _draw_player_path(self, path, node_positions):
-        """Desenha o caminho percorrido pelo jogador"""
-        if len(path) > 1:
-            for i in range(len(path) - 1):
-                start = path[i]
-                end = path[i + 1]
-                start_pos = node_positions[start]
-                end_pos = node_positions[end]
-                
-                # Desenha linha mais grossa com brilho
-                pygame.draw.line(self.screen, self.PATH_COLOR, start_pos, end_pos, 6)
-                pygame.draw.line(self.screen, (200, 255, 200), start_pos, end_pos, 3)
+    def _draw_player_path(self, path, world_positions, view):
+        """Desenha o caminho percorrido pelo jogador
+
+        Os pontos (no mundo) são acumulados entre quadros em trechos de PATH_CHUNK; só os
+        trechos que tocam 'view' são convertidos para a tela e desenhados
+        """
+        if len(path) < 2:
+            return
+        cached_path, chunks, done = self._path_cache
+        if cached_path is not path:
+            chunks, done = [], 0
+        changed = max(len(chunks) - 1, 0)  # Primeiro trecho que pode crescer
+        for node in path[done:]:
+            if not chunks or len(chunks[-1][0]) >= self.PATH_CHUNK:
+                # O trecho novo começa no último ponto do anterior para a linha continuar
+                chunks.append([chunks[-1][0][-1:] if chunks else [], None])
+            chunks[-1][0].append(world_positions[node])
+        if len(path) > done:
+            for chunk in chunks[changed:]:  # Caixa envolvente só dos trechos que cresceram
+                points = chunk[0]
+                chunk[1] = (min(x for x, _ in points), min(y for _, y in points),
+                            max(x for x, _ in points), max(y for _, y in points))
+        self._path_cache = (path, chunks, len(path))
+        
+        left, top, right, bottom = view
+        to_screen = self.camera.to_screen
+        for points, (x0, y0, x1, y1) in chunks:
+            if len(points) < 2 or x1 < left or x0 > right or y1 < top or y0 > bottom:
+                continue
+            screen_points = [to_screen(point) for point in points]
+            # Desenha linha mais grossa com brilho
+            pygame.draw.lines(self.screen, self.PATH_COLOR, False, screen_points, 6)
+            pygame.draw.lines(self.screen, (200, 255, 200), False, screen_points, 3)
     
     def _draw_optimal_path(self, optimal_path, node_positions):
         """Desenha o caminho ótimo"""
@@ -394,11 +463,25 @@ class Visualizer:
             
             pygame.draw.line(self.screen, color, (x1, y1), (x2, y2), width)
     
-    def _draw_nodes(self, world, player, node_positions, clicked_nodes, hovered_node=None):
-        """Desenha nós com efeitos visuais profissionais"""
-        for node in world.graph.nodes():
+    def _draw_nodes(self, world, player, node_positions, clicked_nodes, hovered_node=None, nodes=None,
+                    detail=LOD_FULL):
+        """Desenha nós com efeitos visuais profissionais
+
+        nodes: só os nós visíveis (todos se None). Com menos detalhe, os nós longe do
+        jogador ficam sem número (LOD_SIMPLE) ou viram pontos (LOD_DOTS)
+        """
+        if nodes is None:
+            nodes = world.graph.nodes()
+        near = set(world.graph.neighbors(player.current_node)) if detail != LOD_FULL else ()
+        for node in nodes:
             pos = node_positions[node]
             
+            if (detail == LOD_DOTS and node not in near and node != world.end_node
+                    and node != hovered_node and node != player.current_node):
+                color = self.NODE_HIGHLIGHT if node in clicked_nodes else self.NODE_BORDER_COLOR
+                pygame.draw.circle(self.screen, color, pos, 3)
+                continue
+            
             # Determina cor e tamanho do nó
             if node == world.end_node:
                 # Nó de saída com efeito de brilho
@@ -484,8 +567,8 @@ class Visualizer:
                     pygame.draw.circle(self.screen, self.NODE_BORDER_COLOR, pos, 16, 2)
             
             # Desenha número do nó (exceto para o jogador)
-            if node != player.current_node:
-                node_text = self.font_small.render(str(node), True, self.TEXT_COLOR)
+            if node != player.current_node and (detail == LOD_FULL or node in near):
+                node_text = self._label(str(node))
                 text_rect = node_text.get_rect(center=pos)
                 self.screen.blit(node_text, text_rect)
     
@@ -499,8 +582,7 @@ class Visualizer:
             game_instance.combat_state == "simultaneous_attack" and 
             hasattr(self, 'player_attack_sprites') and self.player_attack_sprites):
             # Combate simultâneo - jogador à esquerda
-            import time
-            frame_index = int((time.time() - game_instance.combat_start_time) * 15) % len(self.player_attack_sprites)
+            frame_index = int((self.clock.render_time() - game_instance.combat_start_time) * 15) % len(self.player_attack_sprites)
             attack_sprite = self.player_attack_sprites[frame_index]
             
             # Posicionar jogador ligeiramente à esquerda durante combate
@@ -549,23 +631,6 @@ class Visualizer:
             # Desenha usando formas geométricas (método original)
             self._draw_vector_character(pos)
     
-    def _add_ninja_texture(self):
-        """Adiciona uma textura ninja sutil ao fundo"""
-        import random
-        random.seed(42)  # Seed fixo para consistência
-        
-        # Adicionar pontos ninja sutis
-        for _ in range(30):
-            x = random.randint(0, self.width)
-            y = random.randint(0, self.height)
-            alpha = random.randint(8, 20)
-            size = random.randint(1, 2)
-            
-            ninja_surface = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
-            ninja_color = (*self.NINJA_SHADOW, alpha)
-            pygame.draw.circle(ninja_surface, ninja_color, (size, size), size)
-            self.screen.blit(ninja_surface, (x-size, y-size))
-    
     def _draw_glow_circle(self, pos, radius, color, alpha):
         """Desenha um círculo com efeito de brilho"""
         glow_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
@@ -589,63 +654,60 @@ class Visualizer:
         
         pygame.draw.polygon(self.screen, (255, 255, 100), points)
     
+    def _particle_stamps(self):
+        """Imagens pré-renderizadas (por nível de alpha) das partículas do jogo e do menu"""
+        if self._stamps is None:
+            def circle(color, radius):
+                return lambda stamp, alpha: pygame.draw.circle(stamp, (*color, alpha), (radius, radius), radius)
+            
+            self._stamps = {
+                'player_orbit': StampSet((6, 6), circle((100, 200, 255), 3)),
+                'exit_orbit': StampSet((4, 4), circle((100, 255, 150), 2)),
+                'menu': {size: StampSet((size * 2, size * 2), circle(self.EDGE_COLOR, size)) for size in (1, 2, 3)},
+            }
+        return self._stamps
+    
     def _draw_particle_effects(self, world, player, node_positions):
         """Desenha efeitos de partículas"""
+        stamps = self._particle_stamps()
+        
         # Partículas ao redor do jogador
         player_pos = node_positions[player.current_node]
-        for i in range(3):
-            angle = self.animation_time * 2 + i * 2 * math.pi / 3
-            particle_x = player_pos[0] + math.cos(angle) * 35
-            particle_y = player_pos[1] + math.sin(angle) * 35
-            alpha = int(100 + math.sin(self.animation_time * 3 + i) * 50)
-            
-            particle_surf = pygame.Surface((6, 6), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surf, (100, 200, 255, alpha), (3, 3), 3)
-            self.screen.blit(particle_surf, (particle_x - 3, particle_y - 3))
+        i = np.arange(3)
+        angles = self.animation_time * 2 + i * 2 * math.pi / 3
+        blit_stamps(self.screen, stamps['player_orbit'],
+                    player_pos[0] + np.cos(angles) * 35,
+                    player_pos[1] + np.sin(angles) * 35,
+                    100 + np.sin(self.animation_time * 3 + i) * 50)
         
         # Partículas ao redor da saída
         exit_pos = node_positions[world.end_node]
-        for i in range(5):
-            angle = -self.animation_time * 1.5 + i * 2 * math.pi / 5
-            particle_x = exit_pos[0] + math.cos(angle) * 40
-            particle_y = exit_pos[1] + math.sin(angle) * 40
-            alpha = int(80 + math.sin(self.animation_time * 4 + i) * 40)
-            
-            particle_surf = pygame.Surface((4, 4), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surf, (100, 255, 150, alpha), (2, 2), 2)
-            self.screen.blit(particle_surf, (particle_x - 2, particle_y - 2))
+        i = np.arange(5)
+        angles = -self.animation_time * 1.5 + i * 2 * math.pi / 5
+        blit_stamps(self.screen, stamps['exit_orbit'],
+                    exit_pos[0] + np.cos(angles) * 40,
+                    exit_pos[1] + np.sin(angles) * 40,
+                    80 + np.sin(self.animation_time * 4 + i) * 40)
     
     def _draw_menu_background_effects(self):
         """Desenha efeitos de fundo animados para o menu"""
-        # Efeito de partículas flutuantes
-        import random
-        
-        for i in range(20):
-            # Posições baseadas no tempo para animação suave
-            x = (self.animation_time * 0.5 + i * 60) % (self.width + 100) - 50
-            y = 50 + math.sin(self.animation_time * 0.01 + i) * 30 + i * 25
-            
-            if 0 <= x <= self.width and 0 <= y <= self.height:
-                # Partículas pequenas brilhantes
-                alpha = int(100 + 50 * math.sin(self.animation_time * 0.02 + i))
-                size = 2 + int(math.sin(self.animation_time * 0.03 + i * 0.5))
-                
-                particle_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-                color = (*self.EDGE_COLOR, alpha)
-                pygame.draw.circle(particle_surf, color, (size, size), size)
-                self.screen.blit(particle_surf, (int(x), int(y)))
-        
-        # Linhas de grade sutil no fundo
+        # Efeito de partículas flutuantes (posições baseadas no tempo para animação suave)
+        i = np.arange(20)
+        xs = (self.animation_time * 0.5 + i * 60) % (self.width + 100) - 50
+        ys = 50 + np.sin(self.animation_time * 0.01 + i) * 30 + i * 25
+        alphas = 100 + 50 * np.sin(self.animation_time * 0.02 + i)
+        sizes = 2 + np.trunc(np.sin(self.animation_time * 0.03 + i * 0.5)).astype(int)
+        
+        on_screen = (xs >= 0) & (xs <= self.width) & (ys >= 0) & (ys <= self.height)
+        for size, stamps in self._particle_stamps()['menu'].items():
+            selected = on_screen & (sizes == size)
+            # (x, y) é o canto da partícula; blit_stamps recebe o centro
+            blit_stamps(self.screen, stamps, xs[selected].astype(int) + size, ys[selected].astype(int) + size,
+                        alphas[selected])
+        
+        # Linhas de grade sutil no fundo (superfície gerada uma vez)
         grid_alpha = 30
-        grid_color = (*self.EDGE_COLOR, grid_alpha)
-        grid_surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        
-        for i in range(0, self.width, 100):
-            pygame.draw.line(grid_surf, grid_color, (i, 0), (i, self.height), 1)
-        for i in range(0, self.height, 100):
-            pygame.draw.line(grid_surf, grid_color, (0, i), (self.width, i), 1)
-        
-        self.screen.blit(grid_surf, (0, 0))
+        self.screen.blit(backgrounds.grid_overlay((self.width, self.height), (*self.EDGE_COLOR, grid_alpha)), (0, 0))
     
     def _draw_hovered_connections(self, graph, node_positions, hovered_node):
         """Destaca as conexões do nó que está sendo hovered"""
@@ -732,7 +794,9 @@ class Visualizer:
         # Informações do nível
         level_text = self.font_medium.render(f"Nível: {world.level_id} | Nó Atual: {player.current_node} | Meta: {world.end_node}", True, self.TEXT_COLOR)
         self.screen.blit(level_text, (margin, y_pos + 35))
-        
+        if player.score is not None:
+            self._draw_star_projection(player, margin + level_text.get_width() + 25, y_pos + 35)
+
         # XP, Pontos e Vidas
         stats_text = self.font_small.render(f"XP: {player.experience}/100 | Pontos: {player.points}", True, (255, 255, 255))
         self.screen.blit(stats_text, (self.width - 300, y_pos))
@@ -749,8 +813,25 @@ class Visualizer:
         self.screen.blit(controls_line1, (self.width - 450, y_pos + 35))
         
         # Controles - linha 2 (diagonais)
-        controls_line2 = self.font_small.render("Diagonais: W+A=↖ | W+D=↗ | S+A=↙ | S+D=↘", True, (255, 255, 255))
-        self.screen.blit(controls_line2, (self.width - 350, y_pos + 55))
+        controls_line2 = self.font_small.render("Diagonais: W+A=↖ | W+D=↗ | S+A=↙ | S+D=↘ | Roda/Botão dir.: Câmera | C: Centralizar", True, (255, 255, 255))
+        self.screen.blit(controls_line2, (self.width - 560, y_pos + 55))
+
+    def _draw_star_projection(self, player, x, y):
+        """Custo do caminho e estrelas ainda possíveis; a superfície só é refeita quando o custo muda"""
+        score = player.score
+        key = (score.cost, score.node, score.world.optimal_distance)
+        if self._projection_cache is None or self._projection_cache[0] != key:
+            efficiency = score.projected_efficiency
+            stars = player.calculate_stars(efficiency)
+            text = self.font_small.render(f"Custo: {score.cost} | Projeção: {efficiency * 100:.0f}%", True,
+                                          self.TEXT_COLOR)
+            surface = pygame.Surface((text.get_width() + 3 * 20 + 10, max(text.get_height(), 20)), pygame.SRCALPHA)
+            surface.blit(text, (0, 0))
+            for i in range(3):
+                color = (255, 215, 0) if i < stars else (80, 80, 80)
+                pygame.draw.polygon(surface, color, self._get_star_points(text.get_width() + 18 + i * 20, 10, 8))
+            self._projection_cache = (key, surface)
+        self.screen.blit(self._projection_cache[1], (x, y))
 
     def draw_menu(self, levels_completed=0, player=None):
         """Desenha apenas os botões de imagem sobre o video background"""
@@ -807,9 +888,9 @@ class Visualizer:
                 # Efeito de cursor apenas se não estiver em transição e botão habilitado
                 if not getattr(self, 'is_transitioning', False):
                     if is_hover and is_enabled:
-                        pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
+                        self.set_cursor(pygame.SYSTEM_CURSOR_HAND)
                     else:
-                        pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+                        self.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
     
     def draw_level_complete(self, results):
         """Desenha a tela de nível completo com background personalizado e estrelas em imagem"""
@@ -819,35 +900,18 @@ class Visualizer:
         # Usar background baseado nas estrelas ou fallback
         stars_earned = results.get('stars_earned', 0)
         
-        # Escolher background baseado nas estrelas
-        background_used = False
-        
-        if stars_earned == 2 and hasattr(self, 'quase_la_bg') and self.quase_la_bg:
-            self.screen.blit(self.quase_la_bg, (0, 0))
-            background_used = True
-        elif stars_earned == 1 and hasattr(self, 'tente_nova_bg') and self.tente_nova_bg:
-            self.screen.blit(self.tente_nova_bg, (0, 0))
-            background_used = True
-        elif hasattr(self, 'level_complete_bg') and self.level_complete_bg:
-            # Background padrão para 3 estrelas ou quando não há fundo específico
-            self.screen.blit(self.level_complete_bg, (0, 0))
-            background_used = True
-        
-        # Fallback para ninja se não conseguir carregar nenhum background
-        if not background_used:
+        # Background e estrelas já prontos para esta resolução (calculados uma vez)
+        background = self._level_complete_background(stars_earned)
+        if background:
+            self.screen.blit(background, (0, 0))
+        else:
+            # Fallback para ninja se não conseguir carregar nenhum background
             self.draw_ninja_background()
         
-        # Sistema de estrelas com imagens (acima das estatísticas)
-        stars_earned = results.get('stars_earned', 0)
-        
-        # Exibir imagem de estrelas baseada na classificação
-        if stars_earned in self.star_images:
-            star_image = self.star_images[stars_earned]
-            # Reduzir o tamanho das estrelas
-            star_height = int(star_image.get_height() * 0.7)  # 70% da altura original
-            star_width = int(star_image.get_width() * 0.7)   # Manter proporção
-            star_image = pygame.transform.scale(star_image, (star_width, star_height))
-            star_x = (self.width - star_width) // 2
+        # Exibir imagem de estrelas baseada na classificação (acima das estatísticas)
+        star_image = self._end_screen_stars(stars_earned)
+        if star_image:
+            star_x = (self.width - star_image.get_width()) // 2
             star_y = 280  # Posição das estrelas mais próxima do topo
             self.screen.blit(star_image, (star_x, star_y))
         
@@ -914,14 +978,8 @@ class Visualizer:
                 
                 # Escolher imagem
                 if button_key == 'next_level_disabled':
-                    # Botão disabled - usar imagem normal sem hover
-                    button_image = button_data['normal']
-                    # Aplicar efeito de desabilitação
-                    disabled_surface = button_image.copy()
-                    disabled_overlay = pygame.Surface(disabled_surface.get_size(), pygame.SRCALPHA)
-                    disabled_overlay.fill((128, 128, 128, 128))  # Overlay cinza
-                    disabled_surface.blit(disabled_overlay, (0, 0), special_flags=pygame.BLEND_MULT)
-                    button_image = disabled_surface
+                    # Botão disabled - imagem normal com efeito de desabilitação, sem hover
+                    button_image = self._disabled_button_image(actual_key)
                 else:
                     button_image = button_data['hover'] if is_hover else button_data['normal']
                 
@@ -934,9 +992,59 @@ class Visualizer:
                 
                 # Cursor
                 if not getattr(self, 'is_transitioning', False) and is_hover and is_enabled:
-                    pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
+                    self.set_cursor(pygame.SYSTEM_CURSOR_HAND)
                 elif not is_hover:
-                    pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+                    self.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+    
+    def _screen_background(self, attribute):
+        """Background de tela cheia no tamanho atual da tela (redimensionado uma vez)"""
+        source = getattr(self, attribute, None)
+        if not source:
+            return None
+        if source.get_size() == (self.width, self.height):
+            return source
+        return self.derived_images.get(
+            (attribute, self.width, self.height),
+            lambda: pygame.transform.scale(source, (self.width, self.height))
+        )
+    
+    def _level_complete_background(self, stars_earned):
+        """Background da tela de nível completo para o número de estrelas"""
+        if stars_earned == 2 and self.quase_la_bg:
+            return self._screen_background('quase_la_bg')
+        if stars_earned == 1 and self.tente_nova_bg:
+            return self._screen_background('tente_nova_bg')
+        # Background padrão para 3 estrelas ou quando não há fundo específico
+        return self._screen_background('level_complete_bg')
+    
+    def _end_screen_stars(self, stars, darkened=False):
+        """Imagem de estrelas das telas finais (70% do tamanho; escurecida na tela de morte)"""
+        source = self.star_images.get(stars)
+        if source is None:
+            return None
+        
+        def build():
+            image = source
+            if darkened:
+                image = source.copy()
+                dark_overlay = pygame.Surface(image.get_size())
+                dark_overlay.fill((100, 0, 0))  # Vermelho escuro
+                image.blit(dark_overlay, (0, 0), special_flags=pygame.BLEND_MULT)
+            size = (int(image.get_width() * 0.7), int(image.get_height() * 0.7))
+            return pygame.transform.scale(image, size)
+        
+        return self.derived_images.get(("end_stars", stars, darkened, self.width, self.height), build)
+    
+    def _disabled_button_image(self, button_key):
+        """Versão acinzentada de um botão (calculada uma vez)"""
+        def build():
+            disabled_surface = self.button_images[button_key]['normal'].copy()
+            disabled_overlay = pygame.Surface(disabled_surface.get_size(), pygame.SRCALPHA)
+            disabled_overlay.fill((128, 128, 128, 128))  # Overlay cinza
+            disabled_surface.blit(disabled_overlay, (0, 0), special_flags=pygame.BLEND_MULT)
+            return disabled_surface
+        
+        return self.derived_images.get(("disabled_button", button_key), build)
     
     def _draw_rounded_rect(self, surface, color, x, y, width, height, radius):
         """Desenha um retângulo com bordas arredondadas reais"""
@@ -1281,24 +1389,16 @@ class Visualizer:
         self.hovered_button = None
         
         # Usar background de morte ou fallback
-        if hasattr(self, 'death_bg') and self.death_bg:
-            self.screen.blit(self.death_bg, (0, 0))
+        death_bg = self._screen_background('death_bg')
+        if death_bg:
+            self.screen.blit(death_bg, (0, 0))
         else:
             self.draw_ninja_background()
         
-        # Imagem de 0 estrelas (caveira ou imagem de falha)
-        if hasattr(self, 'star_images') and 1 in self.star_images:
-            # Usar imagem de uma estrela como placeholder, mas com tom sombrio
-            star_image = self.star_images[1].copy()
-            # Escurecer a imagem
-            dark_overlay = pygame.Surface(star_image.get_size())
-            dark_overlay.fill((100, 0, 0))  # Vermelho escuro
-            star_image.blit(dark_overlay, (0, 0), special_flags=pygame.BLEND_MULT)
-            
-            star_width = int(star_image.get_width() * 0.7)
-            star_height = int(star_image.get_height() * 0.7)
-            star_image = pygame.transform.scale(star_image, (star_width, star_height))
-            star_x = (self.width - star_width) // 2
+        # Imagem de uma estrela como placeholder, mas com tom sombrio (calculada uma vez)
+        star_image = self._end_screen_stars(1, darkened=True)
+        if star_image:
+            star_x = (self.width - star_image.get_width()) // 2
             star_y = 300
             self.screen.blit(star_image, (star_x, star_y))
         
@@ -1365,27 +1465,39 @@ class Visualizer:
                 
                 # Cursor
                 if not getattr(self, 'is_transitioning', False) and is_hover:
-                    pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
+                    self.set_cursor(pygame.SYSTEM_CURSOR_HAND)
                 elif not is_hover:
-                    pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+                    self.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
     
     def handle_death_button_click(self, pos):
         """Detecta cliques nos botões da tela de morte"""
         if hasattr(self, 'death_buttons'):
             for button_id, button_rect in self.death_buttons.items():
                 if button_rect.collidepoint(pos):
-                    print(f"🎯 Clique no botão de morte: {button_id}")
+                    logger.debug("🎯 Clique no botão de morte: %s", button_id)
                     return button_id
         return None
     
     def _calculate_node_positions(self, graph, center_x=None, center_y=None, radius=None):
-        """Calcula posições dos nós na tela"""
+        """Calcula posições dos nós na tela (sem argumentos, as do layout em cache vistas pela câmera)"""
+        if center_x is None and center_y is None and radius is None:
+            self.graph_layout(graph)
+            return self._screen_positions
+        return self._layout_positions(graph, center_x, center_y, radius)
+    
+    def _layout_positions(self, graph, center_x=None, center_y=None, radius=None):
+        """Posições dos nós: 'pos' do gerador normalizado no quadrado do raio, ou em círculo
+
+        O raio padrão cresce com a raiz do número de nós acima de LAYOUT_REFERENCE_NODES,
+        mantendo o espaçamento; a câmera mostra a parte que cabe na tela
+        """
         if center_x is None:
             center_x = self.width // 2
         if center_y is None:
             center_y = self.height // 2
         if radius is None:
-            radius = min(self.width, self.height) // 3
+            growth = max(1.0, math.sqrt(graph.number_of_nodes() / self.LAYOUT_REFERENCE_NODES))
+            radius = min(self.width, self.height) // 3 * growth
         
         # Se o grafo tem posições pré-calculadas, usa essas
         node_positions = {}
@@ -1462,40 +1574,22 @@ class Visualizer:
     
     def load_idle_sprites(self):
         """Carrega os sprites de animação idle (idle0.png até idle4.png)"""
-        import os
-        import time
-        
-        self.idle_sprites = []
-        self.idle_animation_timer = time.time()
-        
-        # Tenta carregar idle0.png até idle4.png
-        for i in range(5):
-            sprite_path = f"idle{i}.png"
-            if os.path.exists(sprite_path):
-                try:
-                    sprite = pygame.image.load(sprite_path).convert_alpha()
-                    # Redimensiona para tamanho adequado (40x40 pixels)
-                    sprite = pygame.transform.scale(sprite, (120, 120))
-                    self.idle_sprites.append(sprite)
-                    print(f"✅ Sprite carregado: {sprite_path}")
-                except pygame.error as e:
-                    print(f"❌ Erro ao carregar {sprite_path}: {e}")
-            else:
-                print(f"⚠️ Arquivo não encontrado: {sprite_path}")
+        self.idle_animation_timer = self.clock.render_time()
+        self.idle_sprites = self._animation_frames('idle_sprites')
         
         if not self.idle_sprites:
-            print("🎨 Nenhum sprite encontrado, usando desenho vetorial")
+            logger.debug("🎨 Nenhum sprite encontrado, usando desenho vetorial")
             self.use_sprites = False
         else:
-            print(f"🎬 {len(self.idle_sprites)} sprites carregados para animação idle")
+            self.use_sprites = True
+            logger.info("🎬 %s sprites carregados para animação idle", len(self.idle_sprites))
     
     def update_idle_animation(self):
         """Atualiza a animação idle do personagem"""
         if not self.idle_sprites:
             return
             
-        import time
-        current_time = time.time()
+        current_time = self.clock.render_time()
         
         if current_time - self.idle_animation_timer >= self.idle_frame_duration:
             self.current_idle_frame = (self.current_idle_frame + 1) % len(self.idle_sprites)
@@ -1592,7 +1686,7 @@ class Visualizer:
             
         for button_name, button_rect in self.menu_buttons.items():
             if button_rect.collidepoint(pos):
-                print(f"💆 Clique no botão: {button_name}")
+                logger.debug("💆 Clique no botão: %s", button_name)
                 return button_name
                 
         return None
@@ -1604,216 +1698,183 @@ class Visualizer:
             
         for button_name, button_rect in self.completion_buttons.items():
             if button_rect.collidepoint(pos):
-                print(f"🎯 Clique no botão de conclusão: {button_name}")
+                logger.debug("🎯 Clique no botão de conclusão: %s", button_name)
                 return button_name
                 
         return None
     
+    def request_assets(self):
+        """Enfileira todas as imagens e sons do jogo no AssetManager (não bloqueia)"""
+        screen_size = (self.width, self.height)
+        
+        self.assets.load_image(self.BACKGROUND_PATH, screen_size, alpha=False)
+        for path in self.LEVEL_COMPLETE_BACKGROUNDS.values():
+            self.assets.load_image(path, screen_size, alpha=False)
+        self.assets.load_image(self.DEATH_BACKGROUND_PATH, screen_size, alpha=False)
+        
+        for path in self.STAR_IMAGE_PATHS.values():
+            self.assets.load_image(path)
+        for path in self.BUTTON_PATHS.values():
+            self.assets.load_image(path)
+        
+        # Sprites: um atlas por personagem (se já foi gerado) ou os PNGs individuais
+        self.atlas_indexes = {name: SpriteSheet.read_index(name) for name in ATLASES}
+        for name, index in self.atlas_indexes.items():
+            if index is not None:
+                self.assets.load_image(atlas_paths(name)[0])
+        for atlas_name, animation in self.SPRITE_ANIMATIONS.values():
+            if self.atlas_indexes[atlas_name] is None:
+                paths, size = self._animation_sources(atlas_name, animation)
+                for path in paths:
+                    self.assets.load_image(path, size)
+        
+        if pygame.mixer.get_init():
+            self.assets.load_sound(self.WHOOSH_SOUND_PATH)
+            self.assets.load_sound(self.VICTORY_SOUND_PATH)
+    
+    def finish_loading(self):
+        """Espera o fim do carregamento e distribui os assets (thread principal)"""
+        self.assets.wait()
+        
+        self.sprite_sheets = {}
+        for name, index in self.atlas_indexes.items():
+            atlas_image = self.assets.get_image(atlas_paths(name)[0]) if index is not None else None
+            if atlas_image:
+                self.sprite_sheets[name] = SpriteSheet(atlas_image, index)
+        
+        self.load_background()
+        self.load_level_complete_background()
+        self.load_death_background()
+        self.load_star_images()
+        self.load_enemy_images()
+        self.load_ninja_sounds()
+        self.load_button_images()
+        self.load_idle_sprites()
+        self.load_run_sprites()
+        self.load_run_left_sprites()
+        
+        # Variantes calculadas a partir das imagens antigas não valem mais
+        self.derived_images.clear()
+        
+        # As superfícies decodificadas já foram convertidas; não precisam ficar na memória
+        self.assets.release_decoded()
+    
+    def draw_loading_screen(self, progress):
+        """Tela de carregamento com barra de progresso"""
+        self.screen.fill(self.NINJA_DARK)
+        
+        title = self.font_large.render("PathFinder Adventure", True, self.NINJA_GOLD)
+        self.screen.blit(title, title.get_rect(center=(self.width // 2, self.height // 2 - 60)))
+        
+        bar_width, bar_height = 400, 24
+        bar_x = (self.width - bar_width) // 2
+        bar_y = self.height // 2
+        self._draw_rounded_rect(self.screen, self.PANEL_COLOR, bar_x, bar_y, bar_width, bar_height, 10)
+        if progress > 0:
+            self._draw_rounded_rect(self.screen, self.NINJA_ACCENT, bar_x, bar_y,
+                                    max(20, int(bar_width * progress)), bar_height, 10)
+        self._draw_rounded_rect_border(self.screen, self.PANEL_BORDER, bar_x, bar_y, bar_width, bar_height, 10, 2)
+        
+        label = self.font_small.render(f"Carregando... {int(progress * 100)}%", True, self.TEXT_COLOR)
+        self.screen.blit(label, label.get_rect(center=(self.width // 2, bar_y + 50)))
+    
+    @staticmethod
+    def _animation_sources(atlas_name, animation):
+        """PNGs individuais e tamanho dos frames de uma animação (sem atlas)"""
+        spec = ATLASES[atlas_name]
+        return frame_files(spec["animations"][animation]), spec["frame_size"]
+    
+    def _animation_frames(self, attribute):
+        """Frames de uma animação: subsuperfícies do atlas ou, sem atlas, os PNGs individuais"""
+        atlas_name, animation = self.SPRITE_ANIMATIONS[attribute]
+        sheet = self.sprite_sheets.get(atlas_name)
+        if sheet is not None:
+            return sheet.frames(animation)
+        
+        paths, size = self._animation_sources(atlas_name, animation)
+        frames = [self.assets.get_image(path, size) for path in paths]
+        return [frame for frame in frames if frame]
+    
     def load_background(self):
         """Carrega a imagem de fundo ninja"""
-        try:
-            import os
-            background_path = "level1_1.png"
-            print(f"🔍 Tentando carregar background: {background_path}")
-            print(f"📁 Diretório atual: {os.getcwd()}")
-            print(f"📋 Arquivos no diretório: {[f for f in os.listdir('.') if f.endswith('.png')]}")
-            
-            if os.path.exists(background_path):
-                self.background_image = pygame.image.load(background_path).convert()
-                # Redimensionar para cobrir toda a tela
-                self.background_image = pygame.transform.scale(self.background_image, (self.width, self.height))
-                print(f"✅ Background ninja carregado com sucesso: {background_path}")
-                print(f"📏 Dimensões: {self.background_image.get_size()}")
-            else:
-                print(f"❌ Background não encontrado: {background_path}")
-                self.background_image = None
-        except Exception as e:
-            print(f"❌ Erro ao carregar background: {e}")
-            self.background_image = None
+        self.background_image = self.assets.get_image(self.BACKGROUND_PATH, (self.width, self.height), alpha=False)
+        if self.background_image:
+            logger.info("✅ Background ninja carregado com sucesso: %s", self.BACKGROUND_PATH)
+        else:
+            logger.error("❌ Background não encontrado: %s", self.BACKGROUND_PATH)
     
     def load_level_complete_background(self):
         """Carrega os backgrounds de nível completo baseados nas estrelas"""
-        try:
-            import os
-            
-            # Background padrão (3 estrelas)
-            bg_path = "images/background/nivelcompleto.png"
-            if os.path.exists(bg_path):
-                original = pygame.image.load(bg_path).convert()
-                self.level_complete_bg = pygame.transform.scale(original, (self.width, self.height))
-                print(f"✅ Background de nível completo carregado: {bg_path}")
-            else:
-                print(f"⚠️ Background de nível completo não encontrado: {bg_path}")
-                self.level_complete_bg = None
-            
-            # Background para 2 estrelas (quase lá)
-            quase_la_path = "images/background/quase-la.png"
-            if os.path.exists(quase_la_path):
-                original = pygame.image.load(quase_la_path).convert()
-                self.quase_la_bg = pygame.transform.scale(original, (self.width, self.height))
-                print(f"✅ Background 'quase lá' carregado: {quase_la_path}")
+        # level_complete_bg = 3 estrelas, quase_la_bg = 2 estrelas, tente_nova_bg = 1 estrela
+        for attribute, bg_path in self.LEVEL_COMPLETE_BACKGROUNDS.items():
+            background = self.assets.get_image(bg_path, (self.width, self.height), alpha=False)
+            setattr(self, attribute, background)
+            if background:
+                logger.info("✅ Background de nível completo carregado: %s", bg_path)
             else:
-                print(f"⚠️ Background 'quase lá' não encontrado: {quase_la_path}")
-                self.quase_la_bg = None
-            
-            # Background para 1 estrela (tente nova)
-            tente_nova_path = "images/background/tente-nova.png"
-            if os.path.exists(tente_nova_path):
-                original = pygame.image.load(tente_nova_path).convert()
-                self.tente_nova_bg = pygame.transform.scale(original, (self.width, self.height))
-                print(f"✅ Background 'tente nova' carregado: {tente_nova_path}")
-            else:
-                print(f"⚠️ Background 'tente nova' não encontrado: {tente_nova_path}")
-                self.tente_nova_bg = None
-                
-        except Exception as e:
-            print(f"❌ Erro ao carregar backgrounds de nível completo: {e}")
-            self.level_complete_bg = None
-            self.quase_la_bg = None
-            self.tente_nova_bg = None
+                logger.warning("⚠️ Background de nível completo não encontrado: %s", bg_path)
     
     def load_death_background(self):
         """Carrega o background de morte do jogador"""
-        try:
-            import os
-            death_path = "images/background/youdied.png"
-            if os.path.exists(death_path):
-                original = pygame.image.load(death_path).convert()
-                self.death_bg = pygame.transform.scale(original, (self.width, self.height))
-                print(f"☠️ Background de morte carregado: {death_path}")
-            else:
-                print(f"⚠️ Background de morte não encontrado: {death_path}")
-                self.death_bg = None
-        except Exception as e:
-            print(f"❌ Erro ao carregar background de morte: {e}")
-            self.death_bg = None
+        self.death_bg = self.assets.get_image(self.DEATH_BACKGROUND_PATH, (self.width, self.height), alpha=False)
+        if self.death_bg:
+            logger.info("☠️ Background de morte carregado: %s", self.DEATH_BACKGROUND_PATH)
+        else:
+            logger.warning("⚠️ Background de morte não encontrado: %s", self.DEATH_BACKGROUND_PATH)
     
     def load_star_images(self):
         """Carrega as imagens de estrelas"""
-        try:
-            import os
-            self.star_images = {}
-            star_files = {
-                1: "images/elements/onestar.png",
-                2: "images/elements/twostars.png", 
-                3: "images/elements/threestarts.png"
-            }
-            
-            for stars, path in star_files.items():
-                if os.path.exists(path):
-                    self.star_images[stars] = pygame.image.load(path).convert_alpha()
-                    print(f"✅ Imagem de {stars} estrela(s) carregada: {path}")
-                else:
-                    print(f"⚠️ Imagem de estrelas não encontrada: {path}")
-        except Exception as e:
-            print(f"❌ Erro ao carregar imagens de estrelas: {e}")
-            self.star_images = {}
+        self.star_images = {}
+        for stars, path in self.STAR_IMAGE_PATHS.items():
+            image = self.assets.get_image(path)
+            if image:
+                self.star_images[stars] = image
+            else:
+                logger.warning("⚠️ Imagem de estrelas não encontrada: %s", path)
     
     def load_enemy_images(self):
         """Carrega sprites dos inimigos e animações de combate"""
-        try:
-            import os
-            
-            # Carrega sprites idle do inimigo
-            self.enemy_idle_sprites = []
-            idle_dir = os.path.join("images", "enemy", "idle")
-            if os.path.exists(idle_dir):
-                idle_files = [f for f in os.listdir(idle_dir) if f.endswith('.png')]
-                idle_files.sort()  # Ordena para sequência correta
-                for file in idle_files:
-                    sprite_path = os.path.join(idle_dir, file)
-                    sprite = pygame.image.load(sprite_path).convert_alpha()
-                    sprite = pygame.transform.scale(sprite, (80, 80))
-                    self.enemy_idle_sprites.append(sprite)
-                print(f"😴 {len(self.enemy_idle_sprites)} sprites idle do inimigo carregados")
-            
-            # Carrega sprites de ataque do inimigo
-            self.enemy_attack_sprites = []
-            attack_dir = os.path.join("images", "enemy", "attack")
-            if os.path.exists(attack_dir):
-                attack_files = [f for f in os.listdir(attack_dir) if f.endswith('.png')]
-                attack_files.sort()  # Ordena para sequência correta
-                for file in attack_files:
-                    sprite_path = os.path.join(attack_dir, file)
-                    sprite = pygame.image.load(sprite_path).convert_alpha()
-                    sprite = pygame.transform.scale(sprite, (80, 80))
-                    self.enemy_attack_sprites.append(sprite)
-                print(f"⚔️ {len(self.enemy_attack_sprites)} sprites de ataque do inimigo carregados")
-            
-            # Carrega sprites de morte do inimigo
-            self.enemy_dead_sprites = []
-            dead_dir = os.path.join("images", "enemy", "dead")
-            if os.path.exists(dead_dir):
-                dead_files = [f for f in os.listdir(dead_dir) if f.endswith('.png')]
-                dead_files.sort()  # Ordena para sequência correta
-                for file in dead_files:
-                    sprite_path = os.path.join(dead_dir, file)
-                    sprite = pygame.image.load(sprite_path).convert_alpha()
-                    sprite = pygame.transform.scale(sprite, (80, 80))
-                    self.enemy_dead_sprites.append(sprite)
-                print(f"💀 {len(self.enemy_dead_sprites)} sprites de morte do inimigo carregados")
-            
-            # Carrega sprites de ataque do jogador
-            self.player_attack_sprites = []
-            attack_dir = os.path.join("images", "person_attack")
-            if os.path.exists(attack_dir):
-                attack_files = [f for f in os.listdir(attack_dir) if f.endswith('.png')]
-                attack_files.sort()  # Ordena para sequência correta
-                for file in attack_files:
-                    sprite_path = os.path.join(attack_dir, file)
-                    sprite = pygame.image.load(sprite_path).convert_alpha()
-                    sprite = pygame.transform.scale(sprite, (120, 120))  # Mesmo tamanho do jogador
-                    self.player_attack_sprites.append(sprite)
-                print(f"🗡️ {len(self.player_attack_sprites)} sprites de ataque do jogador carregados")
-                    
-        except Exception as e:
-            print(f"❌ Erro ao carregar sprites de combate: {e}")
-            self.enemy_idle_sprites = []
-            self.enemy_attack_sprites = []
-            self.enemy_dead_sprites = []
-            self.player_attack_sprites = []
+        for attribute in ('enemy_idle_sprites', 'enemy_attack_sprites', 'enemy_dead_sprites', 'player_attack_sprites'):
+            setattr(self, attribute, self._animation_frames(attribute))
+        
+        logger.info("⚔️ Sprites de combate: %s idle, %s ataque, %s morte do inimigo, %s ataque do jogador",
+                    len(self.enemy_idle_sprites), len(self.enemy_attack_sprites),
+                    len(self.enemy_dead_sprites), len(self.player_attack_sprites))
     
-    def load_ninja_sounds(self):
-        """Carrega os sons ninja"""
+    def init_ninja_audio(self):
+        """Inicializa o mixer e a música de fundo (streaming, não precisa de pré-carregamento)"""
         try:
             # Inicializar mixer do pygame
             pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
             
             import os
-            sound_path = "sounds/810736__mokasza__fast-whoosh.mp3"
-            print(f"🔊 Tentando carregar som ninja: {sound_path}")
-            
-            if os.path.exists(sound_path):
-                self.whoosh_sound = pygame.mixer.Sound(sound_path)
-                self.whoosh_sound.set_volume(0.3)  # Volume moderado
-                print(f"🥷 Som ninja carregado com sucesso!")
-            else:
-                print(f"⚠️ Som ninja não encontrado: {sound_path}")
-                self.whoosh_sound = None
-            
-            # Carregar som de vitória
-            victory_path = "sounds/victory.wav"
-            if os.path.exists(victory_path):
-                self.victory_sound = pygame.mixer.Sound(victory_path)
-                self.victory_sound.set_volume(0.5)  # Volume um pouco mais alto para vitória
-                print(f"🏆 Som de vitória carregado com sucesso!")
-            else:
-                print(f"⚠️ Som de vitória não encontrado: {victory_path}")
-                self.victory_sound = None
-            
             # Carregar e iniciar música de fundo
             background_music_path = "sounds/background-music.mp3"
             if os.path.exists(background_music_path):
                 pygame.mixer.music.load(background_music_path)
                 pygame.mixer.music.set_volume(0.3)  # Volume baixo para não incomodar
                 pygame.mixer.music.play(-1)  # -1 para loop infinito
-                print(f"🎵 Música de fundo iniciada em loop!")
+                logger.info("🎵 Música de fundo iniciada em loop!")
             else:
-                print(f"⚠️ Música de fundo não encontrada: {background_music_path}")
-                
+                logger.warning("⚠️ Música de fundo não encontrada: %s", background_music_path)
         except Exception as e:
-            print(f"❌ Erro ao carregar sons ninja: {e}")
-            self.whoosh_sound = None
+            logger.error("❌ Erro ao inicializar áudio: %s", e)
+    
+    def load_ninja_sounds(self):
+        """Carrega os sons ninja"""
+        self.whoosh_sound = self.assets.get_sound(self.WHOOSH_SOUND_PATH)
+        if self.whoosh_sound:
+            self.whoosh_sound.set_volume(0.3)  # Volume moderado
+            logger.info("🥷 Som ninja carregado com sucesso!")
+        else:
+            logger.warning("⚠️ Som ninja não encontrado: %s", self.WHOOSH_SOUND_PATH)
+        
+        self.victory_sound = self.assets.get_sound(self.VICTORY_SOUND_PATH)
+        if self.victory_sound:
+            self.victory_sound.set_volume(0.5)  # Volume um pouco mais alto para vitória
+            logger.info("🏆 Som de vitória carregado com sucesso!")
+        else:
+            logger.warning("⚠️ Som de vitória não encontrado: %s", self.VICTORY_SOUND_PATH)
     
     def play_ninja_whoosh(self):
         """Reproduz o som de movimento ninja"""
@@ -1836,7 +1897,7 @@ class Visualizer:
                     self.whoosh_sound.stop()
                 # Reproduz o som de vitória
                 self.victory_sound.play()
-                print("🎵 Som de vitória tocando!")
+                logger.debug("🎵 Som de vitória tocando!")
         except Exception as e:
             # Falha silenciosa para não interromper o jogo
             pass
@@ -1848,7 +1909,7 @@ class Visualizer:
                 # Cria uma cópia temporária do som com volume reduzido para efeito de dano
                 self.whoosh_sound.set_volume(0.3)  # Volume mais baixo para efeito de dano
                 self.whoosh_sound.play()
-                print("💥 Som de dano tocando!")
+                logger.debug("💥 Som de dano tocando!")
         except Exception as e:
             # Falha silenciosa para não interromper o jogo
             pass
@@ -1857,7 +1918,7 @@ class Visualizer:
         """Pausa a música de fundo"""
         try:
             pygame.mixer.music.pause()
-            print("⏸️ Música de fundo pausada")
+            logger.debug("⏸️ Música de fundo pausada")
         except Exception as e:
             pass
     
@@ -1865,7 +1926,7 @@ class Visualizer:
         """Resume a música de fundo"""
         try:
             pygame.mixer.music.unpause()
-            print("▶️ Música de fundo retomada")
+            logger.debug("▶️ Música de fundo retomada")
         except Exception as e:
             pass
     
@@ -1873,54 +1934,31 @@ class Visualizer:
         """Para a música de fundo"""
         try:
             pygame.mixer.music.stop()
-            print("⏹️ Música de fundo parada")
+            logger.debug("⏹️ Música de fundo parada")
         except Exception as e:
             pass
     
     def load_button_images(self):
         """Carrega as imagens dos botões do menu"""
-        try:
-            import os
-            self.button_images = {}
+        self.button_images = {}
+        
+        for button_name, button_path in self.BUTTON_PATHS.items():
+            original = self.assets.get_image(button_path)
+            if not original:
+                logger.warning("⚠️ Botão não encontrado: %s", button_path)
+                continue
             
-            # Definir botões disponíveis (menu e conclusão)
-            buttons = {
-                'newgame': 'bttns/novojogo (1).png',
-                'continue': 'bttns/continuar (1).png',
-                'continue_disabled': 'bttns/continuardisabled (1).png',
-                'exit': 'bttns/sair (2).png',
-                'next_level': 'bttns/nextlevel.png',
-                'repeat_level': 'bttns/repeatlevel.png',
-                'main_menu': 'bttns/gotomenu.png'
-            }
+            # Criar versão hover (dessaturação sutil)
+            hover = original.copy()
+            desaturate_overlay = pygame.Surface(hover.get_size(), pygame.SRCALPHA)
+            desaturate_overlay.fill((128, 128, 128, 15))  # Cinza muito sutil para dessaturar
+            hover.blit(desaturate_overlay, (0, 0), special_flags=pygame.BLEND_MULT)
             
-            for button_name, button_path in buttons.items():
-                if os.path.exists(button_path):
-                    # Carregar imagem original
-                    original = pygame.image.load(button_path).convert_alpha()
-                    
-                    # Usar tamanho original das novas imagens menores
-                    original = original  # Manter tamanho original
-                    
-                    # Criar versão hover (dessaturação sutil)
-                    hover = original.copy()
-                    # Aplicar efeito de dessaturação muito sutil
-                    desaturate_overlay = pygame.Surface(hover.get_size(), pygame.SRCALPHA)
-                    desaturate_overlay.fill((128, 128, 128, 15))  # Cinza muito sutil para dessaturar
-                    hover.blit(desaturate_overlay, (0, 0), special_flags=pygame.BLEND_MULT)
-                    
-                    self.button_images[button_name] = {
-                        'normal': original,
-                        'hover': hover,
-                        'rect': original.get_rect()
-                    }
-                    print(f"✅ Botão carregado: {button_name} - {button_path}")
-                else:
-                    print(f"⚠️ Botão não encontrado: {button_path}")
-                    
-        except Exception as e:
-            print(f"❌ Erro ao carregar botões: {e}")
-            self.button_images = {}
+            self.button_images[button_name] = {
+                'normal': original,
+                'hover': hover,
+                'rect': original.get_rect()
+            }
     
     def start_fade_transition(self, callback=None, fade_out_first=True):
         """Inicia uma transição fade clássica"""
@@ -1937,7 +1975,7 @@ class Visualizer:
             self.transition_alpha = 255
             self.fading_out = False
             
-        print(f"🎬 Iniciando transição fade {'out' if fade_out_first else 'in'}")
+        logger.debug("🎬 Iniciando transição fade %s", 'out' if fade_out_first else 'in')
     
     def update_transition(self):
         """Atualiza a transição fade"""
@@ -2041,16 +2079,27 @@ class Visualizer:
             # Fallback para desenho manual se imagens não estiverem disponíveis
             self._draw_stars_display(stars_earned, 0, compact=True)
     
-    def _draw_enemies(self, world, node_positions, game_instance=None):
-        """Desenha inimigos nos nós que os possuem usando sprites da pasta enemy/idle"""
+    def _draw_enemies(self, world, node_positions, game_instance=None, view=None, detail=LOD_FULL):
+        """Desenha inimigos nos nós que os possuem usando sprites da pasta enemy/idle
+
+        Só os que estão em 'view'; com os nós como pontos (LOD_DOTS), fora de combate
+        o inimigo é um ponto vermelho
+        """
         if not hasattr(world, 'enemies') or not world.enemies:
             return
             
-        import time
+        render_time = self.clock.render_time()
+        left, top, right, bottom = view or self._view_rect()
+        combat_node = getattr(game_instance, 'combat_node', None)
         
         for node_id in world.enemies:
             if node_id in node_positions:
                 node_pos = node_positions[node_id]
+                if not (left <= node_pos[0] <= right and top <= node_pos[1] <= bottom):
+                    continue
+                if detail == LOD_DOTS and node_id != combat_node:
+                    pygame.draw.circle(self.screen, self.HEALTH_RED, node_pos, 6)
+                    continue
                 
                 # Posição para desenhar o inimigo (centralizado no nó)
                 enemy_x = node_pos[0] - 40  # Centralizar (80px / 2)
@@ -2066,7 +2115,7 @@ class Visualizer:
                     if game_instance.combat_state == "simultaneous_attack":
                         # Combate simultâneo - inimigo à direita atacando
                         if hasattr(self, 'enemy_attack_sprites') and self.enemy_attack_sprites:
-                            frame_index = int((time.time() - game_instance.combat_start_time) * 15) % len(self.enemy_attack_sprites)
+                            frame_index = int((render_time - game_instance.combat_start_time) * 15) % len(self.enemy_attack_sprites)
                             sprite_to_draw = self.enemy_attack_sprites[frame_index]
                             # Posicionar inimigo à direita durante combate
                             enemy_x = node_pos[0] + 15  # Mover para a direita
@@ -2075,14 +2124,14 @@ class Visualizer:
                     elif game_instance.combat_state == "enemy_dead":
                         # Inimigo morrendo - usar sprites de morte (velocidade aumentada)
                         if hasattr(self, 'enemy_dead_sprites') and self.enemy_dead_sprites:
-                            frame_index = min(int((time.time() - game_instance.combat_start_time) * 15), len(self.enemy_dead_sprites) - 1)
+                            frame_index = min(int((render_time - game_instance.combat_start_time) * 15), len(self.enemy_dead_sprites) - 1)
                             sprite_to_draw = self.enemy_dead_sprites[frame_index]
                 
                 # Estado padrão: usar animação idle da pasta enemy/idle
                 if sprite_to_draw is None:
                     if hasattr(self, 'enemy_idle_sprites') and self.enemy_idle_sprites:
                         # Animação idle contínua (8 FPS para movimento mais fluido)
-                        frame_index = int(time.time() * 8) % len(self.enemy_idle_sprites)
+                        frame_index = int(render_time * 8) % len(self.enemy_idle_sprites)
                         sprite_to_draw = self.enemy_idle_sprites[frame_index]
                 
                 # Desenhar o sprite do inimigo sem efeitos piscantes
@@ -2097,8 +2146,8 @@ class Visualizer:
                         pygame.draw.circle(glow_surf, (255, 50, 50, 15), (45, 45), 45)
                         self.screen.blit(glow_surf, (enemy_x - 5, enemy_y - 5))
                 else:
-                    # Debug: se não há sprites carregados
-                    print(f"⚠️ Nenhum sprite de inimigo disponível para o nó {node_id}")
+                    # Debug: se não há sprites carregados (roda a cada frame: só em nível DEBUG)
+                    logger.debug("⚠️ Nenhum sprite de inimigo disponível para o nó %s", node_id)
     
     def draw_game_final(self, final_stats):
         """Desenha a tela final com vídeo, estatísticas médias e botão de menu"""
@@ -2150,43 +2199,29 @@ class Visualizer:
     def draw_final_video_background(self):
         """Desenha o vídeo final.mp4 como fundo"""
         try:
-            import cv2
-            import os
+            from video_player import open_video
             
-            if not hasattr(self, 'final_video_cap') or self.final_video_cap is None:
-                # Inicializar vídeo final
+            if not hasattr(self, 'final_video_player') or self.final_video_player is None:
+                # Inicializar vídeo final (decodificação começa em segundo plano)
                 video_path = "videos/final.mp4"
-                if os.path.exists(video_path):
-                    self.final_video_cap = cv2.VideoCapture(video_path)
-                    self.final_video_frame_count = int(self.final_video_cap.get(cv2.CAP_PROP_FRAME_COUNT))
-                    print(f"🎬 Vídeo final carregado: {video_path}")
+                self.final_video_player = open_video(video_path, (self.width, self.height), use_cache=self.video_cache)
+                if self.final_video_player:
+                    logger.info("🎬 Vídeo final carregado: %s", video_path)
                 else:
-                    print(f"⚠️ Vídeo final não encontrado: {video_path}")
-                    self.final_video_cap = None
-                    self.draw_ninja_background()
-                    return
+                    logger.warning("⚠️ Vídeo final não encontrado: %s", video_path)
+                    self.final_video_player = False  # Não tenta abrir de novo a cada frame
             
-            if self.final_video_cap:
-                ret, frame = self.final_video_cap.read()
-                if not ret:
-                    # Reiniciar vídeo quando chegar ao final
-                    self.final_video_cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-                    ret, frame = self.final_video_cap.read()
-                
-                if ret:
-                    # Converter BGR (OpenCV) para RGB (Pygame)
-                    frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    # Redimensionar para o tamanho da tela
-                    frame = cv2.resize(frame, (self.width, self.height))
-                    # Converter para superficie pygame
-                    video_surface = pygame.surfarray.make_surface(frame.swapaxes(0, 1))
-                    self.screen.blit(video_surface, (0, 0))
-                else:
-                    self.draw_ninja_background()
+            video_surface = None
+            if self.final_video_player:
+                video_surface = self.final_video_player.get_frame(self.clock.render_time())
+            
+            if video_surface is not None:
+                self.screen.blit(video_surface, (0, 0))
             else:
+                # Primeiro frame ainda decodificando (ou vídeo ausente)
                 self.draw_ninja_background()
         except Exception as e:
-            print(f"❌ Erro ao reproduzir vídeo final: {e}")
+            logger.error("❌ Erro ao reproduzir vídeo final: %s", e)
             self.draw_ninja_background()
     
     def draw_final_star_counter(self, final_stats):
@@ -2249,7 +2284,7 @@ class Visualizer:
             
             if is_hover:
                 self.hovered_button = 'main_menu_final'
-                pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
+                self.set_cursor(pygame.SYSTEM_CURSOR_HAND)
             
             # Escolher imagem baseada no estado
             if is_hover and 'hover' in button_data:
@@ -2283,7 +2318,7 @@ class Visualizer:
         if hasattr(self, 'final_button_rect'):
             for button_id, button_rect in self.final_button_rect.items():
                 if button_rect.collidepoint(pos):
-                    print(f"🖱️ Botão clicado na tela final: {button_id}")
+                    logger.debug("🖱️ Botão clicado na tela final: %s", button_id)
                     return button_id
         
         # Fallback: área do botão de texto
@@ -2308,3 +2343,71 @@ class Visualizer:
             y = cy + r * math.sin(angle - math.pi/2)
             points.append((x, y))
         return points
+
+
+class HeadlessVisualizer(Visualizer):
+    """Visualizer sem janela, áudio ou sprites - mantém só o layout usado pela lógica do jogo"""
+    
+    def __init__(self, width=1200, height=800, clock=None):
+        # Não chama Visualizer.__init__: nada de display, mixer ou carregamento de imagens
+        self.width = width
+        self.height = height
+        self.clock = clock or GameClock()
+        self.screen = None
+        
+        # Estado consultado pelo Game
+        self.is_transitioning = False
+        self.transition_alpha = 0
+        self.transition_callback = None
+        self.hovered_button = None
+        self.current_movement_direction = None
+        self.idle_sprites = []
+        self.run_sprites = []
+        self.run_left_sprites = []
+        self.use_sprites = False
+        self.final_video_player = None
+        self._layout = None
+        self.camera = Camera(width, height)
+        self._screen_positions = None
+    
+    def start_fade_transition(self, callback=None, fade_out_first=True):
+        """Sem tela não há fade: executa a troca de estado imediatamente"""
+        if callback:
+            callback()
+    
+    def update_transition(self):
+        """Não há transição em andamento no modo headless"""
+        return False
+    
+    def apply_transition_effect(self):
+        pass
+    
+    def draw_graph(self, *args, **kwargs):
+        pass
+    
+    def draw_menu(self, *args, **kwargs):
+        pass
+    
+    def draw_level_complete(self, *args, **kwargs):
+        pass
+    
+    def draw_player_death(self, *args, **kwargs):
+        pass
+    
+    def draw_game_over(self, *args, **kwargs):
+        pass
+    
+    def draw_game_final(self, *args, **kwargs):
+        pass
+    
+    def draw_ninja_background(self):
+        pass
+    
+    def play_ninja_whoosh(self):
+        pass
+    
+    def play_victory_sound(self):
+        pass
+    
+    def stop_background_music(self):
+        pass
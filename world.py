@@ -2,18 +2,58 @@
 Módulo que gerencia o mundo e os níveis do jogo
 """
 from graph_generator import get_level_config
-from pathfinding import dijkstra, calculate_path_efficiency
+from pathfinding import dijkstra, calculate_path_efficiency, distances_to, edge_weights, path_cost
 import time
+import random
 import networkx as nx
+from game_logging import get_logger
+
+logger = get_logger("world")
+
+def score_level(path_length, optimal_length, elapsed_time, time_limit, player_cost=None, optimal_cost=None):
+    """Pontuação de um nível concluído (função pura: usada pelo jogo e pelo verificador)
+
+    Com player_cost e optimal_cost a eficiência compara os pesos das arestas; sem eles,
+    o número de arestas
+    """
+    # Calcula a eficiência
+    if player_cost is None:
+        player_cost, optimal_cost = path_length, optimal_length
+    efficiency = calculate_path_efficiency(player_cost, optimal_cost)
+    
+    # Calcula a pontuação base (0-100)
+    base_score = int(efficiency * 100)
+    
+    # Bônus por tempo
+    time_bonus = max(0, int((time_limit - elapsed_time) / time_limit * 50))
+    
+    return {
+        "time_taken": elapsed_time,
+        "time_limit": time_limit,
+        "player_distance": path_length,
+        "optimal_distance": optimal_length,
+        "player_cost": player_cost,
+        "optimal_cost": optimal_cost,
+        "efficiency": efficiency,
+        "base_score": base_score,
+        "time_bonus": time_bonus,
+        "total_score": base_score + time_bonus,
+        "xp_gained": int(efficiency * 50 + (time_bonus / 50) * 25),
+    }
 
 class World:
-    def __init__(self, level_id=1):
+    def __init__(self, level_id=1, clock=None, seed=None):
         self.level_id = level_id
+        self.clock = clock  # Relógio da simulação (GameClock); None usa o tempo real
+        self.seed = seed  # Semente do nível (mesma semente = mesmos inimigos, para replays)
+        self.rng = random.Random(seed)
         self.config = get_level_config(level_id)
         
         # Gera o grafo do nível
         generator = self.config["generator"]
         self.graph, self.start_node, self.end_node = generator()
+        self.edge_weights = edge_weights(self.graph)  # {nó: {vizinho: peso}}
+        self.distance_to_exit = distances_to(self.edge_weights, self.end_node)  # Custo mínimo de cada nó até a saída
         
         # Encontra o caminho ótimo
         self.optimal_path, self.optimal_distance = dijkstra(
@@ -31,44 +71,37 @@ class World:
         self.end_time = None
         self.completed = False
         
+    def _now(self):
+        """Tempo atual: o da simulação se houver relógio, senão o tempo real"""
+        if self.clock is not None:
+            return self.clock.now()
+        return time.time()
+        
     def start_level(self):
         """Inicia o nível"""
-        self.start_time = time.time()
+        self.start_time = self._now()
         
-    def complete_level(self, player_path):
-        """Marca o nível como completo e calcula a pontuação"""
-        self.end_time = time.time()
+    def complete_level(self, player_path, player_cost=None):
+        """Marca o nível como completo e calcula a pontuação
+
+        player_cost: custo já acumulado (LiveScore.cost); sem ele, é somado a partir do caminho
+        """
+        self.end_time = self._now()
         self.completed = True
         
         elapsed_time = self.end_time - self.start_time
         path_length = len(player_path) - 1  # Número de arestas
-        
-        # Calcula a eficiência
         optimal_length = len(self.optimal_path) - 1
-        efficiency = calculate_path_efficiency(path_length, optimal_length)
-        
-        # Calcula a pontuação base (0-100)
-        base_score = int(efficiency * 100)
+        if player_cost is None:
+            player_cost = path_cost(self.graph, player_path)
         
-        # Bônus por tempo
-        time_limit = self.config["time_limit"]
-        time_bonus = max(0, int((time_limit - elapsed_time) / time_limit * 50))
-        
-        total_score = base_score + time_bonus
-        
-        return {
+        results = {
             "level_id": self.level_id,
             "level_name": self.config["name"],
-            "time_taken": elapsed_time,
-            "time_limit": time_limit,
-            "player_distance": path_length,
-            "optimal_distance": len(self.optimal_path) - 1,
-            "efficiency": efficiency,
-            "base_score": base_score,
-            "time_bonus": time_bonus,
-            "total_score": total_score,
-            "xp_gained": int(efficiency * 50 + (time_bonus / 50) * 25),
         }
+        results.update(score_level(path_length, optimal_length, elapsed_time, self.config["time_limit"],
+                                   player_cost, self.optimal_distance))
+        return results
     
     def get_graph_info(self):
         """Retorna informações sobre o grafo"""
@@ -82,7 +115,6 @@ class World:
     def _generate_enemies(self):
         """Gera inimigos em posições estratégicas que realmente atrapalham o jogador"""
         import networkx as nx
-        import random
         
         # Calcular caminho ótimo do início ao fim
         try:
@@ -91,7 +123,7 @@ class World:
             # Se não há caminho, usar qualquer nó disponível
             optimal_path = [self.start_node, self.end_node]
         
-        print(f"🎯 Caminho ótimo detectado: {optimal_path}")
+        logger.info("🎯 Caminho ótimo detectado: %s", optimal_path)
         
         # Encontrar nós estratégicos
         strategic_nodes = self._find_strategic_nodes(optimal_path)
@@ -120,11 +152,11 @@ class World:
             
             if available_extra:
                 extra_needed = num_enemies - len(self.enemies)
-                extra_enemies = random.sample(available_extra, min(extra_needed, len(available_extra)))
+                extra_enemies = self.rng.sample(available_extra, min(extra_needed, len(available_extra)))
                 self.enemies.update(extra_enemies)
-                print(f"➕ Adicionados {len(extra_enemies)} inimigos extras: {extra_enemies}")
+                logger.debug("➕ Adicionados %s inimigos extras: %s", len(extra_enemies), extra_enemies)
         
-        print(f"🧌 Inimigos posicionados estrategicamente no nível {self.level_id}: {list(self.enemies)}")
+        logger.info("🧌 Inimigos posicionados estrategicamente no nível %s: %s", self.level_id, list(self.enemies))
     
     def _find_strategic_nodes(self, optimal_path):
         """Encontra nós estratégicos que forçam o jogador a enfrentá-los"""
@@ -169,7 +201,7 @@ class World:
             if node not in priority_list:
                 priority_list.append(node)
         
-        print(f"🎨 Nós estratégicos encontrados: {priority_list[:5]}")
+        logger.debug("🎨 Nós estratégicos encontrados: %s", priority_list[:5])
         return priority_list
     
     def _find_alternative_path_nodes(self):
@@ -220,7 +252,7 @@ class World:
         if node_id in self.enemies:
             self.enemies.remove(node_id)
             # Recalcular caminho ótimo após remover inimigo
-            print(f"🗡️ Inimigo removido do nó {node_id}. Recalculando caminho ótimo...")
+            logger.debug("🗡️ Inimigo removido do nó %s. Recalculando caminho ótimo...", node_id)
             self.dynamic_recalculate_optimal_path()
     
     def dynamic_recalculate_optimal_path(self):
@@ -230,17 +262,17 @@ class World:
             self.optimal_path, self.optimal_distance = dijkstra(
                 self.graph, self.start_node, self.end_node
             )
-            print(f"🏃 Todos os inimigos derrotados! Caminho direto: {self.optimal_path}")
+            logger.debug("🏃 Todos os inimigos derrotados! Caminho direto: %s", self.optimal_path)
             return
         
         # Verificar se o caminho atual ainda é seguro
         current_enemies = self.count_enemies_in_path(self.optimal_path)
         
         if current_enemies >= 2:
-            print(f"⚠️ Caminho atual ainda tem {current_enemies} inimigos. Buscando alternativa...")
+            logger.info("⚠️ Caminho atual ainda tem %s inimigos. Buscando alternativa...", current_enemies)
             self._recalculate_optimal_path_avoiding_enemies()
         else:
-            print(f"✅ Caminho atual é seguro ({current_enemies} inimigos)")
+            logger.debug("✅ Caminho atual é seguro (%s inimigos)", current_enemies)
     
     def count_enemies_in_path(self, path):
         """Conta quantos inimigos existem no caminho especificado"""
@@ -300,24 +332,19 @@ class World:
             # Escolher o melhor caminho seguro (com no máximo 1 inimigo)
             for path, enemies_count, weight, score in path_scores:
                 if enemies_count <= 1:  # Caminho seguro encontrado
-                    print(f"🛡️ Caminho alternativo seguro encontrado:")
-                    print(f"   Caminho: {path}")
-                    print(f"   Inimigos: {enemies_count}")
-                    print(f"   Peso: {weight}")
-                    print(f"   Score: {score}")
+                    logger.debug("🛡️ Caminho alternativo seguro encontrado: %s (inimigos: %s, peso: %s, score: %s)",
+                                 path, enemies_count, weight, score)
                     return path, weight
             
             # Se não encontrou caminho seguro, pegar o menos perigoso
             if path_scores:
                 best_path, enemies_count, weight, score = path_scores[0]
-                print(f"⚠️ Nenhum caminho totalmente seguro. Usando o menos perigoso:")
-                print(f"   Caminho: {best_path}")
-                print(f"   Inimigos: {enemies_count}")
-                print(f"   Peso: {weight}")
+                logger.info("⚠️ Nenhum caminho totalmente seguro. Usando o menos perigoso: %s (inimigos: %s, peso: %s)",
+                            best_path, enemies_count, weight)
                 return best_path, weight
             
         except Exception as e:
-            print(f"❌ Erro ao buscar caminho alternativo: {e}")
+            logger.error("❌ Erro ao buscar caminho alternativo: %s", e)
         
         return None, None
     
@@ -328,10 +355,10 @@ class World:
         
         # Verificar se o caminho atual tem múltiplos inimigos
         current_enemies = self.count_enemies_in_path(self.optimal_path)
-        print(f"🔍 Caminho atual tem {current_enemies} inimigos: {self.optimal_path}")
+        logger.debug("🔍 Caminho atual tem %s inimigos: %s", current_enemies, self.optimal_path)
         
         if current_enemies >= 2:
-            print(f"⚠️ PERIGO: {current_enemies} inimigos no caminho ótimo! Recalculando...")
+            logger.info("⚠️ PERIGO: %s inimigos no caminho ótimo! Recalculando...", current_enemies)
             
             # Buscar caminho alternativo mais seguro
             safe_path, safe_distance = self.find_safe_alternative_path()
@@ -340,10 +367,10 @@ class World:
                 self.optimal_path = safe_path
                 self.optimal_distance = safe_distance
                 new_enemies = self.count_enemies_in_path(safe_path)
-                print(f"✅ Novo caminho ótimo (com {new_enemies} inimigos): {safe_path}")
-                print(f"📏 Nova distância ótima: {safe_distance}")
+                logger.debug("✅ Novo caminho ótimo (com %s inimigos): %s", new_enemies, safe_path)
+                logger.debug("📏 Nova distância ótima: %s", safe_distance)
             else:
-                print(f"❌ Não foi possível encontrar caminho alternativo mais seguro")
+                logger.info("❌ Não foi possível encontrar caminho alternativo mais seguro")
         
         try:
             # Método original como fallback
@@ -368,8 +395,8 @@ class World:
                     self.optimal_path = new_path
                     self.optimal_distance = new_distance
                     
-                    print(f"🛡️ Caminho ótimo recalculado (100% seguro): {new_path}")
-                    print(f"📏 Nova distância ótima: {new_distance}")
+                    logger.debug("🛡️ Caminho ótimo recalculado (100%% seguro): %s", new_path)
+                    logger.debug("📏 Nova distância ótima: %s", new_distance)
             
         except Exception as e:
-            print(f"❌ Erro ao recalcular caminho ótimo: {e}")
+            logger.error("❌ Erro ao recalcular caminho ótimo: %s", e)